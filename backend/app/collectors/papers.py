@@ -3,11 +3,48 @@ Research papers collector using Semantic Scholar API.
 Gathers publication metrics, citation data, and academic research trends for technology keywords.
 """
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+import asyncio
+import heapq
+from collections import Counter
+from operator import itemgetter
+import weakref
 import httpx
+import orjson
+from cachetools import TTLCache
 
 from app.collectors.base import BaseCollector
 from app.config import get_settings
+from app.utils.http import SharedClient, cached_fetch
+from app.utils.rate_limit import AIMDLimiter, TokenBucket, retry_delay
+
+# ((start, end), ...) for the 2y, 5y and 10y periods; start inclusive, end exclusive
+YearRanges = tuple[tuple[int, int], tuple[int, int], tuple[int, int]]
+
+# Research maturity thresholds (percentages are of papers with type info)
+_REVIEW_MATURE_PCT = 30.0          # Review share that alone marks a field as mature
+_MATURE_PUBS = 50                  # Publications above which a journal-heavy field counts as mature
+_JOURNAL_MATURE_PCT = 40.0         # Journal share required alongside _MATURE_PUBS
+_HIGH_CITATIONS = 20.0             # Avg 2y citations that, with _JOURNAL_IMPACT_PCT, marks maturity
+_JOURNAL_IMPACT_PCT = 30.0
+_CONFERENCE_EMERGING_PCT = 60.0    # Conference share that, below _CONFERENCE_EMERGING_PUBS, marks emergence
+_CONFERENCE_EMERGING_PUBS = 20
+_EMERGING_PUBS = 10                # Publications below which a low-citation field counts as emerging
+_LOW_CITATIONS = 5.0
+
+# Momentum / trend thresholds on per-year publication rates
+_ACCEL = 1.5                       # Growth ratio above which momentum is accelerating
+_DECEL = 0.5                       # Growth ratio below which momentum is decelerating
+_TREND = 0.3                       # Relative rate change beyond which the trend is increasing/decreasing
+
+# Research breadth thresholds (unique authors / venues per publication)
+_BROAD_AUTHOR_RATIO = 2.0
+_BROAD_VENUE_RATIO = 0.3
+_NARROW_AUTHOR_RATIO = 1.5
+_NARROW_VENUE_RATIO = 0.1
+
+# Pulls (review, journal, conference) percentages out of type_percentages in one call
+_maturity_type_pcts = itemgetter("review_percentage", "journalarticle_percentage", "conference_percentage")
 
 
 class PapersCollector(BaseCollector):
@@ -15,8 +52,123 @@ class PapersCollector(BaseCollector):
 
     API_URL = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
     TIMEOUT = 30.0
-
-    async def collect(self, keyword: str, expanded_terms: Optional[List[str]] = None) -> Dict[str, Any]:
+    CACHE_TTL_SECONDS = 3600
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRIES = 4  # Attempts per period request on transient failures (retryable status or timeout)
+    MAX_RETRY_DELAY = 60.0
+
+    # Fields requested per period. Every period feeds the author and paper type
+    # aggregates; only the 2y window needs title/year for top papers, and the
+    # 10y window does not contribute to venue diversity.
+    FIELDS_2Y = "title,year,citationCount,influentialCitationCount,authors,venue,publicationTypes"
+    FIELDS_5Y = "citationCount,influentialCitationCount,authors,venue,publicationTypes"
+    FIELDS_10Y = "citationCount,influentialCitationCount,authors,publicationTypes"
+
+    # Zero-value response returned when collection fails (see _error_response)
+    _ERROR_TEMPLATE = {
+        "source": "semantic_scholar",
+        "collected_at": "",
+        "keyword": "",
+        "publications_2y": 0,
+        "publications_5y": 0,
+        "publications_10y": 0,
+        "publications_total": 0,
+        "avg_citations_2y": 0.0,
+        "avg_citations_5y": 0.0,
+        "avg_citations_10y": 0.0,
+        "avg_influential_citations_2y": 0.0,
+        "avg_influential_citations_5y": 0.0,
+        "avg_influential_citations_10y": 0.0,
+        "citation_velocity": 0.0,
+        "author_diversity": 0,
+        "venue_diversity": 0,
+        "top_authors": [],
+        "paper_type_distribution": {
+            "type_counts": {"Review": 0, "JournalArticle": 0, "Conference": 0, "Book": 0, "Other": 0},
+            "type_percentages": {
+                "review_percentage": 0.0,
+                "journalarticle_percentage": 0.0,
+                "conference_percentage": 0.0,
+                "book_percentage": 0.0,
+                "other_percentage": 0.0
+            },
+            "papers_with_type_info": 0
+        },
+        "research_maturity": "unknown",
+        "research_maturity_reasoning": "Data collection failed - unable to assess research maturity",
+        "research_momentum": "unknown",
+        "research_trend": "unknown",
+        "research_breadth": "unknown",
+        "top_papers": []
+    }
+
+    # Publication types tracked individually in paper_type_distribution (others count as "Other")
+    PAPER_TYPES = ("Review", "JournalArticle", "Conference", "Book")
+
+    # Classifications the derivation produces when every period has zero publications
+    _EMPTY_OVERRIDES = {
+        "research_maturity": "emerging",
+        "research_maturity_reasoning": (
+            "Very limited publications (0) with low citations "
+            "(0.0 avg) indicates emerging research area in early stages."
+        ),
+        "research_momentum": "steady",
+        "research_trend": "stable",
+        "research_breadth": "narrow"
+    }
+
+    # Keys read from each paper. Papers stay raw decoded dicts end to end (see _request_period)
+    _PAPER_KEYS = (
+        "citationCount", "influentialCitationCount", "authors", "venue", "title", "year", "publicationTypes"
+    )
+
+    # Encoded once per field set; each request only merges in query and year
+    _BASE_PARAMS = {
+        fields: httpx.QueryParams({"fields": fields, "limit": 100})  # 100 is the maximum allowed per request
+        for fields in (FIELDS_2Y, FIELDS_5Y, FIELDS_10Y)
+    }
+
+    # Process-wide request pacing per Semantic Scholar tier: 1 req/s with an API key,
+    # 100 requests per 5 minutes without one (shared across instances and keywords).
+    # The unkeyed burst covers one keyword's three period requests and is taken out
+    # of the sustained rate, so no 5-minute window admits more than 100 requests
+    _rate_buckets = {
+        "keyed": TokenBucket(rate=1.0, capacity=1),
+        "unkeyed": TokenBucket(rate=(100 - 3) / 300, capacity=3)
+    }
+
+    # Process-wide Semantic Scholar client (see SharedClient), shared across instances
+    _http = SharedClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=50,
+            max_keepalive_connections=20,
+            keepalive_expiry=60.0
+        )
+    )
+
+    # Shared across instances (a new collector is created per analysis)
+    _response_cache: TTLCache = TTLCache(maxsize=4096, ttl=CACHE_TTL_SECONDS)
+    _cache_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def __init__(self):
+        """Initialize collector with request headers resolved once"""
+        settings = get_settings()
+        self._headers = (
+            {"x-api-key": settings.semantic_scholar_api_key}
+            if settings.semantic_scholar_api_key else {}
+        )
+        self._bucket = self._rate_buckets["keyed" if settings.semantic_scholar_api_key else "unkeyed"]
+
+    async def collect(
+        self,
+        keyword: str,
+        expanded_terms: Optional[List[str]] = None,
+        *,
+        year_ranges: Optional[YearRanges] = None,
+        collected_at: Optional[str] = None,
+        on_throttle: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any]:
         """
         Collect Semantic Scholar research paper data for the given keyword, optionally with expanded search terms.
 
@@ -29,6 +181,11 @@ class PapersCollector(BaseCollector):
         Args:
             keyword: Technology keyword to analyze
             expanded_terms: Optional list of related search terms for query expansion
+            year_ranges: Optional precomputed period boundaries from _year_ranges()
+                (collect_many computes them once per batch)
+            collected_at: Optional precomputed ISO timestamp for the result
+            on_throttle: Optional callback from collect_many(), called on each 429 so
+                the batch concurrency limit can shrink
 
         Returns:
             Dictionary containing:
@@ -45,186 +202,147 @@ class PapersCollector(BaseCollector):
                 - top_papers: Sample of highly cited papers
                 - errors: List of non-fatal errors encountered
         """
-        now = datetime.now()
-        collected_at = now.isoformat()
-        current_year = now.year
-
-        # Calculate year boundaries for time periods (non-overlapping)
-        # 2y: Recent papers (current_year - 2 to current_year - 1)
-        # 5y: Middle historical papers (current_year - 7 to current_year - 3)
-        # 10y: Oldest historical papers (current_year - 12 to current_year - 8)
-        year_2y_start = current_year - 2
-        year_2y_end = current_year - 1
-        year_5y_start = current_year - 7
-        year_5y_end = current_year - 3
-        year_10y_start = current_year - 12
-        year_10y_end = current_year - 8
+        if collected_at is None or year_ranges is None:
+            now = datetime.now()
+            collected_at = collected_at or now.isoformat()
+            year_ranges = year_ranges or self._year_ranges(now.year)
+
+        # Year filters (inclusive ranges, e.g., "2020-2023") and the query are
+        # built once per collect and shared by the three period requests
+        year_filters = tuple(f"{start}-{end - 1}" for start, end in year_ranges)
+        query_str = self._build_query(keyword, expanded_terms)
 
         errors = []
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                # Fetch data for each time period
-                data_2y = await self._fetch_period(
-                    client, keyword, year_2y_start, year_2y_end, errors, expanded_terms
-                )
-                data_5y = await self._fetch_period(
-                    client, keyword, year_5y_start, year_5y_end, errors, expanded_terms
-                )
-                data_10y = await self._fetch_period(
-                    client, keyword, year_10y_start, year_10y_end, errors, expanded_terms
-                )
+            client = await self._http.get()
+
+            # Fetch the three independent periods concurrently; errors is shared safely
+            # because the coroutines only interleave at await points on one event loop
+            data_2y, data_5y, data_10y = await asyncio.gather(
+                self._fetch_period(client, query_str, year_filters[0], self.FIELDS_2Y, errors, on_throttle),
+                self._fetch_period(client, query_str, year_filters[1], self.FIELDS_5Y, errors, on_throttle),
+                self._fetch_period(client, query_str, year_filters[2], self.FIELDS_10Y, errors, on_throttle)
+            )
 
-                # If all requests failed, return error state
-                if all(d is None for d in [data_2y, data_5y, data_10y]):
-                    return self._error_response(keyword, collected_at, "All API requests failed", errors)
-
-                # Extract publication counts
-                publications_2y = data_2y.get("total", 0) if data_2y else 0
-                publications_5y = data_5y.get("total", 0) if data_5y else 0
-                publications_10y = data_10y.get("total", 0) if data_10y else 0
-
-                # Calculate citation metrics for 2-year period
-                avg_citations_2y = 0.0
-                avg_influential_citations_2y = 0.0
-                top_papers = []
-
-                if data_2y and data_2y.get("data"):
-                    papers = data_2y.get("data", [])
-                    total_citations = sum(p.get("citationCount", 0) or 0 for p in papers)
-                    total_influential = sum(p.get("influentialCitationCount", 0) or 0 for p in papers)
-                    avg_citations_2y = total_citations / len(papers) if papers else 0.0
-                    avg_influential_citations_2y = total_influential / len(papers) if papers else 0.0
-
-                    # Extract top papers for LLM context (sort by citations)
-                    sorted_papers = sorted(
-                        papers,
-                        key=lambda p: p.get("citationCount", 0) or 0,
-                        reverse=True
-                    )
-                    for paper in sorted_papers[:5]:
-                        top_papers.append({
-                            "title": paper.get("title", ""),
-                            "year": paper.get("year"),
-                            "citations": paper.get("citationCount", 0) or 0,
-                            "influential_citations": paper.get("influentialCitationCount", 0) or 0,
-                            "authors": len(paper.get("authors", [])),
-                            "venue": paper.get("venue", "")
-                        })
-
-                # Calculate citation metrics for 5-year period
-                avg_citations_5y = 0.0
-                avg_influential_citations_5y = 0.0
-                author_diversity = 0
-                venue_diversity = 0
-
-                if data_5y and data_5y.get("data"):
-                    papers = data_5y.get("data", [])
-                    total_citations = sum(p.get("citationCount", 0) or 0 for p in papers)
-                    total_influential = sum(p.get("influentialCitationCount", 0) or 0 for p in papers)
-                    avg_citations_5y = total_citations / len(papers) if papers else 0.0
-                    avg_influential_citations_5y = total_influential / len(papers) if papers else 0.0
-
-                    # Calculate breadth indicators
-                    unique_authors = set()
-                    unique_venues = set()
-                    for paper in papers:
-                        for author in paper.get("authors", []):
-                            author_id = author.get("authorId")
-                            if author_id:
-                                unique_authors.add(author_id)
-                        venue = paper.get("venue", "")
-                        if venue:
-                            unique_venues.add(venue)
-                    author_diversity = len(unique_authors)
-                    venue_diversity = len(unique_venues)
-
-                # Calculate citation metrics for 10-year period
-                avg_citations_10y = 0.0
-                avg_influential_citations_10y = 0.0
-
-                if data_10y and data_10y.get("data"):
-                    papers = data_10y.get("data", [])
-                    total_citations = sum(p.get("citationCount", 0) or 0 for p in papers)
-                    total_influential = sum(p.get("influentialCitationCount", 0) or 0 for p in papers)
-                    avg_citations_10y = total_citations / len(papers) if papers else 0.0
-                    avg_influential_citations_10y = total_influential / len(papers) if papers else 0.0
-
-                # Aggregate all papers for paper type distribution analysis
-                all_papers = []
-                if data_2y and data_2y.get("data"):
-                    all_papers.extend(data_2y.get("data", []))
-                if data_5y and data_5y.get("data"):
-                    all_papers.extend(data_5y.get("data", []))
-                if data_10y and data_10y.get("data"):
-                    all_papers.extend(data_10y.get("data", []))
-
-                # Calculate paper type distribution
-                paper_type_distribution = self._calculate_paper_type_distribution(all_papers)
-
-                # Aggregate authors
-                top_authors = self._aggregate_authors(all_papers)
-
-                # Calculate derived insights
-                citation_velocity = self._calculate_citation_velocity(
-                    avg_citations_2y, avg_citations_5y
-                )
-                research_maturity, research_maturity_reasoning = self._calculate_research_maturity(
-                    publications_2y, publications_5y, publications_10y, avg_citations_2y, paper_type_distribution
-                )
-                research_momentum = self._calculate_research_momentum(
-                    publications_2y, publications_5y
-                )
-                research_trend = self._calculate_research_trend(
-                    publications_2y, publications_5y
-                )
-                research_breadth = self._calculate_research_breadth(
-                    author_diversity, venue_diversity, publications_2y + publications_5y
-                )
+            # If all requests failed, return error state
+            if all(d is None for d in [data_2y, data_5y, data_10y]):
+                return self._error_response(keyword, collected_at, "All API requests failed", errors)
+
+            # Extract publication counts
+            publications_2y = data_2y.get("total", 0) if data_2y else 0
+            publications_5y = data_5y.get("total", 0) if data_5y else 0
+            publications_10y = data_10y.get("total", 0) if data_10y else 0
+
+            # Nothing published in any period: skip aggregation and classification
+            if (
+                publications_2y == publications_5y == publications_10y == 0
+                and not any(d and d.get("data") for d in (data_2y, data_5y, data_10y))
+            ):
+                return self._empty_response(keyword, collected_at, errors)
+
+            # One pass per period computes citation sums, breadth counts and the
+            # author/type counters; counters are merged across periods below
+            summary_2y = self._summarize(data_2y.get("data") if data_2y else None, want_top=True)
+            summary_5y = self._summarize(data_5y.get("data") if data_5y else None, want_breadth=True)
+            summary_10y = self._summarize(data_10y.get("data") if data_10y else None)
+
+            # Calculate citation metrics per period
+            avg_citations_2y, avg_influential_citations_2y = self._averages(summary_2y)
+            avg_citations_5y, avg_influential_citations_5y = self._averages(summary_5y)
+            avg_citations_10y, avg_influential_citations_10y = self._averages(summary_10y)
+
+            # Extract top papers for LLM context (highest citations first)
+            top_papers = []
+            for paper in summary_2y["top_papers"]:
+                get = paper.get
+                top_papers.append({
+                    "title": get("title", ""),
+                    "year": get("year"),
+                    "citations": paper["citationCount"],
+                    "influential_citations": paper["influentialCitationCount"],
+                    "authors": len(get("authors") or ()),
+                    "venue": get("venue", "")
+                })
+
+            # Calculate breadth indicators (5-year period)
+            author_diversity = len(summary_5y["author_id_counts"])
+            venue_diversity = len(summary_5y["venue_counts"])
+
+            # Merge per-period counters (2y first, so ties keep first-seen order)
+            author_counts = summary_2y["author_counts"]
+            author_counts += summary_5y["author_counts"]
+            author_counts += summary_10y["author_counts"]
+            type_counts = summary_2y["type_counts"]
+            type_counts += summary_5y["type_counts"]
+            type_counts += summary_10y["type_counts"]
+            papers_with_types = (
+                summary_2y["papers_with_types"]
+                + summary_5y["papers_with_types"]
+                + summary_10y["papers_with_types"]
+            )
 
-                return {
-                    "source": "semantic_scholar",
-                    "collected_at": collected_at,
-                    "keyword": keyword,
-
-                    # Publication counts by time period
-                    "publications_2y": publications_2y,
-                    "publications_5y": publications_5y,
-                    "publications_10y": publications_10y,
-                    "publications_total": publications_2y + publications_5y + publications_10y,
-
-                    # Citation metrics
-                    "avg_citations_2y": round(avg_citations_2y, 2),
-                    "avg_citations_5y": round(avg_citations_5y, 2),
-                    "avg_citations_10y": round(avg_citations_10y, 2),
-                    "avg_influential_citations_2y": round(avg_influential_citations_2y, 2),
-                    "avg_influential_citations_5y": round(avg_influential_citations_5y, 2),
-                    "avg_influential_citations_10y": round(avg_influential_citations_10y, 2),
-                    "citation_velocity": round(citation_velocity, 3),
-
-                    # Research breadth indicators
-                    "author_diversity": author_diversity,
-                    "venue_diversity": venue_diversity,
-
-                    # Author metrics
-                    "top_authors": top_authors,
-
-                    # Paper type analysis
-                    "paper_type_distribution": paper_type_distribution,
-
-                    # Derived insights
-                    "research_maturity": research_maturity,
-                    "research_maturity_reasoning": research_maturity_reasoning,
-                    "research_momentum": research_momentum,
-                    "research_trend": research_trend,
-                    "research_breadth": research_breadth,
-
-                    # Context for LLM
-                    "top_papers": top_papers,
-
-                    # Error tracking
-                    "errors": errors
-                }
+            # Calculate paper type distribution
+            paper_type_distribution = self._calculate_paper_type_distribution(type_counts, papers_with_types)
+
+            # Aggregate authors
+            top_authors = self._aggregate_authors(author_counts)
+
+            # Calculate derived insights
+            citation_velocity = self._calculate_citation_velocity(
+                avg_citations_2y, avg_citations_5y
+            )
+            research_maturity, research_maturity_reasoning = self._calculate_research_maturity(
+                publications_2y, publications_5y, publications_10y, avg_citations_2y, paper_type_distribution
+            )
+            research_momentum, research_trend = self._classify_growth(publications_2y, publications_5y)
+            research_breadth = self._calculate_research_breadth(
+                author_diversity, venue_diversity, publications_2y + publications_5y
+            )
+
+            return {
+                "source": "semantic_scholar",
+                "collected_at": collected_at,
+                "keyword": keyword,
+
+                # Publication counts by time period
+                "publications_2y": publications_2y,
+                "publications_5y": publications_5y,
+                "publications_10y": publications_10y,
+                "publications_total": publications_2y + publications_5y + publications_10y,
+
+                # Citation metrics
+                "avg_citations_2y": round(avg_citations_2y, 2),
+                "avg_citations_5y": round(avg_citations_5y, 2),
+                "avg_citations_10y": round(avg_citations_10y, 2),
+                "avg_influential_citations_2y": round(avg_influential_citations_2y, 2),
+                "avg_influential_citations_5y": round(avg_influential_citations_5y, 2),
+                "avg_influential_citations_10y": round(avg_influential_citations_10y, 2),
+                "citation_velocity": round(citation_velocity, 3),
+
+                # Research breadth indicators
+                "author_diversity": author_diversity,
+                "venue_diversity": venue_diversity,
+
+                # Author metrics
+                "top_authors": top_authors,
+
+                # Paper type analysis
+                "paper_type_distribution": paper_type_distribution,
+
+                # Derived insights
+                "research_maturity": research_maturity,
+                "research_maturity_reasoning": research_maturity_reasoning,
+                "research_momentum": research_momentum,
+                "research_trend": research_trend,
+                "research_breadth": research_breadth,
+
+                # Context for LLM
+                "top_papers": top_papers,
+
+                # Error tracking
+                "errors": errors
+            }
 
         except Exception as e:
             return self._error_response(
@@ -234,91 +352,352 @@ class PapersCollector(BaseCollector):
                 errors
             )
 
+    async def collect_many(
+        self,
+        keywords: List[str],
+        concurrency: int = 16,
+        initial_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect Semantic Scholar data for several keywords concurrently.
+
+        Keyword collections overlap their API latency under an adaptive (AIMD)
+        limit: it starts at initial_concurrency, grows by one per keyword that
+        completes without being rate limited, and halves whenever the API
+        answers 429. All workers share the module-level client and its
+        keep-alive pool. The batch is dominated by event loop callbacks
+        (socket reads, TLS, timers), so running under uvloop (uvicorn's
+        default on POSIX when installed) noticeably lowers its CPU cost.
+
+        Args:
+            keywords: Technology keywords to analyze
+            concurrency: Maximum number of keywords collected at once
+            initial_concurrency: Number of keywords collected at once before any feedback
+
+        Returns:
+            List of collect() results in the same order as keywords; a keyword
+            whose collection raised gets an error response instead of failing
+            the whole batch
+        """
+        # Owned by this call, so overlapping batches on one collector each adapt to their own 429s
+        limiter = AIMDLimiter(initial=min(initial_concurrency, concurrency), maximum=concurrency)
+
+        # Every keyword in the batch shares one timestamp and one set of period boundaries
+        now = datetime.now()
+        collected_at = now.isoformat()
+        year_ranges = self._year_ranges(now.year)
+
+        async def _collect_one(keyword: str) -> Dict[str, Any]:
+            throttled = False
+
+            def on_throttle() -> None:
+                # One multiplicative decrease per keyword, however many of its
+                # period requests and retries were answered with 429
+                nonlocal throttled
+                if not throttled:
+                    throttled = True
+                    limiter.on_throttle()
+
+            async with limiter:
+                result = await self.collect(
+                    keyword, year_ranges=year_ranges, collected_at=collected_at, on_throttle=on_throttle
+                )
+            if not throttled:
+                limiter.on_success()
+            return result
+
+        results = await asyncio.gather(
+            *[_collect_one(keyword) for keyword in keywords],
+            return_exceptions=True
+        )
+
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                results[i] = self._error_response(
+                    keywords[i], collected_at, f"Unexpected error: {str(result)}", []
+                )
+            elif isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _year_ranges(self, current_year: int) -> YearRanges:
+        """
+        Calculate year boundaries for time periods (non-overlapping).
+
+        2y: Recent papers (current_year - 2 to current_year - 1)
+        5y: Middle historical papers (current_year - 7 to current_year - 3)
+        10y: Oldest historical papers (current_year - 12 to current_year - 8)
+
+        Args:
+            current_year: Year the collection runs in
+
+        Returns:
+            ((start, end), ...) for the 2y, 5y and 10y periods; start inclusive, end exclusive
+        """
+        return (
+            (current_year - 2, current_year - 1),
+            (current_year - 7, current_year - 3),
+            (current_year - 12, current_year - 8)
+        )
+
+    def _build_query(self, keyword: str, expanded_terms: Optional[List[str]] = None) -> str:
+        """
+        Build the Semantic Scholar query string for a keyword.
+
+        When expanded_terms is provided, constructs Boolean OR query with all terms.
+        Expanded terms are sorted (case-insensitively) so the same expansion always
+        yields the same query, which keeps response cache keys stable.
+
+        Args:
+            keyword: Search term
+            expanded_terms: Optional list of related search terms
+
+        Returns:
+            Query string with each term as a quoted exact phrase
+        """
+        # Semantic Scholar uses | for OR operator
+        if expanded_terms:
+            # Construct: "keyword" | "term1" | "term2" ...
+            terms = sorted(expanded_terms, key=str.lower)
+            return " | ".join([f'"{keyword}"', *(f'"{term}"' for term in terms)])
+
+        # Original behavior: exact phrase matching with quotes
+        return f'"{keyword}"'
+
     async def _fetch_period(
         self,
         client: httpx.AsyncClient,
-        keyword: str,
-        year_start: int,
-        year_end: int,
+        query_str: str,
+        year_filter: str,
+        fields: str,
         errors: List[str],
-        expanded_terms: Optional[List[str]] = None
+        on_throttle: Optional[Callable[[], None]] = None
     ) -> Dict[str, Any] | None:
         """
-        Fetch Semantic Scholar data for a specific time period.
+        Fetch Semantic Scholar data for a specific time period, using the response cache.
 
-        When expanded_terms is provided, constructs Boolean OR query with all terms.
+        Successful responses are cached per (query, period) for CACHE_TTL_SECONDS;
+        the query is lowercased for the key since search is case-insensitive.
+        Concurrent misses for the same key wait on a shared lock so only one
+        request reaches the API.
 
         Args:
             client: Async HTTP client
-            keyword: Search term
-            year_start: Start year (inclusive)
-            year_end: End year (exclusive)
+            query_str: Query built by _build_query()
+            year_filter: Inclusive year range (e.g., "2020-2023")
+            fields: Comma-separated Semantic Scholar fields to request
             errors: List to append error messages to
-            expanded_terms: Optional list of related search terms
+            on_throttle: Optional callback invoked when the API answers 429
 
         Returns:
             API response dict or None if request failed
         """
-        try:
-            # Build year filter (e.g., "2020-2023")
-            year_filter = f"{year_start}-{year_end - 1}"
-
-            # Request fields we need from the API
-            fields = "paperId,title,year,citationCount,influentialCitationCount,authors,venue,publicationTypes"
-
-            # Prepare headers with API key if configured
-            settings = get_settings()
-            headers = {}
-            if settings.semantic_scholar_api_key:
-                headers["x-api-key"] = settings.semantic_scholar_api_key
-
-            # Build query with OR expansion if expanded_terms provided
-            # Semantic Scholar uses | for OR operator
-            if expanded_terms:
-                # Construct: "keyword" | "term1" | "term2" ...
-                query_parts = [f'"{keyword}"'] + [f'"{term}"' for term in expanded_terms]
-                query_str = " | ".join(query_parts)
-            else:
-                # Original behavior: exact phrase matching with quotes
-                query_str = f'"{keyword}"'
-
-            # Make request to Semantic Scholar API
-            response = await client.get(
-                self.API_URL,
-                params={
-                    "query": query_str,
-                    "year": year_filter,
-                    "fields": fields,
-                    "limit": 100  # Maximum allowed per request
-                },
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
+        return await cached_fetch(
+            self._response_cache,
+            self._cache_locks,
+            (query_str.lower(), year_filter),
+            lambda: self._request_period(client, query_str, year_filter, fields, errors, on_throttle)
+        )
+
+    async def _request_period(
+        self,
+        client: httpx.AsyncClient,
+        query_str: str,
+        year_filter: str,
+        fields: str,
+        errors: List[str],
+        on_throttle: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any] | None:
+        """
+        Request Semantic Scholar data for a specific time period (uncached).
 
-            # API returns {"total": int, "offset": int, "next": int, "data": [papers]}
-            return data
+        Args:
+            client: Async HTTP client
+            query_str: Query built by _build_query()
+            year_filter: Inclusive year range (e.g., "2020-2023")
+            fields: Comma-separated Semantic Scholar fields to request
+            errors: List to append error messages to
+            on_throttle: Optional callback invoked when the API answers 429
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                errors.append("Rate limited")
-            elif e.response.status_code == 400:
-                errors.append("Invalid query parameters")
-            else:
-                errors.append(f"HTTP {e.response.status_code}")
-            return None
+        Returns:
+            API response dict or None if request failed
+        """
+        base_params = self._BASE_PARAMS.get(fields) or httpx.QueryParams({"fields": fields, "limit": 100})
+        params = base_params.merge({"query": query_str, "year": year_filter})
+
+        for attempt in range(self.MAX_RETRIES):
+            is_last_attempt = attempt == self.MAX_RETRIES - 1
+            try:
+                # Wait for our tier's rate budget instead of discovering the limit via 429
+                await self._bucket.acquire()
+
+                # Make request to Semantic Scholar API
+                response = await client.get(self.API_URL, params=params, headers=self._headers)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                self._normalize_counts(data.get("data") or ())
+
+                # API returns {"total": int, "offset": int, "next": int, "data": [papers]}
+                # Returns the raw dict; do not wrap papers in pydantic models here. Per-paper
+                # validation would multiply aggregation CPU. Citation counts are normalized
+                # above; consumers read the other _PAPER_KEYS with .get() and tolerate
+                # missing or null values.
+                return data
+
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code == 429 and on_throttle is not None:
+                    on_throttle()
+
+                # Rate limits and gateway/server errors are usually transient: back off and retry
+                if status_code in self.RETRY_STATUSES and not is_last_attempt:
+                    delay = retry_delay(attempt, self.MAX_RETRY_DELAY, e.response.headers.get("Retry-After"))
+                    await asyncio.sleep(delay)
+                    continue
+
+                if status_code == 429:
+                    errors.append("Rate limited")
+                elif status_code == 400:
+                    errors.append("Invalid query parameters")
+                else:
+                    errors.append(f"HTTP {status_code}")
+                return None
+
+            except httpx.TimeoutException:
+                if not is_last_attempt:
+                    await asyncio.sleep(retry_delay(attempt, self.MAX_RETRY_DELAY))
+                    continue
+                errors.append("Request timeout")
+                return None
+
+            except httpx.RequestError as e:
+                # Dropped or refused connections are usually transient as well
+                if not is_last_attempt:
+                    await asyncio.sleep(retry_delay(attempt, self.MAX_RETRY_DELAY))
+                    continue
+                errors.append(f"Network error: {type(e).__name__}")
+                return None
+
+            except Exception as e:
+                errors.append(f"Unexpected error in fetch: {str(e)}")
+                return None
+
+        return None
+
+    def _normalize_counts(self, papers: List[Dict]) -> None:
+        """
+        Replace missing or null citation counts with 0, in place.
 
-        except httpx.TimeoutException:
-            errors.append("Request timeout")
-            return None
+        Runs once per API response (before caching), so the aggregation
+        passes can index the counts directly instead of coalescing per read.
 
-        except httpx.RequestError as e:
-            errors.append(f"Network error: {type(e).__name__}")
-            return None
+        Args:
+            papers: Raw paper dicts from a Semantic Scholar response
+        """
+        for paper in papers:
+            paper["citationCount"] = paper.get("citationCount") or 0
+            paper["influentialCitationCount"] = paper.get("influentialCitationCount") or 0
 
-        except Exception as e:
-            errors.append(f"Unexpected error in fetch: {str(e)}")
-            return None
+    def _summarize(
+        self,
+        papers: Optional[List[Dict]],
+        want_top: bool = False,
+        want_breadth: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Summarize one period's papers in a single pass.
+
+        Args:
+            papers: List of papers from one time period (None or empty if the period failed)
+            want_top: Collect the 5 most cited papers
+            want_breadth: Count papers per author ID and venue
+
+        Returns:
+            Dictionary containing:
+                - n: Number of papers summarized
+                - total_citations, total_influential: Citation sums
+                - top_papers: Up to 5 most cited papers (highest first), if want_top
+                - author_id_counts, venue_counts: Papers per author ID / venue, if want_breadth
+                - author_counts: Counter of author names
+                - type_counts: Counter of raw publication types
+                - papers_with_types: Papers that reported at least one publication type
+        """
+        papers = papers or []
+        total_citations = 0
+        total_influential = 0
+        papers_with_types = 0
+        author_counts = Counter()
+        type_counts = Counter()
+        author_id_counts = Counter()
+        venue_counts = Counter()
+        top_heap: List[tuple[int, int, Dict]] = []
+
+        for idx, paper in enumerate(papers):
+            # Counts were normalized to ints by _normalize_counts at ingress
+            get = paper.get
+            citations = paper["citationCount"]
+            total_citations += citations
+            total_influential += paper["influentialCitationCount"]
+
+            if want_top:
+                # Size-5 min-heap keeps the most cited papers during this pass;
+                # -idx breaks ties in favour of earlier papers (like a stable sort)
+                # and keeps the paper dicts themselves from being compared
+                entry = (citations, -idx, paper)
+                if len(top_heap) < 5:
+                    heapq.heappush(top_heap, entry)
+                elif entry > top_heap[0]:
+                    heapq.heapreplace(top_heap, entry)
+
+            # One walk over the author list feeds both top authors and breadth
+            for author in get("authors") or ():
+                name = author.get("name")
+                if name:
+                    author_counts[name] += 1
+                if want_breadth:
+                    author_id = author.get("authorId")
+                    if author_id:
+                        author_id_counts[author_id] += 1
+
+            pub_types = get("publicationTypes")
+            if pub_types:
+                # A paper can have multiple types, count each
+                papers_with_types += 1
+                type_counts.update(pub_types)
+
+            if want_breadth:
+                venue = get("venue")
+                if venue:
+                    venue_counts[venue] += 1
+
+        top_papers = [paper for _, _, paper in sorted(top_heap, reverse=True)]
+
+        return {
+            "n": len(papers),
+            "total_citations": total_citations,
+            "total_influential": total_influential,
+            "top_papers": top_papers,
+            "author_id_counts": author_id_counts,
+            "venue_counts": venue_counts,
+            "author_counts": author_counts,
+            "type_counts": type_counts,
+            "papers_with_types": papers_with_types
+        }
+
+    def _averages(self, summary: Dict[str, Any]) -> tuple[float, float]:
+        """
+        Calculate average citations and influential citations for a period summary.
+
+        Args:
+            summary: Result of _summarize()
+
+        Returns:
+            Tuple of (avg_citations, avg_influential_citations), zeros when there are no papers
+        """
+        n = summary["n"]
+        if not n:
+            return 0.0, 0.0
+        return summary["total_citations"] / n, summary["total_influential"] / n
 
     def _calculate_citation_velocity(self, avg_citations_2y: float, avg_citations_5y: float) -> float:
         """
@@ -362,39 +741,40 @@ class PapersCollector(BaseCollector):
             Tuple of (maturity_level, reasoning_string)
         """
         total_publications = publications_2y + publications_5y + publications_10y
-        type_percentages = paper_type_distribution.get("type_percentages", {})
+        type_percentages = paper_type_distribution.get("type_percentages") or {}
 
         # Extract key paper type percentages
-        review_pct = type_percentages.get("review_percentage", 0.0)
-        journal_pct = type_percentages.get("journalarticle_percentage", 0.0)
-        conference_pct = type_percentages.get("conference_percentage", 0.0)
+        if type_percentages:
+            review_pct, journal_pct, conference_pct = _maturity_type_pcts(type_percentages)
+        else:
+            review_pct = journal_pct = conference_pct = 0.0
 
         # Type-aware maturity classification
         # Mature indicators: high review papers (>30%) OR high journal articles with substantial publications
-        if review_pct > 30:
+        if review_pct > _REVIEW_MATURE_PCT:
             return ("mature",
                     f"High review paper percentage ({review_pct:.1f}%) indicates established field "
                     f"with comprehensive synthesis literature. Total {total_publications} publications "
                     f"with {avg_citations_2y:.1f} avg citations.")
 
-        if total_publications > 50 and journal_pct > 40:
+        if total_publications > _MATURE_PUBS and journal_pct > _JOURNAL_MATURE_PCT:
             return ("mature",
                     f"Substantial publication volume ({total_publications} papers) dominated by "
                     f"journal articles ({journal_pct:.1f}%) with {avg_citations_2y:.1f} avg citations "
                     f"indicates mature research field.")
 
-        if avg_citations_2y > 20 and journal_pct > 30:
+        if avg_citations_2y > _HIGH_CITATIONS and journal_pct > _JOURNAL_IMPACT_PCT:
             return ("mature",
                     f"High citation rate ({avg_citations_2y:.1f} avg) with journal dominance "
                     f"({journal_pct:.1f}%) indicates mature, impactful research field.")
 
         # Emerging indicators: high conference papers (>60%) OR very few publications with low citations
-        if conference_pct > 60 and total_publications < 20:
+        if conference_pct > _CONFERENCE_EMERGING_PCT and total_publications < _CONFERENCE_EMERGING_PUBS:
             return ("emerging",
                     f"Conference paper dominance ({conference_pct:.1f}%) with limited publications "
                     f"({total_publications}) indicates early-stage research with rapid dissemination focus.")
 
-        if total_publications < 10 and avg_citations_2y < 5:
+        if total_publications < _EMERGING_PUBS and avg_citations_2y < _LOW_CITATIONS:
             return ("emerging",
                     f"Very limited publications ({total_publications}) with low citations "
                     f"({avg_citations_2y:.1f} avg) indicates emerging research area in early stages.")
@@ -405,71 +785,51 @@ class PapersCollector(BaseCollector):
                 f"(conference: {conference_pct:.1f}%, journal: {journal_pct:.1f}%, review: {review_pct:.1f}%) "
                 f"and {avg_citations_2y:.1f} avg citations indicates developing research field in transition.")
 
-    def _calculate_research_momentum(self, publications_2y: int, publications_5y: int) -> str:
+    def _classify_growth(self, publications_2y: int, publications_5y: int) -> tuple[str, str]:
         """
-        Calculate research momentum by comparing publication rates across periods.
+        Classify research momentum and trend from one comparison of publication rates.
+
+        Both labels compare the recent and historical per-year rates; they only
+        differ in thresholds, so the rates and the no-history edge case are
+        handled once.
 
         Args:
             publications_2y: Publications in last 2 years
             publications_5y: Publications in prior 5 years
 
         Returns:
-            "accelerating", "steady", or "decelerating"
+            Tuple of (momentum, trend): momentum is "accelerating", "steady", or
+            "decelerating"; trend is "increasing", "stable", or "decreasing"
         """
         # Calculate publication rate per year for each period
-        recent_rate = publications_2y / 2.0  # Per year in 2-year period
-        historical_rate = publications_5y / 5.0  # Per year in 5-year period
+        recent_rate = publications_2y / 2.0
+        historical_rate = publications_5y / 5.0
 
         # Handle edge case: no historical data
         if historical_rate == 0:
-            return "steady" if recent_rate == 0 else "accelerating"
+            if recent_rate == 0:
+                return "steady", "stable"
+            return "accelerating", "increasing"
 
-        # Calculate growth ratio
+        # Momentum: recent rate >50% higher / <50% of historical, otherwise steady
         growth_ratio = recent_rate / historical_rate
+        if growth_ratio > _ACCEL:
+            momentum = "accelerating"
+        elif growth_ratio < _DECEL:
+            momentum = "decelerating"
+        else:
+            momentum = "steady"
 
-        # Accelerating: Recent rate >50% higher
-        if growth_ratio > 1.5:
-            return "accelerating"
-
-        # Decelerating: Recent rate <50% of historical
-        if growth_ratio < 0.5:
-            return "decelerating"
-
-        # Steady: Within 50% range
-        return "steady"
-
-    def _calculate_research_trend(self, publications_2y: int, publications_5y: int) -> str:
-        """
-        Calculate research trend direction.
-
-        Args:
-            publications_2y: Publications in last 2 years
-            publications_5y: Publications in prior 5 years
-
-        Returns:
-            "increasing", "stable", or "decreasing"
-        """
-        # Calculate per-year rates
-        recent_rate = publications_2y / 2.0
-        historical_rate = publications_5y / 5.0
-
-        # Handle edge case
-        if historical_rate == 0:
-            return "stable" if recent_rate == 0 else "increasing"
-
-        # Calculate percentage difference
+        # Trend: recent rate more than 30% higher / lower, otherwise stable
         diff_ratio = (recent_rate - historical_rate) / historical_rate
+        if diff_ratio > _TREND:
+            trend = "increasing"
+        elif diff_ratio < -_TREND:
+            trend = "decreasing"
+        else:
+            trend = "stable"
 
-        # Increasing: Recent rate >30% higher
-        if diff_ratio > 0.3:
-            return "increasing"
-
-        # Decreasing: Recent rate >30% lower
-        if diff_ratio < -0.3:
-            return "decreasing"
-
-        # Stable: Within 30% range
-        return "stable"
+        return momentum, trend
 
     def _calculate_research_breadth(
         self, author_diversity: int, venue_diversity: int, total_publications: int
@@ -490,99 +850,97 @@ class PapersCollector(BaseCollector):
             return "narrow"
 
         # Calculate diversity ratios (how many unique authors/venues per paper)
-        author_ratio = author_diversity / total_publications if total_publications > 0 else 0
-        venue_ratio = venue_diversity / total_publications if total_publications > 0 else 0
+        author_ratio = author_diversity / total_publications
+        venue_ratio = venue_diversity / total_publications
 
         # Broad: High diversity (many unique authors and venues)
         # Typically >2 authors per paper and >0.3 venues per paper suggests broad research
-        if author_ratio > 2.0 and venue_ratio > 0.3:
+        if author_ratio > _BROAD_AUTHOR_RATIO and venue_ratio > _BROAD_VENUE_RATIO:
             return "broad"
 
         # Narrow: Low diversity (few unique authors or venues)
         # <1.5 authors per paper or <0.1 venues per paper suggests narrow research
-        if author_ratio < 1.5 or venue_ratio < 0.1:
+        if author_ratio < _NARROW_AUTHOR_RATIO or venue_ratio < _NARROW_VENUE_RATIO:
             return "narrow"
 
         # Moderate: Everything in between
         return "moderate"
 
-    def _calculate_paper_type_distribution(self, all_papers: List[Dict]) -> Dict[str, Any]:
+    def _calculate_paper_type_distribution(
+        self, type_counts: Counter, papers_with_types: int
+    ) -> Dict[str, Any]:
         """
         Analyze distribution of paper types across all papers.
 
         Args:
-            all_papers: List of all papers from all time periods
+            type_counts: Counter of raw publication types merged across all time periods
+            papers_with_types: Number of papers that reported at least one type
 
         Returns:
             Dictionary with type_counts, type_percentages, and papers_with_type_info
         """
-        type_counts = {
-            "Review": 0,
-            "JournalArticle": 0,
-            "Conference": 0,
-            "Book": 0,
-            "Other": 0
-        }
-
-        total_with_types = 0
-        for paper in all_papers:
-            pub_types = paper.get("publicationTypes", [])
-            if pub_types:
-                total_with_types += 1
-                # A paper can have multiple types, count each
-                for pub_type in pub_types:
-                    if pub_type in type_counts:
-                        type_counts[pub_type] += 1
-                    else:
-                        type_counts["Other"] += 1
+        # Known types keep their own bucket; anything else is folded into "Other"
+        known = {name: type_counts[name] for name in self.PAPER_TYPES}
+        known["Other"] = sum(type_counts.values()) - sum(known.values())
 
         # Calculate percentages
         type_percentages = {}
-        if total_with_types > 0:
-            for type_name, count in type_counts.items():
+        if papers_with_types > 0:
+            for type_name, count in known.items():
                 type_percentages[f"{type_name.lower()}_percentage"] = round(
-                    (count / total_with_types) * 100, 1
+                    (count / papers_with_types) * 100, 1
                 )
         else:
             # No type data available - set all to 0
-            for type_name in type_counts.keys():
+            for type_name in known.keys():
                 type_percentages[f"{type_name.lower()}_percentage"] = 0.0
 
         return {
-            "type_counts": type_counts,
+            "type_counts": known,
             "type_percentages": type_percentages,
-            "papers_with_type_info": total_with_types
+            "papers_with_type_info": papers_with_types
         }
 
-    def _aggregate_authors(self, all_papers: List[Dict]) -> List[Dict[str, Any]]:
+    def _aggregate_authors(self, author_counts: Counter) -> List[Dict[str, Any]]:
         """
-        Aggregate authors across all papers and return top 10 by publication count.
+        Return the top 10 authors by publication count.
 
         Args:
-            all_papers: List of all papers from all time periods
+            author_counts: Counter of author names merged across all time periods
 
         Returns:
             List of top 10 authors with publication counts
         """
-        author_counts = {}
-        for paper in all_papers:
-            authors = paper.get("authors", [])
-            for author in authors:
-                name = author.get("name", "")
-                if name:
-                    author_counts[name] = author_counts.get(name, 0) + 1
-
-        # Sort by count and return top 10
-        top_authors = [
+        # Partial selection of the top 10 (ties keep first-seen order, like a stable sort)
+        return [
             {"name": name, "publication_count": count}
-            for name, count in sorted(
-                author_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            for name, count in heapq.nlargest(10, author_counts.items(), key=lambda x: x[1])
         ]
 
-        return top_authors
+    def _empty_response(
+        self,
+        keyword: str,
+        collected_at: str,
+        errors: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Return the response for a keyword with no publications in any period.
+
+        Equivalent to running the full derivation on zero data, but skips the
+        aggregation and classifier calls (common for long-tail keywords).
+
+        Args:
+            keyword: Search term
+            collected_at: ISO timestamp
+            errors: List of non-fatal errors encountered
+
+        Returns:
+            Response dict with zero metrics and the zero-data classifications
+        """
+        response = self._error_response(keyword, collected_at, "", errors)
+        response.update(self._EMPTY_OVERRIDES)
+        response["errors"] = errors
+        return response
 
     def _error_response(
         self,
@@ -603,40 +961,21 @@ class PapersCollector(BaseCollector):
         Returns:
             Minimal valid response dict with error indicators
         """
+        template = self._ERROR_TEMPLATE
+        type_distribution = template["paper_type_distribution"]
+
+        # Shallow-merge the shared template; nested containers are copied so
+        # callers can never mutate the class-level constant
         return {
-            "source": "semantic_scholar",
+            **template,
             "collected_at": collected_at,
             "keyword": keyword,
-            "publications_2y": 0,
-            "publications_5y": 0,
-            "publications_10y": 0,
-            "publications_total": 0,
-            "avg_citations_2y": 0.0,
-            "avg_citations_5y": 0.0,
-            "avg_citations_10y": 0.0,
-            "avg_influential_citations_2y": 0.0,
-            "avg_influential_citations_5y": 0.0,
-            "avg_influential_citations_10y": 0.0,
-            "citation_velocity": 0.0,
-            "author_diversity": 0,
-            "venue_diversity": 0,
             "top_authors": [],
             "paper_type_distribution": {
-                "type_counts": {"Review": 0, "JournalArticle": 0, "Conference": 0, "Book": 0, "Other": 0},
-                "type_percentages": {
-                    "review_percentage": 0.0,
-                    "journalarticle_percentage": 0.0,
-                    "conference_percentage": 0.0,
-                    "book_percentage": 0.0,
-                    "other_percentage": 0.0
-                },
+                "type_counts": dict(type_distribution["type_counts"]),
+                "type_percentages": dict(type_distribution["type_percentages"]),
                 "papers_with_type_info": 0
             },
-            "research_maturity": "unknown",
-            "research_maturity_reasoning": "Data collection failed - unable to assess research maturity",
-            "research_momentum": "unknown",
-            "research_trend": "unknown",
-            "research_breadth": "unknown",
             "top_papers": [],
             "errors": errors + [error_msg]
         }
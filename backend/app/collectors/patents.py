@@ -4,13 +4,265 @@ Gathers patent filing signals, assignee diversity, geographical distribution,
 and innovation velocity metrics for technology keywords.
 """
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from urllib.parse import quote
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import heapq
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+import re
+import time
+import weakref
 import httpx
-import json
+import orjson
+from cachetools import TLRUCache
 
 from app.collectors.base import BaseCollector
 from app.config import get_settings
+from app.utils.http import SharedClient, cached_fetch
+from app.utils.rate_limit import TokenBucket, retry_delay
+
+# Citation count field; converted to int (or None if unparseable) when a response arrives
+_CITATIONS_FIELD = "patent_num_times_cited_by_us_patents"
+
+def _to_int(value: Any) -> Optional[int]:
+    """
+    Convert a citation count to int without raising.
+
+    JSON numbers and digit strings (the common cases) take a fast path that
+    avoids exception handling; other values fall back to int() with a guard.
+
+    Args:
+        value: Raw citation count from the API
+
+    Returns:
+        The count as int, 0 for None, or None if it cannot be parsed
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return 0
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Assignee classification patterns (matched against the lowercased organization name).
+# Each keyword group is compiled into one regex alternation at import, so an
+# org name is scanned once per group instead of once per keyword.
+_UNIVERSITY_KEYWORDS = (
+    "university", "universit",  # International variations (université, università, etc.)
+    " state",  # Space prefix to avoid matching "estate", "restate", etc.
+    " tech ",  # Space-bounded to avoid "technology", "technical"
+)  # "college" is checked separately because "college of" is excluded
+# Matched as whole words, so a set lookup per word instead of a scan per abbreviation
+_UNIVERSITY_ABBREVIATIONS = frozenset({"mit", "caltech", "eth", "epfl", "cmu", "ucla", "ucb", "nyu"})
+_INSTITUTE_KEYWORDS = (
+    "institute", "institut",  # International variations
+    "research center", "research centre",
+    "laboratory", "laborator",  # Catches "laboratories"
+    "national lab",  # "Sandia National Laboratories"
+    "max planck",  # Max Planck Institute
+    "fraunhofer",  # Fraunhofer Society
+    "cnrs",  # French National Centre for Scientific Research
+    "nist",  # National Institute of Standards and Technology
+)
+_CORPORATE_RESEARCH_EXCEPTIONS = (
+    "ibm research", "microsoft research", "google research", "amazon research",
+    "facebook research", "meta research", "apple research", "intel research"
+)
+_UNIVERSITY_PATTERN = re.compile("|".join(map(re.escape, _UNIVERSITY_KEYWORDS)))
+_INSTITUTE_PATTERN = re.compile("|".join(map(re.escape, _INSTITUTE_KEYWORDS)))
+_CORPORATE_RESEARCH_PATTERN = re.compile("|".join(map(re.escape, _CORPORATE_RESEARCH_EXCEPTIONS)))
+
+# Response cache TTLs: older windows are effectively closed and change rarely
+_TTL_2Y = 3600
+_TTL_5Y = 7 * 24 * 3600
+_TTL_10Y = 30 * 24 * 3600
+
+# Every cached response holds a full page (_OPTIONS size) of patents, so the fresh
+# cache is sized by keywords (three periods each) rather than by raw entry count
+_CACHED_KEYWORDS = 64
+
+
+def _response_ttu(key: tuple, value: Dict[str, Any], now: float) -> float:
+    """Expiry time for a cached period response, based on how old its window is"""
+    years_ago = time.localtime().tm_year - key[-1]
+    if years_ago <= 1:
+        return now + _TTL_2Y
+    if years_ago <= 3:
+        return now + _TTL_5Y
+    return now + _TTL_10Y
+
+
+# Stale fallbacks outlive the fresh entry by a day and cover only the most recent
+# keywords (three periods each), since every entry holds a full page of patents
+_STALE_GRACE = 24 * 3600
+_STALE_KEYWORDS = 32
+
+
+def _stale_ttu(key: tuple, value: Dict[str, Any], now: float) -> float:
+    """Expiry time for a stale fallback response: its fresh expiry plus _STALE_GRACE"""
+    return _response_ttu(key, value, now) + _STALE_GRACE
+
+
+# Derived metrics depend only on a few numbers, so they are pure module functions;
+# the filing stats are memoized since batch runs often see the same period counts
+@lru_cache(maxsize=1024)
+def _filing_stats(patents_2y: int, patents_5y: int) -> Tuple[float, str, str]:
+    """
+    Calculate filing velocity, momentum and trend from one pair of filing rates.
+
+    All three compare the recent (2y) and historical (5y) per-year filing rates,
+    so they are derived together instead of recomputing the rates three times.
+
+    Args:
+        patents_2y: Patents in last 2 years
+        patents_5y: Patents in prior 5 years
+
+    Returns:
+        Tuple of (filing velocity, "accelerating"/"steady"/"decelerating",
+        "increasing"/"stable"/"decreasing")
+    """
+    # Calculate per-year rates
+    recent_rate = patents_2y / 2.0
+    historical_rate = patents_5y / 5.0
+
+    # Handle edge case: no historical data
+    if historical_rate == 0:
+        if recent_rate == 0:
+            return 0.0, "steady", "stable"
+        return 1.0, "accelerating", "increasing"
+
+    # Velocity and trend use the growth rate, momentum the growth ratio
+    velocity = (recent_rate - historical_rate) / historical_rate
+    growth_ratio = recent_rate / historical_rate
+
+    # Accelerating: Recent rate >50% higher; decelerating: <50% of historical
+    if growth_ratio > 1.5:
+        momentum = "accelerating"
+    elif growth_ratio < 0.5:
+        momentum = "decelerating"
+    else:
+        momentum = "steady"
+
+    # Increasing: Recent rate >30% higher; decreasing: >30% lower
+    if velocity > 0.3:
+        trend = "increasing"
+    elif velocity < -0.3:
+        trend = "decreasing"
+    else:
+        trend = "stable"
+
+    return velocity, momentum, trend
+
+
+def _patent_maturity(total_patents: int, avg_citations_2y: float) -> str:
+    """
+    Calculate patent maturity level.
+
+    Args:
+        total_patents: Total number of patents
+        avg_citations_2y: Average citations for recent patents
+
+    Returns:
+        "emerging", "developing", or "mature"
+    """
+    # Mature: High patent count (>500) or high recent citations (>15)
+    if total_patents > 500 or avg_citations_2y > 15:
+        return "mature"
+
+    # Emerging: Very few patents (<50) and low citations (<5)
+    if total_patents < 50 and avg_citations_2y < 5:
+        return "emerging"
+
+    # Developing: Everything in between
+    return "developing"
+
+
+# Reasoning templates per innovation stage, filled with the stage's supporting numbers
+_STAGE_TEMPLATES = {
+    "early_research": (
+        "High university presence ({university_ratio:.1f}%) with {total_patents} total patents "
+        "indicates early research phase dominated by academic institutions"
+    ),
+    "commercialized": (
+        "Corporate dominance ({corporate:.1f}%) with low academic presence ({academic_ratio:.1f}%) "
+        "indicates mature commercialization across {total_patents} patents"
+    ),
+    "developing": (
+        "Balanced distribution (academic: {academic_ratio:.1f}%, corporate: {corporate:.1f}%) "
+        "across {total_patents} patents indicates transition from research to commercial adoption"
+    ),
+}
+
+
+# Assignee-mix classifiers take the already extracted type percentages, so collect()
+# looks them up once and passes the same locals to each
+def _commercialization_index(corporate: float, academic: float) -> float:
+    """
+    Calculate commercialization index (corporate / academic ratio).
+
+    Higher values indicate stronger commercial adoption.
+
+    Args:
+        corporate: Percentage of corporate assignees
+        academic: Percentage of academic assignees (universities + research institutes)
+
+    Returns:
+        Commercialization index (0+ where >2.0 indicates strong commercial adoption)
+    """
+    # Handle edge case: no academic assignees
+    if academic == 0:
+        # If corporate presence but no academic, high commercialization
+        return 10.0 if corporate > 0 else 0.0
+
+    return round(corporate / academic, 2)
+
+
+def _innovation_stage(
+    corporate: float,
+    university_ratio: float,
+    academic_ratio: float,
+    total_patents: int
+) -> tuple[str, str]:
+    """
+    Determine innovation stage based on assignee type mix and patent volume.
+
+    Args:
+        corporate: Percentage of corporate assignees
+        university_ratio: Percentage of university assignees
+        academic_ratio: Percentage of academic assignees (universities + research institutes)
+        total_patents: Total number of patents
+
+    Returns:
+        Tuple of (stage, reasoning) where stage is one of:
+        - "early_research": Dominated by academic research
+        - "developing": Transitioning from academic to commercial
+        - "commercialized": Corporate dominance with commercial adoption
+    """
+    # Early research stage: High university ratio (>40%) or low patent count with academic dominance
+    if university_ratio > 40 or (total_patents < 50 and academic_ratio > 50):
+        stage = "early_research"
+
+    # Commercialized stage: Corporate dominance (>70%) with low academic (<20%)
+    elif corporate > 70 and academic_ratio < 20:
+        stage = "commercialized"
+
+    # Developing stage: Balanced mix or transition period
+    else:
+        stage = "developing"
+
+    reasoning = _STAGE_TEMPLATES[stage].format(
+        corporate=corporate,
+        university_ratio=university_ratio,
+        academic_ratio=academic_ratio,
+        total_patents=total_patents
+    )
+    return (stage, reasoning)
 
 
 class PatentsCollector(BaseCollector):
@@ -18,8 +270,71 @@ class PatentsCollector(BaseCollector):
 
     API_URL = "https://search.patentsview.org/api/v1/patent/"
     TIMEOUT = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRIES = 4  # Attempts per period request on transient failures
+    MAX_RETRY_DELAY = 10.0
+
+    # Process-wide pacing at PatentsView's 45 requests/minute limit, shared across
+    # instances, periods and concurrent keywords so batches do not trip 429 storms.
+    # The burst covers one keyword's three period requests and is taken out of the
+    # sustained rate, so no 60-second window admits more than 45 requests
+    _rate_bucket = TokenBucket(rate=(45 - 3) / 60, capacity=3)
+
+    # Process-wide PatentsView client (see SharedClient). PatentsView allows ~45
+    # requests/minute per key, so a small pool keeps every request on a warm connection
+    _http = SharedClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16
+        )
+    )
+
+    # Shared across instances (a new collector is created per analysis)
+    _response_cache: TLRUCache = TLRUCache(maxsize=3 * _CACHED_KEYWORDS, ttu=_response_ttu, timer=time.monotonic)
+    _cache_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+    # Last good response per key, kept past its TTL as a fallback when a refetch fails
+    _stale_responses: TLRUCache = TLRUCache(maxsize=3 * _STALE_KEYWORDS, ttu=_stale_ttu, timer=time.monotonic)
+
+    # Fields to retrieve (use patent_id not patent_number)
+    # Note: assignee_type is nested inside assignees object, not a top-level field
+    # patent_abstract is only matched server-side by the query; returning it would
+    # dominate the payload without being read
+    _FIELDS = ("patent_id", "patent_title", "patent_date", _CITATIONS_FIELD, "assignees")
+
+    # Maximum page size (1000): a larger sample steadies the assignee, country and
+    # citation metrics at no extra round trips; abstracts are not returned (see _FIELDS)
+    _OPTIONS = {"size": 1000}
+
+    ASSIGNEE_TYPES = ("University", "Research Institute", "Corporate", "Government", "Individual")
+
+    # Classifications the full derivation yields for zero patents (see _empty_response)
+    _EMPTY_OVERRIDES = {
+        "innovation_stage": "developing",
+        "innovation_stage_reasoning": _STAGE_TEMPLATES["developing"].format(
+            corporate=0.0, academic_ratio=0.0, total_patents=0
+        ),
+        "patent_maturity": "emerging",
+        "patent_momentum": "steady",
+        "patent_trend": "stable"
+    }
+
+    def __init__(self):
+        """Initialize collector with request headers resolved once"""
+        settings = get_settings()
+        # None when no API key is configured; PatentsView rejects keyless requests
+        self._headers = (
+            {"X-Api-Key": settings.patentsview_api_key, "Content-Type": "application/json"}
+            if settings.patentsview_api_key else None
+        )
 
-    async def collect(self, keyword: str, expanded_terms: Optional[List[str]] = None) -> Dict[str, Any]:
+    async def collect(
+        self,
+        keyword: str,
+        expanded_terms: Optional[List[str]] = None,
+        *,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Collect patent data for the given keyword, optionally with expanded search terms.
 
@@ -29,6 +344,8 @@ class PatentsCollector(BaseCollector):
 
         Args:
             keyword: Technology keyword to analyze
+            expanded_terms: Optional list of related search terms
+            force_refresh: Bypass cached period responses and refetch them
 
         Returns:
             Dictionary containing:
@@ -68,208 +385,204 @@ class PatentsCollector(BaseCollector):
         errors = []
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                # Fetch data for each time period
-                data_2y = await self._fetch_period(
-                    client, keyword, year_2y_start, year_2y_end, errors, expanded_terms
-                )
-                data_5y = await self._fetch_period(
-                    client, keyword, year_5y_start, year_5y_end, errors, expanded_terms
-                )
-                data_10y = await self._fetch_period(
-                    client, keyword, year_10y_start, year_10y_end, errors, expanded_terms
-                )
+            client = await self._http.get()
+
+            # Fetch the three independent periods concurrently. Each period records its
+            # errors in its own list, merged in 2y/5y/10y order so the reported errors
+            # do not depend on which request finished first; a period that raises
+            # becomes None instead of discarding the others.
+            periods = ((year_2y_start, year_2y_end), (year_5y_start, year_5y_end), (year_10y_start, year_10y_end))
+            period_errors = ([], [], [])
+            results = await asyncio.gather(
+                *[
+                    self._fetch_period(
+                        client, keyword, year_start, year_end, period_errors[i], expanded_terms, force_refresh
+                    )
+                    for i, (year_start, year_end) in enumerate(periods)
+                ],
+                return_exceptions=True
+            )
+            for i, result in enumerate(results):
+                if isinstance(result, Exception):
+                    period_errors[i].append(f"Unexpected error in fetch: {str(result)}")
+                    results[i] = None
+                elif isinstance(result, BaseException):
+                    raise result
+                errors.extend(period_errors[i])
+            data_2y, data_5y, data_10y = results
+
+            # If all requests failed, return error state
+            if all(d is None for d in [data_2y, data_5y, data_10y]):
+                return self._error_response(keyword, collected_at, "All API requests failed", errors)
+
+            # Extract patent counts and lists once per period (a failed period is empty)
+            data_2y = data_2y or {}
+            data_5y = data_5y or {}
+            data_10y = data_10y or {}
+            patents_2y = data_2y.get("total_hits", 0)
+            patents_5y = data_5y.get("total_hits", 0)
+            patents_10y = data_10y.get("total_hits", 0)
+            period_patents = (
+                ("2y", data_2y.get("patents") or ()),
+                ("5y", data_5y.get("patents") or ()),
+                ("10y", data_10y.get("patents") or ())
+            )
 
-                # If all requests failed, return error state
-                if all(d is None for d in [data_2y, data_5y, data_10y]):
-                    return self._error_response(keyword, collected_at, "All API requests failed", errors)
-
-                # Extract patent counts
-                patents_2y = data_2y.get("total_hits", 0) if data_2y else 0
-                patents_5y = data_5y.get("total_hits", 0) if data_5y else 0
-                patents_10y = data_10y.get("total_hits", 0) if data_10y else 0
-
-                # Aggregate all patents for detailed analysis
-                all_patents = []
-                if data_2y and data_2y.get("patents"):
-                    all_patents.extend(data_2y.get("patents", []))
-                if data_5y and data_5y.get("patents"):
-                    all_patents.extend(data_5y.get("patents", []))
-                if data_10y and data_10y.get("patents"):
-                    all_patents.extend(data_10y.get("patents", []))
-
-                # Extract assignee diversity metrics with type classification
-                assignee_counts = {}
-                assignee_types = {}  # Map org name -> assignee type
-                classified_assignees = []  # List of all classified types for distribution calculation
-
-                for patent in all_patents:
-                    assignees = patent.get("assignees", [])
+            # No patents in any period: skip aggregation and classification
+            if patents_2y == patents_5y == patents_10y == 0 and not any(p for _, p in period_patents):
+                return self._empty_response(keyword, collected_at, errors)
+
+            # Aggregate all three periods in a single pass: assignee and country counts,
+            # per-period citation sums and the patent list ranked for top_patents
+            assignee_counts = Counter()
+            assignee_types = {}  # Map org name -> assignee type
+            classified_assignees = []  # List of all classified types for distribution calculation
+            country_counts = Counter()
+            citation_stats = {"2y": [0, 0], "5y": [0, 0], "10y": [0, 0]}  # [total, patents with valid count]
+            patents_with_citations = []
+            seen_ids = set()  # Guards against the same patent being returned twice
+            classify_assignee = self._classify_assignee
+
+            for period, patents in period_patents:
+                stats = citation_stats[period]
+
+                for patent in patents:
+                    patent_get = patent.get
+                    patent_id = patent_get("patent_id")
+                    if patent_id is not None:
+                        if patent_id in seen_ids:
+                            continue
+                        seen_ids.add(patent_id)
+
+                    assignees = patent_get("assignees") or ()
                     for assignee in assignees:
-                        org = assignee.get("assignee_organization", "Individual")
-                        assignee_type_code = assignee.get("assignee_type")
-
+                        assignee_get = assignee.get
+                        org = assignee_get("assignee_organization", "Individual")
                         if org:
                             # Count patents per assignee
-                            assignee_counts[org] = assignee_counts.get(org, 0) + 1
+                            assignee_counts[org] += 1
 
                             # Classify assignee type (only once per unique org)
-                            if org not in assignee_types:
-                                assignee_types[org] = self._classify_assignee(org, assignee_type_code)
+                            assignee_type = assignee_types.get(org)
+                            if assignee_type is None:
+                                assignee_type = assignee_types[org] = classify_assignee(
+                                    org, assignee_get("assignee_type")
+                                )
 
                             # Track all classifications for distribution calculation
-                            classified_assignees.append(assignee_types[org])
-
-                unique_assignees = len(assignee_counts)
-                top_assignees = [
-                    {
-                        "name": name,
-                        "patent_count": count,
-                        "type": assignee_types.get(name, "Corporate")
-                    }
-                    for name, count in sorted(
-                        assignee_counts.items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )[:5]
-                ]
-
-                # Extract geographic distribution
-                country_counts = {}
-                for patent in all_patents:
-                    assignees = patent.get("assignees", [])
-                    for assignee in assignees:
-                        country = assignee.get("assignee_country", "Unknown")
-                        if country and country != "Unknown":
-                            country_counts[country] = country_counts.get(country, 0) + 1
-
-                geographic_diversity = len(country_counts)
-
-                # Calculate citation metrics for 2y and 5y periods
-                avg_citations_2y = 0.0
-                avg_citations_5y = 0.0
-
-                if data_2y and data_2y.get("patents"):
-                    patents_2y_list = data_2y.get("patents", [])
-                    total_citations = 0
-                    count_with_citations = 0
-                    for patent in patents_2y_list:
-                        citation_val = patent.get("patent_num_times_cited_by_us_patents")
-                        try:
-                            citations = int(citation_val) if citation_val is not None else 0
-                            total_citations += citations
-                            count_with_citations += 1
-                        except (ValueError, TypeError):
-                            pass
-                    avg_citations_2y = total_citations / count_with_citations if count_with_citations > 0 else 0.0
-
-                if data_5y and data_5y.get("patents"):
-                    patents_5y_list = data_5y.get("patents", [])
-                    total_citations = 0
-                    count_with_citations = 0
-                    for patent in patents_5y_list:
-                        citation_val = patent.get("patent_num_times_cited_by_us_patents")
-                        try:
-                            citations = int(citation_val) if citation_val is not None else 0
-                            total_citations += citations
-                            count_with_citations += 1
-                        except (ValueError, TypeError):
-                            pass
-                    avg_citations_5y = total_citations / count_with_citations if count_with_citations > 0 else 0.0
-
-                # Extract top patents for LLM context (sort by citations)
-                top_patents = []
-                patents_with_citations = []
-                for patent in all_patents:
-                    citation_val = patent.get("patent_num_times_cited_by_us_patents")
-                    try:
-                        citations = int(citation_val) if citation_val is not None else 0
-                    except (ValueError, TypeError):
+                            classified_assignees.append(assignee_type)
+
+                    # Counter.update does the per-country increments in C
+                    country_counts.update(
+                        country for country in (assignee.get("assignee_country") for assignee in assignees)
+                        if country and country != "Unknown"
+                    )
+
+                    # Parsed by _normalize_citations; unparseable counts (None) rank as 0
+                    # but are left out of the averages
+                    citations = patent[_CITATIONS_FIELD]
+                    if citations is None:
                         citations = 0
+                    else:
+                        stats[0] += citations
+                        stats[1] += 1
 
-                    assignees = patent.get("assignees", [])
-                    assignee_name = assignees[0].get("assignee_organization", "Individual") if assignees else "Individual"
-                    assignee_country = assignees[0].get("assignee_country", "Unknown") if assignees else "Unknown"
-
+                    first_assignee = assignees[0] if assignees else None
                     patents_with_citations.append({
-                        "patent_number": patent.get("patent_id", "unknown"),  # API uses patent_id
-                        "title": patent.get("patent_title", ""),
-                        "date": patent.get("patent_date", ""),
-                        "assignee": assignee_name,
-                        "country": assignee_country,
+                        "patent_number": patent_id if patent_id is not None else "unknown",  # API uses patent_id
+                        "title": patent_get("patent_title", ""),
+                        "date": patent_get("patent_date", ""),
+                        "assignee": (
+                            first_assignee.get("assignee_organization", "Individual") if first_assignee else "Individual"
+                        ),
+                        "country": first_assignee.get("assignee_country", "Unknown") if first_assignee else "Unknown",
                         "citations": citations
                     })
 
-                # Sort by citations (highest first) and take top 5
-                patents_with_citations.sort(key=lambda x: x["citations"], reverse=True)
-                top_patents = patents_with_citations[:5]
+            unique_assignees = len(assignee_counts)
+            top_assignees = [
+                {
+                    "name": name,
+                    "patent_count": count,
+                    "type": assignee_types.get(name, "Corporate")
+                }
+                for name, count in heapq.nlargest(5, assignee_counts.items(), key=itemgetter(1))
+            ]
 
-                # Calculate derived insights
-                filing_velocity = self._calculate_filing_velocity(patents_2y, patents_5y)
-                assignee_concentration = self._calculate_assignee_concentration(
-                    assignee_counts, patents_2y + patents_5y + patents_10y
-                )
-                geographic_reach = self._calculate_geographic_reach(country_counts)
-                patent_maturity = self._calculate_patent_maturity(
-                    patents_2y + patents_5y + patents_10y, avg_citations_2y
-                )
-                patent_momentum = self._calculate_patent_momentum(patents_2y, patents_5y)
-                patent_trend = self._calculate_patent_trend(patents_2y, patents_5y)
-
-                # Calculate assignee type distribution and derived metrics
-                assignee_type_distribution = self._calculate_assignee_type_distribution(classified_assignees)
-                university_ratio = self._calculate_university_ratio(assignee_type_distribution)
-                academic_ratio = self._calculate_academic_ratio(assignee_type_distribution)
-                commercialization_index = self._calculate_commercialization_index(assignee_type_distribution)
-                innovation_stage, innovation_stage_reasoning = self._calculate_innovation_stage(
-                    assignee_type_distribution, university_ratio, patents_2y + patents_5y + patents_10y
-                )
+            geographic_diversity = len(country_counts)
 
-                return {
-                    "source": "patentsview",
-                    "collected_at": collected_at,
-                    "keyword": keyword,
-
-                    # Patent counts by time period
-                    "patents_2y": patents_2y,
-                    "patents_5y": patents_5y,
-                    "patents_10y": patents_10y,
-                    "patents_total": patents_2y + patents_5y + patents_10y,
-
-                    # Assignee diversity metrics
-                    "unique_assignees": unique_assignees,
-                    "top_assignees": top_assignees,
-
-                    # Assignee type classification metrics
-                    "assignee_type_distribution": assignee_type_distribution.get("type_percentages", {}),
-                    "university_ratio": university_ratio,
-                    "academic_ratio": academic_ratio,
-                    "commercialization_index": commercialization_index,
-                    "innovation_stage": innovation_stage,
-                    "innovation_stage_reasoning": innovation_stage_reasoning,
-
-                    # Geographic distribution
-                    "countries": country_counts,
-                    "geographic_diversity": geographic_diversity,
-
-                    # Citation metrics
-                    "avg_citations_2y": round(avg_citations_2y, 2),
-                    "avg_citations_5y": round(avg_citations_5y, 2),
-
-                    # Derived insights
-                    "filing_velocity": round(filing_velocity, 3),
-                    "assignee_concentration": assignee_concentration,
-                    "geographic_reach": geographic_reach,
-                    "patent_maturity": patent_maturity,
-                    "patent_momentum": patent_momentum,
-                    "patent_trend": patent_trend,
-
-                    # Context for LLM
-                    "top_patents": top_patents,
-
-                    # Error tracking
-                    "errors": errors
-                }
+            # Calculate citation metrics for 2y and 5y periods
+            total_2y, count_2y = citation_stats["2y"]
+            total_5y, count_5y = citation_stats["5y"]
+            avg_citations_2y = total_2y / count_2y if count_2y > 0 else 0.0
+            avg_citations_5y = total_5y / count_5y if count_5y > 0 else 0.0
+
+            # Top 5 by citations (highest first); ties keep period order like a stable sort
+            top_patents = heapq.nlargest(5, patents_with_citations, key=itemgetter("citations"))
+
+            # Calculate derived insights
+            filing_velocity, patent_momentum, patent_trend = _filing_stats(patents_2y, patents_5y)
+            assignee_concentration = self._calculate_assignee_concentration(
+                assignee_counts, patents_2y + patents_5y + patents_10y, top_assignees
+            )
+            geographic_reach = self._calculate_geographic_reach(country_counts)
+            patent_maturity = _patent_maturity(patents_2y + patents_5y + patents_10y, avg_citations_2y)
+
+            # Calculate assignee type distribution and derived metrics
+            assignee_type_distribution = self._calculate_assignee_type_distribution(classified_assignees)
+            # Look the type percentages up once and share them across the derived metrics
+            corporate_pct, university_ratio, _, academic_pct = self._extract_type_pcts(assignee_type_distribution)
+            academic_ratio = round(academic_pct, 1)
+            commercialization_index = _commercialization_index(corporate_pct, academic_pct)
+            innovation_stage, innovation_stage_reasoning = _innovation_stage(
+                corporate_pct, university_ratio, academic_pct, patents_2y + patents_5y + patents_10y
+            )
+
+            return {
+                "source": "patentsview",
+                "collected_at": collected_at,
+                "keyword": keyword,
+
+                # Patent counts by time period
+                "patents_2y": patents_2y,
+                "patents_5y": patents_5y,
+                "patents_10y": patents_10y,
+                "patents_total": patents_2y + patents_5y + patents_10y,
+
+                # Assignee diversity metrics
+                "unique_assignees": unique_assignees,
+                "top_assignees": top_assignees,
+
+                # Assignee type classification metrics
+                "assignee_type_distribution": assignee_type_distribution.get("type_percentages", {}),
+                "university_ratio": university_ratio,
+                "academic_ratio": academic_ratio,
+                "commercialization_index": commercialization_index,
+                "innovation_stage": innovation_stage,
+                "innovation_stage_reasoning": innovation_stage_reasoning,
+
+                # Geographic distribution
+                "countries": country_counts,
+                "geographic_diversity": geographic_diversity,
+
+                # Citation metrics
+                "avg_citations_2y": round(avg_citations_2y, 2),
+                "avg_citations_5y": round(avg_citations_5y, 2),
+
+                # Derived insights
+                "filing_velocity": round(filing_velocity, 3),
+                "assignee_concentration": assignee_concentration,
+                "geographic_reach": geographic_reach,
+                "patent_maturity": patent_maturity,
+                "patent_momentum": patent_momentum,
+                "patent_trend": patent_trend,
+
+                # Context for LLM
+                "top_patents": top_patents,
+
+                # Error tracking
+                "errors": errors
+            }
 
         except Exception as e:
             return self._error_response(
@@ -279,6 +592,44 @@ class PatentsCollector(BaseCollector):
                 errors
             )
 
+    async def collect_many(self, keywords: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Collect patent data for several keywords concurrently.
+
+        At most concurrency keywords are collected at once (each issuing its
+        three period requests), which keeps the batch within PatentsView's
+        rate limit; transient 429s are absorbed by the per-request retries.
+        All workers share the module-level client and its keep-alive pool.
+
+        Args:
+            keywords: Technology keywords to analyze
+            concurrency: Maximum number of keywords collected at once
+
+        Returns:
+            List of collect() results in the same order as keywords; a keyword
+            whose collection raised gets an error response instead of failing
+            the whole batch
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _collect_one(keyword: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.collect(keyword)
+
+        results = await asyncio.gather(
+            *[_collect_one(keyword) for keyword in keywords],
+            return_exceptions=True
+        )
+
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                results[i] = self._error_response(
+                    keywords[i], datetime.now().isoformat(), f"Unexpected error: {str(result)}", []
+                )
+            elif isinstance(result, BaseException):
+                raise result
+        return results
+
     async def _fetch_period(
         self,
         client: httpx.AsyncClient,
@@ -286,12 +637,20 @@ class PatentsCollector(BaseCollector):
         year_start: int,
         year_end: int,
         errors: List[str],
-        expanded_terms: Optional[List[str]] = None
+        expanded_terms: Optional[List[str]] = None,
+        force_refresh: bool = False
     ) -> Dict[str, Any] | None:
         """
-        Fetch PatentsView data for a specific time period.
+        Fetch PatentsView data for a specific time period, using the response cache.
 
-        When expanded_terms is provided, constructs OR query matching keyword OR any expanded term.
+        Successful responses are cached per (terms, period) with a TTL that grows
+        with the age of the window: 1 hour for 2y, 7 days for 5y and 30 days
+        for 10y. Terms are lowercased for the key since text search is
+        case-insensitive. Concurrent misses for the same key wait on a shared
+        lock so only one request reaches the API. If the request fails, the
+        last good response for the key is returned even if it has expired, as
+        long as it is within _STALE_GRACE of expiry and among the last
+        _STALE_KEYWORDS keywords fetched.
 
         Args:
             client: Async HTTP client
@@ -300,142 +659,178 @@ class PatentsCollector(BaseCollector):
             year_end: End year (inclusive)
             errors: List to append error messages to
             expanded_terms: Optional list of related search terms
+            force_refresh: Skip the cache lookup (the fresh response is still stored)
 
         Returns:
-            API response dict or None if request failed
+            API response dict (possibly stale) or None if request failed with nothing cached
         """
-        try:
-            # Build date filter (ISO format YYYY-MM-DD)
-            date_start = f"{year_start}-01-01"
-            date_end = f"{year_end}-12-31"
-
-            # Build query using _text_all for keyword matching (ensures ALL words present)
-            # Search in both title and abstract
-            if expanded_terms:
-                # With expanded terms: create OR clause for each term (keyword + expanded)
-                text_clauses = []
-                for term in [keyword] + expanded_terms:
-                    text_clauses.append({
-                        "_or": [
-                            {"_text_all": {"patent_title": term}},
-                            {"_text_all": {"patent_abstract": term}}
-                        ]
-                    })
+        terms = tuple(sorted({term.lower() for term in expanded_terms})) if expanded_terms else ()
+        cache_key = (keyword.lower(), terms, year_start, year_end)
 
-                query = {
-                    "_and": [
-                        {"_or": text_clauses},  # Match ANY of the terms
-                        {"_gte": {"patent_date": date_start}},
-                        {"_lte": {"patent_date": date_end}}
-                    ]
-                }
-            else:
-                # Original behavior: single keyword
-                query = {
-                    "_and": [
-                        {
-                            "_or": [
-                                {"_text_all": {"patent_title": keyword}},
-                                {"_text_all": {"patent_abstract": keyword}}
-                            ]
-                        },
-                        {"_gte": {"patent_date": date_start}},
-                        {"_lte": {"patent_date": date_end}}
-                    ]
-                }
+        async def fetch() -> Dict[str, Any] | None:
+            data = await self._request_period(client, keyword, year_start, year_end, errors, expanded_terms)
+            if data is not None:
+                self._stale_responses[cache_key] = data
+            return data
 
-            # Fields to retrieve (use patent_id not patent_number)
-            # Citation field: patent_num_times_cited_by_us_patents
-            # Note: assignee_type is nested inside assignees object, not a top-level field
-            fields = [
-                "patent_id",
-                "patent_title",
-                "patent_abstract",
-                "patent_date",
-                "patent_num_times_cited_by_us_patents",
-                "assignees"
-            ]
+        data = await cached_fetch(
+            self._response_cache, self._cache_locks, cache_key, fetch, force_refresh=force_refresh
+        )
+        if data is not None:
+            return data
 
-            # Options: 100 results per page (max 1000)
-            options = {"size": 100}
+        # Stale-while-error: an expired response for this period beats no data
+        stale = self._stale_responses.get(cache_key)
+        if stale is not None:
+            errors.append("Using stale cached data")
+        return stale
 
-            # Get API key from settings
-            settings = get_settings()
-            headers = {}
-            if settings.patentsview_api_key:
-                headers["X-Api-Key"] = settings.patentsview_api_key
-            else:
-                errors.append("Missing PatentsView API key")
-                return None
+    async def _request_period(
+        self,
+        client: httpx.AsyncClient,
+        keyword: str,
+        year_start: int,
+        year_end: int,
+        errors: List[str],
+        expanded_terms: Optional[List[str]] = None
+    ) -> Dict[str, Any] | None:
+        """
+        Request PatentsView data for a specific time period.
+
+        When expanded_terms is provided, constructs OR query matching keyword OR any expanded term.
+
+        Args:
+            client: Async HTTP client
+            keyword: Search term
+            year_start: Start year (inclusive)
+            year_end: End year (inclusive)
+            errors: List to append error messages to
+            expanded_terms: Optional list of related search terms
 
-            # Make GET request with manually encoded JSON parameters
-            # httpx doesn't encode JSON params correctly, so we build the URL manually
-            q = json.dumps(query)
-            f = json.dumps(fields)
-            o = json.dumps(options)
-            url = f'{self.API_URL}?q={quote(q)}&f={quote(f)}&o={quote(o)}'
+        Returns:
+            API response dict or None if request failed
+        """
+        if self._headers is None:
+            errors.append("Missing PatentsView API key")
+            return None
 
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        query = {
+            "_and": [
+                self._text_clause(keyword, expanded_terms),
+                {"_gte": {"patent_date": f"{year_start}-01-01"}},
+                {"_lte": {"patent_date": f"{year_end}-12-31"}}
+            ]
+        }
+        # Encoded once with orjson and reused across retry attempts
+        payload = orjson.dumps({"q": query, "f": self._FIELDS, "o": self._OPTIONS})
+
+        for attempt in range(self.MAX_RETRIES):
+            is_last_attempt = attempt == self.MAX_RETRIES - 1
+            try:
+                # Wait for the shared rate budget instead of discovering the limit via 429
+                await self._rate_bucket.acquire()
+
+                # POST the query as a JSON body: no per-field URL encoding and no URL length limit
+                response = await client.post(self.API_URL, content=payload, headers=self._headers)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                # Check for API error flag
+                if data.get("error", False):
+                    errors.append("API returned error flag")
+                    return None
+
+                self._normalize_citations(data.get("patents") or ())
+                return data
+
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+
+                # Rate limits and gateway/server errors are usually transient: back off and retry
+                if status_code in self.RETRY_STATUSES and not is_last_attempt:
+                    delay = retry_delay(attempt, self.MAX_RETRY_DELAY, e.response.headers.get("Retry-After"))
+                    await asyncio.sleep(delay)
+                    continue
 
-            # Check for API error flag
-            if data.get("error", False):
-                errors.append("API returned error flag")
+                if status_code == 429:
+                    # Rate limited - check for Retry-After header
+                    retry_after = e.response.headers.get("Retry-After", "unknown")
+                    errors.append(f"Rate limited (retry after {retry_after}s)")
+                elif status_code == 401:
+                    errors.append("Authentication failed - invalid API key")
+                elif status_code == 400:
+                    errors.append("Invalid query parameters")
+                else:
+                    errors.append(f"HTTP {status_code}")
                 return None
 
-            return data
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                # Rate limited - check for Retry-After header
-                retry_after = e.response.headers.get("Retry-After", "unknown")
-                errors.append(f"Rate limited (retry after {retry_after}s)")
-            elif e.response.status_code == 401:
-                errors.append("Authentication failed - invalid API key")
-            elif e.response.status_code == 400:
-                errors.append("Invalid query parameters")
-            else:
-                errors.append(f"HTTP {e.response.status_code}")
-            return None
+            except httpx.TimeoutException:
+                if not is_last_attempt:
+                    await asyncio.sleep(retry_delay(attempt, self.MAX_RETRY_DELAY))
+                    continue
+                errors.append("Request timeout")
+                return None
 
-        except httpx.TimeoutException:
-            errors.append("Request timeout")
-            return None
+            except httpx.RequestError as e:
+                # Dropped or refused connections are usually transient as well
+                if not is_last_attempt:
+                    await asyncio.sleep(retry_delay(attempt, self.MAX_RETRY_DELAY))
+                    continue
+                errors.append(f"Network error: {type(e).__name__}")
+                return None
 
-        except httpx.RequestError as e:
-            errors.append(f"Network error: {type(e).__name__}")
-            return None
+            except Exception as e:
+                errors.append(f"Unexpected error in fetch: {str(e)}")
+                return None
 
-        except Exception as e:
-            errors.append(f"Unexpected error in fetch: {str(e)}")
-            return None
+        return None
 
-    def _calculate_filing_velocity(self, patents_2y: int, patents_5y: int) -> float:
+    def _text_clause(self, keyword: str, expanded_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Calculate patent filing velocity (rate of filing growth).
+        Build the keyword-matching part of a PatentsView query.
+
+        Uses _text_all (ensures ALL words present) against both title and abstract.
+        When expanded_terms is provided, matches keyword OR any expanded term.
+        All matchers sit in one flat _or rather than an _or per term, which keeps
+        the query small and shallow for the server to plan.
 
         Args:
-            patents_2y: Patents in last 2 years
-            patents_5y: Patents in prior 5 years
+            keyword: Search term
+            expanded_terms: Optional list of related search terms
 
         Returns:
-            Filing velocity score (higher = faster growth)
+            Query clause dict
         """
-        # Calculate per-year rates
-        recent_rate = patents_2y / 2.0
-        historical_rate = patents_5y / 5.0
+        terms = [keyword, *expanded_terms] if expanded_terms else [keyword]
+        return {
+            "_or": [
+                {"_text_all": {field: term}}
+                for term in terms
+                for field in ("patent_title", "patent_abstract")
+            ]
+        }
 
-        # Handle edge case: no historical data
-        if historical_rate == 0:
-            return 0.0 if recent_rate == 0 else 1.0
+    def _normalize_citations(self, patents: List[Dict]) -> None:
+        """
+        Convert citation counts to int once, in place.
 
-        # Calculate growth rate: (recent - historical) / historical
-        velocity = (recent_rate - historical_rate) / historical_rate
-        return velocity
+        PatentsView returns patent_num_times_cited_by_us_patents as a string.
+        Runs once per API response (before caching), so aggregation indexes
+        the parsed value instead of repeating the int() conversion on every
+        read and on every cache hit. Missing or null counts become 0;
+        unparseable counts become None so they stay out of citation averages.
+
+        Args:
+            patents: Raw patent dicts from a PatentsView response
+        """
+        for patent in patents:
+            patent[_CITATIONS_FIELD] = _to_int(patent.get(_CITATIONS_FIELD))
 
     def _calculate_assignee_concentration(
-        self, assignee_counts: Dict[str, int], total_patents: int
+        self,
+        assignee_counts: Dict[str, int],
+        total_patents: int,
+        top_assignees: Optional[List[Dict[str, Any]]] = None
     ) -> str:
         """
         Calculate assignee concentration level.
@@ -443,6 +838,8 @@ class PatentsCollector(BaseCollector):
         Args:
             assignee_counts: Dictionary of assignee name -> patent count
             total_patents: Total number of patents
+            top_assignees: Optional assignees already ranked by patent_count (highest
+                first, at least the top 3); reused instead of ranking assignee_counts again
 
         Returns:
             "concentrated", "moderate", or "diverse"
@@ -451,12 +848,10 @@ class PatentsCollector(BaseCollector):
             return "unknown"
 
         # Get top 3 assignees
-        sorted_assignees = sorted(
-            assignee_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        top_3_count = sum(count for _, count in sorted_assignees[:3])
+        if top_assignees is not None:
+            top_3_count = sum(assignee["patent_count"] for assignee in top_assignees[:3])
+        else:
+            top_3_count = sum(heapq.nlargest(3, assignee_counts.values()))
 
         # Calculate percentage of patents from top 3
         top_3_percentage = top_3_count / total_patents
@@ -498,101 +893,16 @@ class PatentsCollector(BaseCollector):
         else:
             return "global"
 
-    def _calculate_patent_maturity(self, total_patents: int, avg_citations_2y: float) -> str:
-        """
-        Calculate patent maturity level.
-
-        Args:
-            total_patents: Total number of patents
-            avg_citations_2y: Average citations for recent patents
-
-        Returns:
-            "emerging", "developing", or "mature"
-        """
-        # Mature: High patent count (>500) or high recent citations (>15)
-        if total_patents > 500 or avg_citations_2y > 15:
-            return "mature"
-
-        # Emerging: Very few patents (<50) and low citations (<5)
-        if total_patents < 50 and avg_citations_2y < 5:
-            return "emerging"
-
-        # Developing: Everything in between
-        return "developing"
-
-    def _calculate_patent_momentum(self, patents_2y: int, patents_5y: int) -> str:
-        """
-        Calculate patent momentum by comparing filing rates across periods.
-
-        Args:
-            patents_2y: Patents in last 2 years
-            patents_5y: Patents in prior 5 years
-
-        Returns:
-            "accelerating", "steady", or "decelerating"
-        """
-        # Calculate filing rate per year for each period
-        recent_rate = patents_2y / 2.0
-        historical_rate = patents_5y / 5.0
-
-        # Handle edge case: no historical data
-        if historical_rate == 0:
-            return "steady" if recent_rate == 0 else "accelerating"
-
-        # Calculate growth ratio
-        growth_ratio = recent_rate / historical_rate
-
-        # Accelerating: Recent rate >50% higher
-        if growth_ratio > 1.5:
-            return "accelerating"
-
-        # Decelerating: Recent rate <50% of historical
-        if growth_ratio < 0.5:
-            return "decelerating"
-
-        # Steady: Within 50% range
-        return "steady"
-
-    def _calculate_patent_trend(self, patents_2y: int, patents_5y: int) -> str:
-        """
-        Calculate patent trend direction.
-
-        Args:
-            patents_2y: Patents in last 2 years
-            patents_5y: Patents in prior 5 years
-
-        Returns:
-            "increasing", "stable", or "decreasing"
-        """
-        # Calculate per-year rates
-        recent_rate = patents_2y / 2.0
-        historical_rate = patents_5y / 5.0
-
-        # Handle edge case
-        if historical_rate == 0:
-            return "stable" if recent_rate == 0 else "increasing"
-
-        # Calculate percentage difference
-        diff_ratio = (recent_rate - historical_rate) / historical_rate
-
-        # Increasing: Recent rate >30% higher
-        if diff_ratio > 0.3:
-            return "increasing"
-
-        # Decreasing: Recent rate >30% lower
-        if diff_ratio < -0.3:
-            return "decreasing"
-
-        # Stable: Within 30% range
-        return "stable"
-
-    def _classify_assignee(self, assignee_org: str, assignee_type: Optional[int] = None) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_assignee(assignee_org: str, assignee_type: Optional[int] = None) -> str:
         """
         Classify assignee into one of 5 categories based on organization name and type code.
 
         Uses pattern matching on organization names to identify universities and research
         institutes, then falls back to assignee_type codes for government/individual
-        classification.
+        classification. Results are memoized process-wide, since the same organizations
+        recur across keywords and analyses.
 
         Args:
             assignee_org: Organization name (e.g., "MIT", "IBM", "Stanford University")
@@ -608,55 +918,19 @@ class PatentsCollector(BaseCollector):
         org_lower = assignee_org.lower()
 
         # Priority 1: Check for University patterns
-        university_keywords = [
-            "university", "universit",  # International variations (université, università, etc.)
-            "college",
-            " state",  # Space prefix to avoid matching "estate", "restate", etc.
-            " tech ",  # Space-bounded to avoid "technology", "technical"
-        ]
-        university_abbreviations = [
-            "mit", "caltech", "eth", "epfl", "cmu", "ucla", "ucb", "nyu"
-        ]
-
-        for keyword in university_keywords:
-            if keyword in org_lower:
-                # Special case: "College of" might be corporate training
-                if keyword == "college" and "college of" in org_lower:
-                    continue
-                return "University"
+        # Special case: "College of" might be corporate training
+        if _UNIVERSITY_PATTERN.search(org_lower) or ("college" in org_lower and "college of" not in org_lower):
+            return "University"
 
         # Check for common university abbreviations (as whole words)
-        org_words = org_lower.split()
-        for abbrev in university_abbreviations:
-            if abbrev in org_words:
-                return "University"
-
-        # Priority 2: Check for Research Institute patterns
-        institute_keywords = [
-            "institute", "institut",  # International variations
-            "research center", "research centre",
-            "laboratory", "laborator",  # Catches "laboratories"
-            "national lab",  # "Sandia National Laboratories"
-            "max planck",  # Max Planck Institute
-            "fraunhofer",  # Fraunhofer Society
-            "cnrs",  # French National Centre for Scientific Research
-            "nist",  # National Institute of Standards and Technology
-        ]
-
-        # Special handling for corporate research labs vs. research institutes
-        # "IBM Research" should be Corporate, "Sandia National Laboratories" should be Research Institute
-        corporate_research_exceptions = [
-            "ibm research", "microsoft research", "google research", "amazon research",
-            "facebook research", "meta research", "apple research", "intel research"
-        ]
-
-        # Check for corporate research exceptions first
-        is_corporate_research = any(exc in org_lower for exc in corporate_research_exceptions)
-
-        if not is_corporate_research:
-            for keyword in institute_keywords:
-                if keyword in org_lower:
-                    return "Research Institute"
+        if not _UNIVERSITY_ABBREVIATIONS.isdisjoint(org_lower.split()):
+            return "University"
+
+        # Priority 2: Check for Research Institute patterns, unless the org is a
+        # corporate research lab ("IBM Research" is Corporate, "Sandia National
+        # Laboratories" is a Research Institute)
+        if _INSTITUTE_PATTERN.search(org_lower) and not _CORPORATE_RESEARCH_PATTERN.search(org_lower):
+            return "Research Institute"
 
         # Priority 3: Check assignee_type code for Government/Individual
         # Based on typical patent database conventions:
@@ -684,13 +958,7 @@ class PatentsCollector(BaseCollector):
             Dictionary with type counts and percentages for each category
         """
         # Count each type
-        type_counts = {
-            "University": 0,
-            "Research Institute": 0,
-            "Corporate": 0,
-            "Government": 0,
-            "Individual": 0
-        }
+        type_counts = dict.fromkeys(self.ASSIGNEE_TYPES, 0)
 
         for assignee_type in classified_assignees:
             if assignee_type in type_counts:
@@ -713,104 +981,48 @@ class PatentsCollector(BaseCollector):
             "total_assignees": total
         }
 
-    def _calculate_university_ratio(self, type_distribution: Dict[str, Any]) -> float:
-        """
-        Calculate percentage of university assignees.
-
-        Args:
-            type_distribution: Output from _calculate_assignee_type_distribution()
-
-        Returns:
-            University percentage (0-100)
-        """
-        return type_distribution.get("type_percentages", {}).get("University", 0.0)
-
-    def _calculate_academic_ratio(self, type_distribution: Dict[str, Any]) -> float:
-        """
-        Calculate percentage of academic assignees (universities + research institutes).
-
-        Args:
-            type_distribution: Output from _calculate_assignee_type_distribution()
-
-        Returns:
-            Academic percentage (0-100)
-        """
-        percentages = type_distribution.get("type_percentages", {})
-        university = percentages.get("University", 0.0)
-        research_institute = percentages.get("Research Institute", 0.0)
-        return round(university + research_institute, 1)
-
-    def _calculate_commercialization_index(self, type_distribution: Dict[str, Any]) -> float:
+    def _extract_type_pcts(self, type_distribution: Dict[str, Any]) -> Tuple[float, float, float, float]:
         """
-        Calculate commercialization index (corporate / academic ratio).
-
-        Higher values indicate stronger commercial adoption.
+        Extract the assignee type percentages the derived metrics are built from.
 
         Args:
             type_distribution: Output from _calculate_assignee_type_distribution()
 
         Returns:
-            Commercialization index (0+ where >2.0 indicates strong commercial adoption)
+            Tuple of (corporate, university, research institute, academic) percentages,
+            where academic is university + research institute (unrounded)
         """
         percentages = type_distribution.get("type_percentages", {})
         corporate = percentages.get("Corporate", 0.0)
         university = percentages.get("University", 0.0)
         research_institute = percentages.get("Research Institute", 0.0)
-        academic = university + research_institute
+        return corporate, university, research_institute, university + research_institute
 
-        # Handle edge case: no academic assignees
-        if academic == 0:
-            # If corporate presence but no academic, high commercialization
-            return 10.0 if corporate > 0 else 0.0
-
-        return round(corporate / academic, 2)
-
-    def _calculate_innovation_stage(
+    def _empty_response(
         self,
-        type_distribution: Dict[str, Any],
-        university_ratio: float,
-        total_patents: int
-    ) -> tuple[str, str]:
+        keyword: str,
+        collected_at: str,
+        errors: List[str]
+    ) -> Dict[str, Any]:
         """
-        Determine innovation stage based on assignee type distribution and patent volume.
+        Return the response for a keyword with no patents in any period.
+
+        Equivalent to running the full derivation on zero data, but skips the
+        aggregation and classifier calls (common for long-tail keywords).
 
         Args:
-            type_distribution: Output from _calculate_assignee_type_distribution()
-            university_ratio: Percentage of university assignees
-            total_patents: Total number of patents
+            keyword: Search term
+            collected_at: ISO timestamp
+            errors: List of non-fatal errors encountered
 
         Returns:
-            Tuple of (stage, reasoning) where stage is one of:
-            - "early_research": Dominated by academic research
-            - "developing": Transitioning from academic to commercial
-            - "commercialized": Corporate dominance with commercial adoption
+            Response dict with zero metrics and the zero-data classifications
         """
-        percentages = type_distribution.get("type_percentages", {})
-        corporate = percentages.get("Corporate", 0.0)
-        academic_ratio = percentages.get("University", 0.0) + percentages.get("Research Institute", 0.0)
-
-        # Early research stage: High university ratio (>40%) or low patent count with academic dominance
-        if university_ratio > 40 or (total_patents < 50 and academic_ratio > 50):
-            reasoning = (
-                f"High university presence ({university_ratio:.1f}%) with {total_patents} total patents "
-                f"indicates early research phase dominated by academic institutions"
-            )
-            return ("early_research", reasoning)
-
-        # Commercialized stage: Corporate dominance (>70%) with low academic (<20%)
-        if corporate > 70 and academic_ratio < 20:
-            reasoning = (
-                f"Corporate dominance ({corporate:.1f}%) with low academic presence ({academic_ratio:.1f}%) "
-                f"indicates mature commercialization across {total_patents} patents"
-            )
-            return ("commercialized", reasoning)
-
-        # Developing stage: Balanced mix or transition period
-        reasoning = (
-            f"Balanced distribution (academic: {academic_ratio:.1f}%, corporate: {corporate:.1f}%) "
-            f"across {total_patents} patents indicates transition from research to commercial adoption"
-        )
-        return ("developing", reasoning)
+        response = self._error_response(keyword, collected_at, "", errors)
+        response.update(self._EMPTY_OVERRIDES)
+        response["assignee_type_distribution"] = dict.fromkeys(self.ASSIGNEE_TYPES, 0.0)
+        response["errors"] = errors
+        return response
 
     def _error_response(
         self,
@@ -2,12 +2,19 @@
 Social media collector using Hacker News Algolia API.
 Gathers discussion volume, engagement metrics, and trends for technology keywords.
 """
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import math
+import time
+import weakref
 import httpx
+from cachetools import TTLCache
 
 from app.collectors.base import BaseCollector
+from app.utils.http import SharedClient, cached_fetch
+
+DAY_SECONDS = 86400
 
 
 class SocialCollector(BaseCollector):
@@ -15,6 +22,22 @@ class SocialCollector(BaseCollector):
 
     API_URL = "https://hn.algolia.com/api/v1/search"
     TIMEOUT = 30.0
+    CACHE_TTL_SECONDS = 3600
+    HITS_PER_PAGE = 20  # Stories returned per period for engagement metrics and top stories
+
+    # Process-wide Hacker News client (see SharedClient), shared across instances
+    _http = SharedClient(
+        timeout=TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0
+        )
+    )
+
+    # Shared across instances (a new collector is created per analysis)
+    _response_cache: TTLCache = TTLCache(maxsize=1024, ttl=CACHE_TTL_SECONDS)
+    _cache_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
 
     async def collect(self, keyword: str, expanded_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -45,106 +68,101 @@ class SocialCollector(BaseCollector):
                 - top_stories: Sample of recent stories
                 - errors: List of non-fatal errors encountered
         """
-        now = datetime.now()
-        collected_at = now.isoformat()
+        # One Unix timestamp drives the period bounds and story ages
+        now_ts = int(time.time())
+        collected_at = datetime.fromtimestamp(now_ts).isoformat()
 
-        # Calculate time period boundaries (Unix timestamps)
-        thirty_days_ago = int((now - timedelta(days=30)).timestamp())
-        six_months_ago = int((now - timedelta(days=180)).timestamp())
-        one_year_ago = int((now - timedelta(days=365)).timestamp())
+        # Calculate time period boundaries (Unix timestamps), truncated to the hour
+        # so collects within the same hour share cached period responses
+        thirty_days_ago = self._hour_floor(now_ts - 30 * DAY_SECONDS)
+        six_months_ago = self._hour_floor(now_ts - 180 * DAY_SECONDS)
+        one_year_ago = self._hour_floor(now_ts - 365 * DAY_SECONDS)
 
         errors = []
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                # Fetch data for each time period
-                data_30d = await self._fetch_period(
-                    client, keyword, thirty_days_ago, None, errors, expanded_terms
-                )
-                data_6m = await self._fetch_period(
-                    client, keyword, six_months_ago, thirty_days_ago, errors, expanded_terms
-                )
-                data_1y = await self._fetch_period(
-                    client, keyword, one_year_ago, six_months_ago, errors, expanded_terms
+            client = await self._http.get()
+
+            # Fetch the three independent periods concurrently. Each period records
+            # its errors in its own list, merged in 30d/6m/1y order so the reported
+            # errors do not depend on which request finished first.
+            # Only the 30d and 6m stories feed engagement metrics; the 1y window
+            # contributes just its nbHits count, so it asks for no stories at all.
+            periods = (
+                (thirty_days_ago, None, self.HITS_PER_PAGE),
+                (six_months_ago, thirty_days_ago, self.HITS_PER_PAGE),
+                (one_year_ago, six_months_ago, 0)
+            )
+            period_errors = ([], [], [])
+            data_30d, data_6m, data_1y = await asyncio.gather(*[
+                self._fetch_period(
+                    client, keyword, start_ts, end_ts, period_errors[i], expanded_terms, hits_per_page=hits_per_page
                 )
-
-                # If all requests failed, return error state
-                if all(d is None for d in [data_30d, data_6m, data_1y]):
-                    return self._error_response(keyword, collected_at, "All API requests failed", errors)
-
-                # Extract metrics from each period
-                mentions_30d = data_30d["nbHits"] if data_30d else 0
-                mentions_6m = data_6m["nbHits"] if data_6m else 0
-                mentions_1y = data_1y["nbHits"] if data_1y else 0
-
-                # Calculate engagement metrics for 30-day period
-                avg_points_30d = 0.0
-                avg_comments_30d = 0.0
-                top_stories = []
-
-                if data_30d and data_30d["hits"]:
-                    hits = data_30d["hits"]
-                    total_points = sum(h.get("points", 0) or 0 for h in hits)
-                    total_comments = sum(h.get("num_comments", 0) or 0 for h in hits)
-                    avg_points_30d = total_points / len(hits) if hits else 0.0
-                    avg_comments_30d = total_comments / len(hits) if hits else 0.0
-
-                    # Extract top stories for LLM context
-                    for hit in hits[:5]:
-                        age_days = (now.timestamp() - (hit.get("created_at_i") or now.timestamp())) / 86400
-                        top_stories.append({
-                            "title": hit.get("title", ""),
-                            "points": hit.get("points", 0) or 0,
-                            "comments": hit.get("num_comments", 0) or 0,
-                            "age_days": int(age_days)
-                        })
-
-                # Calculate engagement for 6-month period
-                avg_points_6m = 0.0
-                avg_comments_6m = 0.0
-
-                if data_6m and data_6m["hits"]:
-                    hits = data_6m["hits"]
-                    total_points = sum(h.get("points", 0) or 0 for h in hits)
-                    total_comments = sum(h.get("num_comments", 0) or 0 for h in hits)
-                    avg_points_6m = total_points / len(hits) if hits else 0.0
-                    avg_comments_6m = total_comments / len(hits) if hits else 0.0
-
-                # Calculate derived insights
-                sentiment = self._calculate_sentiment(avg_points_30d)
-                recency = self._calculate_recency(mentions_30d, mentions_6m, mentions_1y)
-                growth_trend = self._calculate_growth_trend(mentions_30d, mentions_6m, mentions_1y)
-                momentum = self._calculate_momentum(mentions_30d, mentions_6m, mentions_1y)
-
-                return {
-                    "source": "hacker_news",
-                    "collected_at": collected_at,
-                    "keyword": keyword,
-
-                    # Mention counts by time period
-                    "mentions_30d": mentions_30d,
-                    "mentions_6m": mentions_6m,
-                    "mentions_1y": mentions_1y,
-                    "mentions_total": mentions_30d + mentions_6m + mentions_1y,
-
-                    # Engagement metrics
-                    "avg_points_30d": round(avg_points_30d, 2),
-                    "avg_comments_30d": round(avg_comments_30d, 2),
-                    "avg_points_6m": round(avg_points_6m, 2),
-                    "avg_comments_6m": round(avg_comments_6m, 2),
-
-                    # Derived insights
-                    "sentiment": round(sentiment, 3),
-                    "recency": recency,
-                    "growth_trend": growth_trend,
-                    "momentum": momentum,
-
-                    # Context for LLM
-                    "top_stories": top_stories,
-
-                    # Error tracking
-                    "errors": errors
-                }
+                for i, (start_ts, end_ts, hits_per_page) in enumerate(periods)
+            ])
+            for period_error_list in period_errors:
+                errors.extend(period_error_list)
+
+            # If all requests failed, return error state
+            if all(d is None for d in [data_30d, data_6m, data_1y]):
+                return self._error_response(keyword, collected_at, "All API requests failed", errors)
+
+            # Extract metrics from each period
+            mentions_30d = data_30d["nbHits"] if data_30d else 0
+            mentions_6m = data_6m["nbHits"] if data_6m else 0
+            mentions_1y = data_1y["nbHits"] if data_1y else 0
+
+            # Calculate engagement metrics for 30-day and 6-month periods
+            avg_points_30d, avg_comments_30d = self._calculate_engagement(data_30d["hits"] if data_30d else ())
+            avg_points_6m, avg_comments_6m = self._calculate_engagement(data_6m["hits"] if data_6m else ())
+
+            # Extract top stories for LLM context
+            top_stories = []
+            if data_30d:
+                for hit in data_30d["hits"][:5]:
+                    age_days = (now_ts - (hit.get("created_at_i") or now_ts)) / DAY_SECONDS
+                    top_stories.append({
+                        "title": hit.get("title", ""),
+                        "points": hit.get("points", 0) or 0,
+                        "comments": hit.get("num_comments", 0) or 0,
+                        "age_days": int(age_days)
+                    })
+
+            # Calculate derived insights
+            sentiment = self._calculate_sentiment(avg_points_30d)
+            recency = self._calculate_recency(mentions_30d, mentions_6m, mentions_1y)
+            growth_trend = self._calculate_growth_trend(mentions_30d, mentions_6m, mentions_1y)
+            momentum = self._calculate_momentum(mentions_30d, mentions_6m, mentions_1y)
+
+            return {
+                "source": "hacker_news",
+                "collected_at": collected_at,
+                "keyword": keyword,
+
+                # Mention counts by time period
+                "mentions_30d": mentions_30d,
+                "mentions_6m": mentions_6m,
+                "mentions_1y": mentions_1y,
+                "mentions_total": mentions_30d + mentions_6m + mentions_1y,
+
+                # Engagement metrics
+                "avg_points_30d": round(avg_points_30d, 2),
+                "avg_comments_30d": round(avg_comments_30d, 2),
+                "avg_points_6m": round(avg_points_6m, 2),
+                "avg_comments_6m": round(avg_comments_6m, 2),
+
+                # Derived insights
+                "sentiment": round(sentiment, 3),
+                "recency": recency,
+                "growth_trend": growth_trend,
+                "momentum": momentum,
+
+                # Context for LLM
+                "top_stories": top_stories,
+
+                # Error tracking
+                "errors": errors
+            }
 
         except Exception as e:
             return self._error_response(
@@ -154,6 +172,11 @@ class SocialCollector(BaseCollector):
                 errors
             )
 
+    @staticmethod
+    def _hour_floor(ts: int) -> int:
+        """Unix timestamp truncated to the start of its hour"""
+        return ts - ts % 3600
+
     async def _fetch_period(
         self,
         client: httpx.AsyncClient,
@@ -161,10 +184,69 @@ class SocialCollector(BaseCollector):
         start_ts: int,
         end_ts: int | None,
         errors: List[str],
-        expanded_terms: Optional[List[str]] = None
+        expanded_terms: Optional[List[str]] = None,
+        *,
+        hits_per_page: int = HITS_PER_PAGE
     ) -> Dict[str, Any] | None:
         """
-        Fetch Hacker News data for a specific time period.
+        Fetch Hacker News data for a specific time period, using the response cache.
+
+        Successful responses are cached per (keyword, expanded terms, period, page
+        size) for CACHE_TTL_SECONDS; terms are lowercased for the key since search
+        is case-insensitive. Concurrent misses for the same key wait on a shared lock
+        so only one request reaches the API. A period that reported any error (e.g.
+        one expanded term failing) is returned but not cached, since its counts are
+        incomplete.
+
+        Args:
+            client: Async HTTP client
+            keyword: Search term
+            start_ts: Start timestamp (Unix)
+            end_ts: End timestamp (Unix), or None for "until now"
+            errors: List to append error messages to
+            expanded_terms: Optional list of related search terms
+            hits_per_page: Stories to return (0 fetches only the nbHits count)
+
+        Returns:
+            API response dict or None if request failed
+        """
+        cache_key = (
+            keyword.lower(),
+            tuple(sorted({term.lower() for term in expanded_terms})) if expanded_terms else (),
+            start_ts,
+            end_ts,
+            hits_per_page
+        )
+        period_errors: List[str] = []
+
+        async def fetch() -> Dict[str, Any] | None:
+            data = await self._request_period(
+                client, keyword, start_ts, end_ts, period_errors, expanded_terms, hits_per_page=hits_per_page
+            )
+            errors.extend(period_errors)
+            return data
+
+        return await cached_fetch(
+            self._response_cache,
+            self._cache_locks,
+            cache_key,
+            fetch,
+            cache_if=lambda data: not period_errors
+        )
+
+    async def _request_period(
+        self,
+        client: httpx.AsyncClient,
+        keyword: str,
+        start_ts: int,
+        end_ts: int | None,
+        errors: List[str],
+        expanded_terms: Optional[List[str]] = None,
+        *,
+        hits_per_page: int = HITS_PER_PAGE
+    ) -> Dict[str, Any] | None:
+        """
+        Request Hacker News data for a specific time period (uncached).
 
         When expanded_terms is provided, queries for keyword OR each expanded term,
         aggregating and deduplicating results by story ID.
@@ -176,28 +258,19 @@ class SocialCollector(BaseCollector):
             end_ts: End timestamp (Unix), or None for "until now"
             errors: List to append error messages to
             expanded_terms: Optional list of related search terms
+            hits_per_page: Stories to return (0 fetches only the nbHits count)
 
         Returns:
             API response dict or None if request failed
         """
         try:
-            # Build numeric filter for time range
-            if end_ts is None:
-                numeric_filter = f"created_at_i>{start_ts}"
-            else:
-                numeric_filter = f"created_at_i>{start_ts},created_at_i<{end_ts}"
+            # Build numeric filter for time range; only the query varies per term
+            numeric_filter = f"created_at_i>{start_ts}" + ("" if end_ts is None else f",created_at_i<{end_ts}")
+            base_params = {"tags": "story", "numericFilters": numeric_filter, "hitsPerPage": hits_per_page}
 
             # If no expanded terms, use single query (original behavior)
             if not expanded_terms:
-                response = await client.get(
-                    self.API_URL,
-                    params={
-                        "query": keyword,
-                        "tags": "story",
-                        "numericFilters": numeric_filter,
-                        "hitsPerPage": 20
-                    }
-                )
+                response = await client.get(self.API_URL, params={"query": keyword, **base_params})
                 response.raise_for_status()
                 return response.json()
 
@@ -211,15 +284,7 @@ class SocialCollector(BaseCollector):
 
             for term in terms_to_query:
                 try:
-                    response = await client.get(
-                        self.API_URL,
-                        params={
-                            "query": term,
-                            "tags": "story",
-                            "numericFilters": numeric_filter,
-                            "hitsPerPage": 20
-                        }
-                    )
+                    response = await client.get(self.API_URL, params={"query": term, **base_params})
                     response.raise_for_status()
                     data = response.json()
 
@@ -247,25 +312,53 @@ class SocialCollector(BaseCollector):
             else:
                 return None
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                errors.append("Rate limited")
-            else:
-                errors.append(f"HTTP {e.response.status_code}")
-            return None
-
-        except httpx.TimeoutException:
-            errors.append("Request timeout")
-            return None
-
-        except httpx.RequestError as e:
-            errors.append(f"Network error: {type(e).__name__}")
+        except httpx.HTTPError as e:
+            errors.append(self._describe_http_error(e))
             return None
 
         except Exception as e:
             errors.append(f"Unexpected error: {str(e)}")
             return None
 
+    @staticmethod
+    def _describe_http_error(error: httpx.HTTPError) -> str:
+        """
+        Describe an httpx failure as a collector error message.
+
+        Args:
+            error: Status, timeout or transport error raised by the request
+
+        Returns:
+            Error message for the errors list
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code == 429:
+                return "Rate limited"
+            return f"HTTP {error.response.status_code}"
+        if isinstance(error, httpx.TimeoutException):
+            return "Request timeout"
+        return f"Network error: {type(error).__name__}"
+
+    def _calculate_engagement(self, hits: List[Dict[str, Any]]) -> Tuple[float, float]:
+        """
+        Calculate average points and comments per story in a single pass.
+
+        Args:
+            hits: Stories returned for a period
+
+        Returns:
+            Tuple of (average points, average comments), both 0.0 when there are no stories
+        """
+        if not hits:
+            return 0.0, 0.0
+
+        total_points = 0
+        total_comments = 0
+        for hit in hits:
+            total_points += hit.get("points") or 0
+            total_comments += hit.get("num_comments") or 0
+        return total_points / len(hits), total_comments / len(hits)
+
     def _calculate_sentiment(self, avg_points: float) -> float:
         """
         Calculate sentiment score from engagement metrics.
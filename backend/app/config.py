@@ -1,5 +1,4 @@
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     # API Keys
@@ -24,11 +23,15 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # CORS: origins allowed to call the API (the frontend is served on port 3000)
+    cors_origins: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
+
+    # Settings are fixed for the life of the process
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
+
+# Loaded once at import
+settings = Settings()
 
-@lru_cache()
 def get_settings():
-    """Cached settings singleton"""
-    return Settings()
+    """Settings singleton (kept as a function so call sites can be patched in tests)"""
+    return settings
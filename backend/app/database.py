@@ -1,19 +1,109 @@
+import asyncio
 import aiosqlite
 from pathlib import Path
 
 DATABASE_PATH = Path(__file__).parent.parent.parent / "data" / "hype_cycle.db"
 
+# Per-connection settings for a read-heavy analysis cache. journal_mode=WAL is
+# persistent and set once in init_db(); with WAL, synchronous=NORMAL only fsyncs
+# at checkpoints and stays crash-safe (a power loss can drop the last commits).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB (negative values are KiB)
+    "PRAGMA busy_timeout=5000",  # Wait for a concurrent writer instead of failing with "database is locked"
+)
+
+# Long-lived connections shared by requests (each aiosqlite connection owns a
+# thread, so the pool also bounds the thread count). Filled by open_pool() at
+# startup; without it, get_db() falls back to a connection per request.
+POOL_SIZE = 8
+# An analysis holds its connection through every collector and the LLM call, so
+# once all pooled connections are busy, get_db() opens an overflow connection
+# after this many seconds instead of queueing behind them
+POOL_TIMEOUT = 0.5
+_pool: asyncio.Queue | None = None
+
+async def _configure(db: aiosqlite.Connection):
+    """Apply the per-connection pragmas"""
+    for pragma in _CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+
+async def _connect() -> aiosqlite.Connection:
+    """Open a configured connection"""
+    db = await aiosqlite.connect(DATABASE_PATH)
+    await _configure(db)
+    db.row_factory = aiosqlite.Row  # Access columns by name
+    return db
+
+async def open_pool(size: int = POOL_SIZE):
+    """Open the shared connection pool (called on application startup)"""
+    global _pool
+    pool = asyncio.Queue(maxsize=size)
+    for _ in range(size):
+        pool.put_nowait(await _connect())
+    _pool = pool
+
+async def close_pool():
+    """Close every pooled connection (called on application shutdown)"""
+    global _pool
+    pool, _pool = _pool, None
+    while pool is not None and not pool.empty():
+        await pool.get_nowait().close()
+
 async def get_db():
-    """Async context manager for database connections"""
-    async with aiosqlite.connect(DATABASE_PATH) as db:
-        db.row_factory = aiosqlite.Row  # Access columns by name
+    """
+    Async context manager for database connections, borrowed from the pool.
+
+    Falls back to a dedicated connection (closed after the request) when the pool
+    is not open or stays exhausted for POOL_TIMEOUT seconds.
+    """
+    pool = _pool
+    db = None
+    if pool is not None:
+        try:
+            db = await asyncio.wait_for(pool.get(), POOL_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+
+    if db is None:
+        db = await _connect()
+        try:
+            yield db
+        finally:
+            await db.close()
+        return
+
+    try:
         yield db
+    finally:
+        # Never hand the next request a connection left mid-transaction
+        if db.in_transaction:
+            await db.rollback()
+        if pool is _pool:
+            pool.put_nowait(db)
+        else:
+            await db.close()  # The pool was closed while this request held the connection
+
+# (schema version, column, definition) added to analyses after the initial schema
+_COLUMN_MIGRATIONS = (
+    (1, "per_source_analyses_data", "TEXT"),
+    (2, "query_expansion_applied", "INTEGER DEFAULT 0"),
+    (2, "expanded_terms_data", "TEXT"),
+)
+SCHEMA_VERSION = 2
 
 async def init_db():
     """Initialize database schema"""
     DATABASE_PATH.parent.mkdir(exist_ok=True)  # Ensure data/ exists
 
     async with aiosqlite.connect(DATABASE_PATH) as db:
+        # Readers no longer block the writer (and vice versa), and a commit is one
+        # WAL append instead of rewriting the rollback journal
+        await db.execute("PRAGMA journal_mode=WAL")
+        await _configure(db)
+
         await db.execute("""
             CREATE TABLE IF NOT EXISTS analyses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -31,21 +121,26 @@ async def init_db():
             )
         """)
 
-        # MIGRATION: Add per_source_analyses_data column if it doesn't exist
-        cursor = await db.execute("PRAGMA table_info(analyses)")
-        columns = await cursor.fetchall()
-        column_names = [col[1] for col in columns]
+        # Column migrations are tracked in PRAGMA user_version, so an up-to-date
+        # database costs one integer read at startup
+        cursor = await db.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
 
-        if "per_source_analyses_data" not in column_names:
-            await db.execute("ALTER TABLE analyses ADD COLUMN per_source_analyses_data TEXT")
+        if version < SCHEMA_VERSION:
+            # Databases created before user_version was tracked report 0 but may
+            # already have some of the columns, so check the schema this once
+            cursor = await db.execute("PRAGMA table_info(analyses)")
+            column_names = {col[1] for col in await cursor.fetchall()}
 
-        # MIGRATION: Add query expansion columns if they don't exist
-        if "query_expansion_applied" not in column_names:
-            await db.execute("ALTER TABLE analyses ADD COLUMN query_expansion_applied INTEGER DEFAULT 0")
+            for migration_version, column, definition in _COLUMN_MIGRATIONS:
+                if migration_version > version and column not in column_names:
+                    await db.execute(f"ALTER TABLE analyses ADD COLUMN {column} {definition}")
 
-        if "expanded_terms_data" not in column_names:
-            await db.execute("ALTER TABLE analyses ADD COLUMN expanded_terms_data TEXT")
+            await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_keyword ON analyses(keyword)")
+        # Cache lookups filter on keyword AND expires_at: one composite index seek.
+        # It also serves keyword-only lookups, so it replaces idx_keyword.
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_keyword_expires ON analyses(keyword, expires_at)")
+        await db.execute("DROP INDEX IF EXISTS idx_keyword")
         await db.execute("CREATE INDEX IF NOT EXISTS idx_expires ON analyses(expires_at)")
         await db.commit()
@@ -0,0 +1,109 @@
+"""
+Shared HTTP plumbing for collectors: process-wide keep-alive clients and a
+locked lookup for per-collector response caches.
+"""
+import asyncio
+import importlib.util
+import weakref
+from typing import Any, Awaitable, Callable, Hashable, List, MutableMapping, Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (httpx[http2]). When it is installed,
+# concurrent period/keyword requests multiplex over a few connections; httpx
+# falls back to HTTP/1.1 per connection if the server does not negotiate h2.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class SharedClient:
+    """
+    Process-wide httpx.AsyncClient for one external API, created lazily on first use.
+
+    Keep-alive connections are reused across collect() calls instead of paying a
+    TCP+TLS handshake per keyword. A closed client is recreated on the next get().
+    """
+
+    def __init__(self, timeout: float, limits: httpx.Limits):
+        """
+        Register the client settings; no connection is opened until get().
+
+        Args:
+            timeout: Request timeout in seconds
+            limits: Connection pool limits sized for the API's rate limit
+        """
+        self.timeout = timeout
+        self.limits = limits
+        self._client: httpx.AsyncClient | None = None
+        _shared_clients.append(self)
+
+    async def get(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it if it does not exist or was closed"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=HTTP2_AVAILABLE
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_shared_clients: List[SharedClient] = []
+
+
+async def close_clients() -> None:
+    """Close every shared client (called on application shutdown)"""
+    for shared in _shared_clients:
+        await shared.aclose()
+
+
+async def cached_fetch(
+    cache: MutableMapping[Hashable, Any],
+    locks: "weakref.WeakValueDictionary[Hashable, asyncio.Lock]",
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Optional[Any]]],
+    *,
+    force_refresh: bool = False,
+    cache_if: Optional[Callable[[Any], bool]] = None
+) -> Optional[Any]:
+    """
+    Return the cached value for key, or fetch and cache it.
+
+    Concurrent misses for the same key wait on a shared lock so only one fetch
+    reaches the API; the others then read its result from the cache. Locks are
+    held weakly and disappear once no caller is waiting on them.
+
+    Args:
+        cache: Response cache (e.g. a cachetools TTLCache)
+        locks: Per-key locks shared by the callers of this cache
+        key: Cache key
+        fetch: Coroutine function performing the request; None means it failed
+        force_refresh: Skip the cache lookup (a successful fetch is still stored)
+        cache_if: Optional predicate on the fetched value; when it returns False the
+            value is returned but not stored (e.g. a partial result)
+
+    Returns:
+        Cached or fetched value, or None if the fetch failed
+    """
+    if not force_refresh:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    lock = locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another request may have filled the cache while we waited
+        if not force_refresh:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        value = await fetch()
+        if value is not None and (cache_if is None or cache_if(value)):
+            cache[key] = value
+        return value
@@ -0,0 +1,152 @@
+"""
+Rate and concurrency limiting helpers for collectors that call rate-limited external APIs.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Optional
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit using additive-increase / multiplicative-decrease.
+
+    Behaves like an asyncio.Semaphore whose size changes at runtime: each
+    successful unit of work raises the limit by one (up to maximum), and each
+    throttling signal (e.g. HTTP 429) halves it (down to minimum). Work already
+    in flight is never cancelled; a lowered limit only delays new acquisitions.
+    """
+
+    def __init__(self, initial: int = 4, maximum: int = 16, minimum: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            maximum: Upper bound reached through successes
+            minimum: Lower bound reached through throttling
+        """
+        self._minimum = minimum
+        self._maximum = maximum
+        self._limit = max(minimum, min(initial, maximum))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit, then take it"""
+        while self._in_flight >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # Woken for a free slot but cancelled before taking it: pass it on
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Return a slot taken by acquire()"""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def on_success(self) -> None:
+        """Additive increase: allow one more concurrent unit of work"""
+        if self._limit < self._maximum:
+            self._limit += 1
+            self._wake_waiters()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease: halve the limit after the API pushes back"""
+        self._limit = max(self._minimum, self._limit // 2)
+
+    def _wake_waiters(self) -> None:
+        """Wake as many waiters as there are free slots"""
+        free = self._limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class TokenBucket:
+    """
+    Async token bucket that paces calls to a sustained rate with bounded bursts.
+
+    acquire() reserves a token immediately and, if the bucket is in deficit,
+    sleeps until that token would have been refilled. Because every caller
+    reserves before sleeping, concurrent callers queue up in arrival order
+    without a lock or polling loop.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens refilled per second (sustained requests per second)
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the refill if none is available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def reset(self) -> None:
+        """Refill the bucket completely"""
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
+
+def retry_delay(attempt: int, maximum: float, retry_after: Optional[str] = None) -> float:
+    """
+    Calculate how long to wait before retrying a failed request.
+
+    Exponential backoff (1s, 2s, 4s, ...) with up to 1s of jitter so concurrent
+    callers do not retry in lockstep, extended to the server's Retry-After when
+    that is longer. The result never exceeds maximum, so a huge Retry-After
+    cannot stall a caller past its own timeout.
+
+    Args:
+        attempt: Zero-based attempt number that failed
+        maximum: Upper bound on the delay in seconds
+        retry_after: Retry-After header value of the failed response, if any
+
+    Returns:
+        Delay in seconds
+    """
+    delay = 2 ** attempt + random.random()
+
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except (TypeError, ValueError):
+            # HTTP-date Retry-After: keep the computed backoff
+            pass
+    return min(maximum, delay)
@@ -0,0 +1,180 @@
+"""
+Unit tests for the SQLite connection pool and schema initialization.
+Tests run against a temporary DATABASE_PATH so the real cache is never touched.
+"""
+import asyncio
+import contextlib
+import aiosqlite
+import pytest
+
+from unittest.mock import patch
+
+from app import database
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Point DATABASE_PATH at a fresh file in a temporary directory"""
+    path = tmp_path / "data" / "hype_cycle.db"
+    with patch.object(database, "DATABASE_PATH", path):
+        yield path
+
+
+@pytest.mark.asyncio
+async def test_get_db_overflows_when_pool_is_exhausted(temp_db):
+    """Test that more concurrent borrowers than POOL_SIZE get connections instead of queueing"""
+    await database.init_db()
+    await database.open_pool(size=2)
+    borrow = contextlib.asynccontextmanager(database.get_db)
+    in_use = 0
+    peak = 0
+
+    async def borrower():
+        nonlocal in_use, peak
+        async with borrow() as db:
+            in_use += 1
+            peak = max(peak, in_use)
+            async with db.execute("SELECT 1") as cursor:
+                assert (await cursor.fetchone())[0] == 1
+            await asyncio.sleep(0.2)
+            in_use -= 1
+
+    try:
+        with patch.object(database, "POOL_TIMEOUT", 0.01):
+            await asyncio.wait_for(asyncio.gather(*[borrower() for _ in range(5)]), timeout=5)
+
+        # Overflow connections ran alongside the pooled ones and were closed, not pooled
+        assert peak == 5
+        assert database._pool.qsize() == 2
+    finally:
+        await database.close_pool()
+
+
+@pytest.mark.asyncio
+async def test_get_db_without_pool_opens_dedicated_connection(temp_db):
+    """Test that get_db works before open_pool() and closes its connection afterwards"""
+    await database.init_db()
+    borrow = contextlib.asynccontextmanager(database.get_db)
+
+    async with borrow() as db:
+        async with db.execute("SELECT 1") as cursor:
+            assert (await cursor.fetchone())[0] == 1
+
+    with pytest.raises(ValueError):
+        await db.execute("SELECT 1")
+
+
+async def _columns(path):
+    """Column names of the analyses table"""
+    async with aiosqlite.connect(path) as db:
+        cursor = await db.execute("PRAGMA table_info(analyses)")
+        return {col[1] for col in await cursor.fetchall()}
+
+
+async def _user_version(path):
+    """Schema version recorded in PRAGMA user_version"""
+    async with aiosqlite.connect(path) as db:
+        cursor = await db.execute("PRAGMA user_version")
+        return (await cursor.fetchone())[0]
+
+
+@pytest.mark.asyncio
+async def test_init_db_creates_fresh_database_at_current_version(temp_db):
+    """Test that a new database gets every migrated column and the current user_version"""
+    await database.init_db()
+
+    columns = await _columns(temp_db)
+    assert {column for _, column, _ in database._COLUMN_MIGRATIONS} <= columns
+    assert await _user_version(temp_db) == database.SCHEMA_VERSION
+
+
+@pytest.mark.asyncio
+async def test_init_db_migrates_partially_migrated_legacy_database(temp_db):
+    """Test that a pre-user_version database with some columns gets only the missing ones"""
+    temp_db.parent.mkdir()
+    async with aiosqlite.connect(temp_db) as db:
+        await db.execute("""
+            CREATE TABLE analyses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                keyword TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                phase TEXT NOT NULL,
+                confidence REAL,
+                reasoning TEXT,
+                social_data TEXT,
+                papers_data TEXT,
+                patents_data TEXT,
+                news_data TEXT,
+                finance_data TEXT,
+                expires_at TIMESTAMP,
+                per_source_analyses_data TEXT
+            )
+        """)
+        await db.execute("INSERT INTO analyses (keyword, phase) VALUES ('quantum computing', 'peak')")
+        await db.commit()
+    assert await _user_version(temp_db) == 0
+
+    await database.init_db()
+
+    columns = await _columns(temp_db)
+    assert {"per_source_analyses_data", "query_expansion_applied", "expanded_terms_data"} <= columns
+    assert await _user_version(temp_db) == database.SCHEMA_VERSION
+    async with aiosqlite.connect(temp_db) as db:
+        cursor = await db.execute("SELECT keyword, query_expansion_applied FROM analyses")
+        assert await cursor.fetchall() == [("quantum computing", 0)]
+
+
+@pytest.mark.asyncio
+async def test_init_db_is_idempotent(temp_db):
+    """Test that running init_db on an up-to-date database changes nothing and skips migrations"""
+    await database.init_db()
+    columns = await _columns(temp_db)
+
+    with patch.object(database, "_COLUMN_MIGRATIONS", (
+        (database.SCHEMA_VERSION, "must_not_be_added", "TEXT"),
+    )):
+        await database.init_db()
+
+    assert await _columns(temp_db) == columns
+    assert await _user_version(temp_db) == database.SCHEMA_VERSION
+
+
+async def _indexes(path):
+    """Index names defined on the analyses table"""
+    async with aiosqlite.connect(path) as db:
+        cursor = await db.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'analyses'")
+        return {row[0] for row in await cursor.fetchall()}
+
+
+@pytest.mark.asyncio
+async def test_init_db_replaces_keyword_index_with_composite_index(temp_db):
+    """Test that the legacy idx_keyword is dropped in favor of idx_keyword_expires"""
+    await database.init_db()
+    async with aiosqlite.connect(temp_db) as db:
+        await db.execute("CREATE INDEX idx_keyword ON analyses(keyword)")
+        await db.commit()
+
+    await database.init_db()
+
+    indexes = await _indexes(temp_db)
+    assert {"idx_keyword_expires", "idx_expires"} <= indexes
+    assert "idx_keyword" not in indexes
+
+    # Cache lookups filter on keyword and expires_at, so they seek the composite index
+    async with aiosqlite.connect(temp_db) as db:
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM analyses WHERE keyword = ? AND expires_at > ?",
+            ("quantum computing", "2026-01-01")
+        )
+        plan = " ".join(row[-1] for row in await cursor.fetchall())
+    assert "idx_keyword_expires" in plan
+
+
+@pytest.mark.asyncio
+async def test_init_db_enables_wal_journal_mode(temp_db):
+    """Test that init_db switches the database to WAL, which persists for later connections"""
+    await database.init_db()
+
+    async with aiosqlite.connect(temp_db) as db:
+        cursor = await db.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
@@ -0,0 +1,73 @@
+"""
+Unit tests for the shared HTTP helpers used by collectors.
+Tests cover the locked cache lookup: single-flight fetches, failures, forced refreshes, and partial results.
+"""
+import asyncio
+import weakref
+import pytest
+
+from app.utils.http import cached_fetch
+
+
+@pytest.mark.asyncio
+async def test_cached_fetch_runs_one_fetch_for_concurrent_misses():
+    """Test that concurrent misses for one key share a single fetch"""
+    cache, locks = {}, weakref.WeakValueDictionary()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"total": 1}
+
+    results = await asyncio.gather(*[cached_fetch(cache, locks, "key", fetch) for _ in range(5)])
+
+    assert calls == 1
+    assert all(result == {"total": 1} for result in results)
+    assert cache["key"] == {"total": 1}
+
+
+@pytest.mark.asyncio
+async def test_cached_fetch_does_not_cache_failures():
+    """Test that a failed fetch (None) is not stored, so the next call retries"""
+    cache, locks = {}, weakref.WeakValueDictionary()
+    responses = iter([None, {"total": 2}])
+
+    async def fetch():
+        return next(responses)
+
+    assert await cached_fetch(cache, locks, "key", fetch) is None
+    assert "key" not in cache
+    assert await cached_fetch(cache, locks, "key", fetch) == {"total": 2}
+
+
+@pytest.mark.asyncio
+async def test_cached_fetch_force_refresh_replaces_cached_value():
+    """Test that force_refresh skips the cached value but stores the fresh one"""
+    cache, locks = {"key": {"total": 1}}, weakref.WeakValueDictionary()
+
+    async def fetch():
+        return {"total": 3}
+
+    assert await cached_fetch(cache, locks, "key", fetch) == {"total": 1}
+    assert await cached_fetch(cache, locks, "key", fetch, force_refresh=True) == {"total": 3}
+    assert cache["key"] == {"total": 3}
+
+
+@pytest.mark.asyncio
+async def test_cached_fetch_skips_store_when_cache_if_rejects():
+    """Test that a value rejected by cache_if is returned but fetched again next time"""
+    cache, locks = {}, weakref.WeakValueDictionary()
+    responses = iter([{"total": 1, "partial": True}, {"total": 2}])
+
+    async def fetch():
+        return next(responses)
+
+    def complete(data):
+        return not data.get("partial")
+
+    assert await cached_fetch(cache, locks, "key", fetch, cache_if=complete) == {"total": 1, "partial": True}
+    assert "key" not in cache
+    assert await cached_fetch(cache, locks, "key", fetch, cache_if=complete) == {"total": 2}
+    assert cache["key"] == {"total": 2}
@@ -3,10 +3,12 @@ Unit tests for PapersCollector (Semantic Scholar data collector).
 Tests cover successful collection, error handling, and edge cases.
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 import httpx
 import json
+import orjson
+from collections import Counter
 
 from app.collectors.papers import PapersCollector
 
@@ -20,6 +22,36 @@ def mock_settings():
         yield mock_settings_obj
 
 
+@pytest.fixture
+def no_retry_sleep():
+    """Skip retry backoff and rate-limit pacing delays"""
+    with patch("app.collectors.papers.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def no_pacing():
+    """Disable rate-limit pacing so sleep assertions only see retry backoff"""
+    with patch("app.utils.rate_limit.TokenBucket.acquire", new_callable=AsyncMock):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty Semantic Scholar response cache"""
+    PapersCollector._response_cache.clear()
+    yield
+    PapersCollector._response_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_buckets():
+    """Start every test with full rate-limit buckets so earlier tests do not cause pacing delays"""
+    for bucket in PapersCollector._rate_buckets.values():
+        bucket.reset()
+    yield
+
+
 @pytest.mark.asyncio
 async def test_papers_collector_success():
     """Test successful data collection with typical API responses"""
@@ -108,9 +140,9 @@ async def test_papers_collector_success():
     with patch("httpx.AsyncClient.get") as mock_get:
         # Configure mock to return different responses for each call (3 periods now)
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("quantum computing")
@@ -169,7 +201,7 @@ async def test_papers_collector_success():
 
 
 @pytest.mark.asyncio
-async def test_papers_collector_rate_limit():
+async def test_papers_collector_rate_limit(no_retry_sleep):
     """Test graceful handling of API rate limiting (429 error)"""
     collector = PapersCollector()
 
@@ -191,11 +223,14 @@ async def test_papers_collector_rate_limit():
         assert result["publications_2y"] == 0
         assert "Rate limited" in result["errors"]
         assert result["research_maturity"] == "unknown"
+
+        # Each period is retried before giving up
+        assert mock_get.call_count == 3 * PapersCollector.MAX_RETRIES
         assert result["research_trend"] == "unknown"
 
 
 @pytest.mark.asyncio
-async def test_papers_collector_timeout():
+async def test_papers_collector_timeout(no_retry_sleep):
     """Test graceful handling of request timeout"""
     collector = PapersCollector()
 
@@ -209,9 +244,12 @@ async def test_papers_collector_timeout():
         assert result["publications_2y"] == 0
         assert "Request timeout" in result["errors"]
 
+        # Timeouts are retried before being reported
+        assert mock_get.call_count == 3 * PapersCollector.MAX_RETRIES
+
 
 @pytest.mark.asyncio
-async def test_papers_collector_network_error():
+async def test_papers_collector_network_error(no_retry_sleep):
     """Test graceful handling of network errors"""
     collector = PapersCollector()
 
@@ -225,6 +263,25 @@ async def test_papers_collector_network_error():
         assert result["publications_2y"] == 0
         assert any("Network error" in e for e in result["errors"])
 
+        # Connection failures are retried like timeouts (same policy as patents)
+        assert mock_get.call_count == 3 * PapersCollector.MAX_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_recovers_from_transient_connection_error(no_retry_sleep, no_pacing):
+    """Test that a dropped connection is retried and the period still succeeds"""
+    collector = PapersCollector()
+    ok = Mock(content=orjson.dumps({"total": 4, "data": []}), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.side_effect = [httpx.ConnectError("Connection reset"), ok, ok, ok]
+
+        result = await collector.collect("test keyword")
+
+    assert result["errors"] == []
+    assert result["publications_2y"] == 4
+    assert len(no_retry_sleep.await_args_list) == 1
+
 
 @pytest.mark.asyncio
 async def test_papers_collector_zero_results():
@@ -239,9 +296,9 @@ async def test_papers_collector_zero_results():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_empty), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_empty), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_empty), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_empty), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_empty), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_empty), raise_for_status=Mock())
         ]
 
         result = await collector.collect("obscure_tech_xyz")
@@ -256,7 +313,7 @@ async def test_papers_collector_zero_results():
 
 
 @pytest.mark.asyncio
-async def test_papers_collector_partial_failure():
+async def test_papers_collector_partial_failure(no_retry_sleep):
     """Test handling when some API calls succeed and others fail"""
     collector = PapersCollector()
 
@@ -280,11 +337,11 @@ async def test_papers_collector_partial_failure():
     mock_response_error.status_code = 500
 
     with patch("httpx.AsyncClient.get") as mock_get:
-        # First call succeeds, second and third fail
+        # First call succeeds, second and third periods fail on every attempt
+        server_error = httpx.HTTPStatusError("500 Server Error", request=Mock(), response=mock_response_error)
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_success), raise_for_status=Mock()),
-            httpx.HTTPStatusError("500 Server Error", request=Mock(), response=mock_response_error),
-            httpx.HTTPStatusError("500 Server Error", request=Mock(), response=mock_response_error)
+            Mock(content=orjson.dumps(mock_response_success), raise_for_status=Mock()),
+            *[server_error] * (2 * PapersCollector.MAX_RETRIES)
         ]
 
         result = await collector.collect("test keyword")
@@ -319,8 +376,8 @@ async def test_papers_collector_citation_velocity_positive():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_recent_high), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_historical_low), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_recent_high), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_historical_low), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test")
@@ -350,8 +407,8 @@ async def test_papers_collector_citation_velocity_negative():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_recent_low), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_historical_high), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_recent_low), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_historical_high), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test")
@@ -374,9 +431,9 @@ async def test_papers_collector_research_maturity_mature():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_high), raise_for_status=Mock()),
-            Mock(json=Mock(return_value={"total": 200, "data": [{"publicationTypes": ["JournalArticle"]}] * 20}, raise_for_status=Mock())),
-            Mock(json=Mock(return_value={"total": 150, "data": [{"publicationTypes": ["JournalArticle"]}] * 15}, raise_for_status=Mock()))
+            Mock(content=orjson.dumps(mock_response_high), raise_for_status=Mock()),
+            Mock(content=orjson.dumps({"total": 200, "data": [{"publicationTypes": ["JournalArticle"]}] * 20}), raise_for_status=Mock()),
+            Mock(content=orjson.dumps({"total": 150, "data": [{"publicationTypes": ["JournalArticle"]}] * 15}), raise_for_status=Mock())
         ]
 
         result = await collector.collect("mature tech")
@@ -398,8 +455,8 @@ async def test_papers_collector_research_maturity_emerging():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_low), raise_for_status=Mock()),
-            Mock(json=Mock(return_value={"total": 3, "data": []}, raise_for_status=Mock()))
+            Mock(content=orjson.dumps(mock_response_low), raise_for_status=Mock()),
+            Mock(content=orjson.dumps({"total": 3, "data": []}), raise_for_status=Mock())
         ]
 
         result = await collector.collect("emerging tech")
@@ -414,8 +471,8 @@ async def test_papers_collector_momentum_accelerating():
     # Recent period has much higher publication rate
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value={"total": 100, "data": []}), raise_for_status=Mock()),  # 2y: 50/year
-            Mock(json=Mock(return_value={"total": 50, "data": []}), raise_for_status=Mock())   # 5y: 10/year
+            Mock(content=orjson.dumps({"total": 100, "data": []}), raise_for_status=Mock()),  # 2y: 50/year
+            Mock(content=orjson.dumps({"total": 50, "data": []}), raise_for_status=Mock())   # 5y: 10/year
         ]
 
         result = await collector.collect("growing field")
@@ -431,8 +488,8 @@ async def test_papers_collector_momentum_decelerating():
     # Recent period has much lower publication rate
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value={"total": 10, "data": []}), raise_for_status=Mock()),   # 2y: 5/year
-            Mock(json=Mock(return_value={"total": 200, "data": []}), raise_for_status=Mock())  # 5y: 40/year
+            Mock(content=orjson.dumps({"total": 10, "data": []}), raise_for_status=Mock()),   # 2y: 5/year
+            Mock(content=orjson.dumps({"total": 200, "data": []}), raise_for_status=Mock())  # 5y: 40/year
         ]
 
         result = await collector.collect("declining field")
@@ -447,8 +504,8 @@ async def test_papers_collector_trend_increasing():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value={"total": 100, "data": []}), raise_for_status=Mock()),  # 2y
-            Mock(json=Mock(return_value={"total": 50, "data": []}), raise_for_status=Mock())   # 5y
+            Mock(content=orjson.dumps({"total": 100, "data": []}), raise_for_status=Mock()),  # 2y
+            Mock(content=orjson.dumps({"total": 50, "data": []}), raise_for_status=Mock())   # 5y
         ]
 
         result = await collector.collect("increasing field")
@@ -462,8 +519,8 @@ async def test_papers_collector_trend_decreasing():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value={"total": 10, "data": []}), raise_for_status=Mock()),   # 2y
-            Mock(json=Mock(return_value={"total": 200, "data": []}), raise_for_status=Mock())  # 5y
+            Mock(content=orjson.dumps({"total": 10, "data": []}), raise_for_status=Mock()),   # 2y
+            Mock(content=orjson.dumps({"total": 200, "data": []}), raise_for_status=Mock())  # 5y
         ]
 
         result = await collector.collect("decreasing field")
@@ -503,8 +560,8 @@ async def test_papers_collector_breadth_broad():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value={"total": 5, "data": []}), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_diverse), raise_for_status=Mock())
+            Mock(content=orjson.dumps({"total": 5, "data": []}), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_diverse), raise_for_status=Mock())
         ]
 
         result = await collector.collect("broad field")
@@ -535,8 +592,8 @@ async def test_papers_collector_json_serializable():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response), raise_for_status=Mock()),
-            Mock(json=Mock(return_value={"total": 5, "data": []}), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response), raise_for_status=Mock()),
+            Mock(content=orjson.dumps({"total": 5, "data": []}), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test")
@@ -567,8 +624,8 @@ async def test_papers_collector_missing_fields():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_incomplete), raise_for_status=Mock()),
-            Mock(json=Mock(return_value={"total": 0, "data": []}), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_incomplete), raise_for_status=Mock()),
+            Mock(content=orjson.dumps({"total": 0, "data": []}), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test")
@@ -618,9 +675,9 @@ async def test_papers_collector_10y_period_fetching():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("quantum computing")
@@ -666,9 +723,9 @@ async def test_papers_collector_author_aggregation():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test keyword")
@@ -704,9 +761,9 @@ async def test_papers_collector_no_institution_field():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test keyword")
@@ -743,9 +800,9 @@ async def test_papers_collector_paper_type_distribution():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test keyword")
@@ -787,9 +844,9 @@ async def test_papers_collector_enhanced_maturity_with_high_review_percentage():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test keyword")
@@ -820,9 +877,9 @@ async def test_papers_collector_enhanced_maturity_with_high_conference_percentag
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("test keyword")
@@ -834,7 +891,7 @@ async def test_papers_collector_enhanced_maturity_with_high_conference_percentag
 
 
 @pytest.mark.asyncio
-async def test_papers_collector_partial_data_with_10y_failure():
+async def test_papers_collector_partial_data_with_10y_failure(no_retry_sleep):
     """Test graceful handling when 10y period fails but 2y and 5y succeed"""
     collector = PapersCollector()
 
@@ -846,13 +903,13 @@ async def test_papers_collector_partial_data_with_10y_failure():
 
     with patch("httpx.AsyncClient.get") as mock_get:
         mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            httpx.HTTPStatusError(
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            *[httpx.HTTPStatusError(
                 "429 Rate Limited",
                 request=Mock(),
                 response=mock_response_10y_error
-            )
+            )] * PapersCollector.MAX_RETRIES
         ]
 
         result = await collector.collect("quantum computing")
@@ -870,3 +927,556 @@ async def test_papers_collector_partial_data_with_10y_failure():
 
         # Should track the error
         assert "Rate limited" in result["errors"]
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_reuses_shared_client():
+    """Test that the shared HTTP client is reused across calls and recreated after close"""
+    from app.utils.http import close_clients
+
+    client_a = await PapersCollector._http.get()
+    client_b = await PapersCollector._http.get()
+    assert client_a is client_b
+
+    await PapersCollector._http.aclose()
+    assert client_a.is_closed
+
+    client_c = await PapersCollector._http.get()
+    assert client_c is not client_a
+    await close_clients()
+    assert client_c.is_closed
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_sends_api_key_header(mock_settings, no_retry_sleep):
+    """Test that the configured API key is sent as x-api-key on every request"""
+    mock_settings.semantic_scholar_api_key = "s2-test-key"
+    collector = PapersCollector()
+
+    mock_response = {"total": 0, "data": []}
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps(mock_response), raise_for_status=Mock())
+
+        await collector.collect("test keyword")
+
+        assert mock_get.call_count == 3
+        for call in mock_get.call_args_list:
+            assert call.kwargs["headers"] == {"x-api-key": "s2-test-key"}
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_top_papers_limited_to_five_most_cited():
+    """Test that top_papers keeps the 5 most cited papers in descending order"""
+    collector = PapersCollector()
+
+    citations = [3, 40, None, 12, 40, 7, 25, 1]
+    papers = [
+        {"title": f"Paper {i}", "citationCount": c, "authors": []}
+        for i, c in enumerate(citations)
+    ]
+    mock_response_2y = {"total": len(papers), "data": papers}
+    mock_response_empty = {"total": 0, "data": []}
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.side_effect = [
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_empty), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_empty), raise_for_status=Mock())
+        ]
+
+        result = await collector.collect("test keyword")
+
+        # Ties keep their original order (Paper 1 before Paper 4)
+        assert [p["title"] for p in result["top_papers"]] == [
+            "Paper 1", "Paper 4", "Paper 6", "Paper 3", "Paper 5"
+        ]
+        assert [p["citations"] for p in result["top_papers"]] == [40, 40, 25, 12, 7]
+        assert result["avg_citations_2y"] == 16.0  # 128 / 8, None counted as 0
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_collect_many_bounded_concurrency():
+    """Test that collect_many preserves order and respects the concurrency limit"""
+    import asyncio
+
+    collector = PapersCollector()
+    active = 0
+    peak = 0
+
+    async def fake_collect(keyword, expanded_terms=None, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"keyword": keyword}
+
+    with patch.object(collector, "collect", side_effect=fake_collect):
+        keywords = [f"keyword {i}" for i in range(7)]
+        results = await collector.collect_many(keywords, concurrency=3)
+
+    assert [r["keyword"] for r in results] == keywords
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_caches_period_responses(no_retry_sleep):
+    """Test that repeated collections for the same keyword are served from cache"""
+    collector = PapersCollector()
+
+    mock_response = {"total": 10, "data": [{"title": "Cached Paper", "citationCount": 4, "authors": []}]}
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps(mock_response), raise_for_status=Mock())
+
+        first = await collector.collect("quantum computing")
+        second = await PapersCollector().collect("quantum computing")
+
+        assert mock_get.call_count == 3  # One request per period, none on the second run
+        assert second["publications_total"] == first["publications_total"] == 30
+
+        # Expanded terms are part of the cache key
+        await collector.collect("quantum computing", expanded_terms=["qubits", "quantum gates"])
+        assert mock_get.call_count == 6
+
+        # Keyword case and expanded term order are normalized
+        await collector.collect("Quantum Computing", expanded_terms=["Quantum Gates", "qubits"])
+        assert mock_get.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_concurrent_misses_share_request():
+    """Test that concurrent collections of the same keyword issue one request per period"""
+    import asyncio
+
+    mock_response = {"total": 5, "data": []}
+
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return Mock(content=orjson.dumps(mock_response), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get", side_effect=slow_get) as mock_get:
+        results = await asyncio.gather(
+            PapersCollector().collect("edge computing"),
+            PapersCollector().collect("edge computing")
+        )
+
+    assert mock_get.call_count == 3
+    assert all(r["publications_2y"] == 5 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_does_not_cache_failures(no_retry_sleep):
+    """Test that failed period requests are retried on the next collection"""
+    mock_response_error = Mock()
+    mock_response_error.status_code = 500
+    mock_response = {"total": 5, "data": []}
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.side_effect = httpx.HTTPStatusError(
+            "500 Server Error", request=Mock(), response=mock_response_error
+        )
+        failed = await PapersCollector().collect("test keyword")
+        assert failed["research_maturity"] == "unknown"
+
+        mock_get.side_effect = None
+        mock_get.return_value = Mock(content=orjson.dumps(mock_response), raise_for_status=Mock())
+        result = await PapersCollector().collect("test keyword")
+        assert result["publications_2y"] == 5
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_requests_fields_per_period():
+    """Test that each period only requests the fields it aggregates"""
+    collector = PapersCollector()
+    current_year = datetime.now().year
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps({"total": 0, "data": []}), raise_for_status=Mock())
+        await collector.collect("test keyword")
+
+    fields_by_year = {
+        call.kwargs["params"]["year"]: call.kwargs["params"]["fields"].split(",")
+        for call in mock_get.call_args_list
+    }
+    fields_2y = fields_by_year[f"{current_year - 2}-{current_year - 2}"]
+    fields_10y = fields_by_year[f"{current_year - 12}-{current_year - 9}"]
+
+    assert "paperId" not in fields_2y
+    assert "title" in fields_2y and "venue" in fields_2y
+    assert "title" not in fields_10y and "venue" not in fields_10y
+    assert all("authors" in f and "publicationTypes" in f for f in fields_by_year.values())
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_shared_client_uses_http2_when_available():
+    """Test that the shared client enables HTTP/2 only when h2 is installed"""
+    await PapersCollector._http.aclose()
+    with patch("app.utils.http.HTTP2_AVAILABLE", False):
+        client = await PapersCollector._http.get()
+        assert client._transport._pool._http2 is False
+    await PapersCollector._http.aclose()
+
+    pytest.importorskip("h2")
+    with patch("app.utils.http.HTTP2_AVAILABLE", True):
+        client = await PapersCollector._http.get()
+        assert client._transport._pool._http2 is True
+    await PapersCollector._http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_retries_rate_limit_with_retry_after(no_retry_sleep, no_pacing):
+    """Test that a transient 429 is retried after Retry-After instead of dropping the period"""
+    collector = PapersCollector()
+
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "2"})
+    ok = Mock(content=orjson.dumps({"total": 7, "data": []}), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.side_effect = [
+            httpx.HTTPStatusError("429 Rate Limited", request=Mock(), response=rate_limited),
+            ok,
+            ok,
+            ok
+        ]
+
+        result = await collector.collect("test keyword")
+
+    assert result["publications_2y"] == 7
+    assert result["errors"] == []
+    delay = no_retry_sleep.await_args.args[0]
+    assert 2.0 <= delay < 3.0
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_caps_huge_retry_after(no_retry_sleep, no_pacing):
+    """Test that a very long Retry-After is capped at MAX_RETRY_DELAY"""
+    collector = PapersCollector()
+
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "3600"})
+    ok = Mock(content=orjson.dumps({"total": 7, "data": []}), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.side_effect = [
+            httpx.HTTPStatusError("429 Rate Limited", request=Mock(), response=rate_limited),
+            ok,
+            ok,
+            ok
+        ]
+
+        result = await collector.collect("test keyword")
+
+    assert result["publications_2y"] == 7
+    assert no_retry_sleep.await_args.args[0] == PapersCollector.MAX_RETRY_DELAY
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_server_error_uses_exponential_backoff(no_retry_sleep, no_pacing):
+    """Test that 5xx responses back off exponentially with jitter and report after the last attempt"""
+    collector = PapersCollector()
+
+    server_error = httpx.HTTPStatusError(
+        "503 Service Unavailable", request=Mock(), response=Mock(status_code=503)
+    )
+
+    with patch("httpx.AsyncClient.get", side_effect=server_error):
+        result = await collector.collect("test keyword")
+
+    assert result["errors"].count("HTTP 503") == 3
+    delays = sorted(call.args[0] for call in no_retry_sleep.await_args_list)
+    assert len(delays) == 3 * (PapersCollector.MAX_RETRIES - 1)
+
+    # 2**attempt plus up to one second of jitter, for each period
+    for delay, base in zip(delays, sorted([1, 2, 4] * 3)):
+        assert base <= delay < base + 1
+
+
+def test_papers_collector_summarizes_requested_paper_keys():
+    """Test that _summarize reads only the fields requested per period (_PAPER_KEYS)"""
+    collector = PapersCollector()
+    papers = [
+        {
+            "citationCount": i % 50,
+            "influentialCitationCount": i % 5,
+            "authors": [{"authorId": str(i % 3), "name": f"Author {i % 3}"}],
+            "venue": f"Venue {i % 4}",
+            "title": f"Paper {i}",
+            "year": 2020,
+            "publicationTypes": ["JournalArticle"]
+        }
+        for i in range(10)
+    ]
+    assert set(papers[0]) == set(PapersCollector._PAPER_KEYS)
+
+    summary = collector._summarize(papers, want_top=True, want_breadth=True)
+
+    assert summary["n"] == 10
+    assert summary["total_citations"] == sum(range(10))
+    assert len(summary["venue_counts"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_collect_many_backs_off_on_rate_limit(no_retry_sleep):
+    """Test that 429s seen during collect_many halve the adaptive concurrency limit"""
+    from app.utils.rate_limit import AIMDLimiter
+
+    collector = PapersCollector()
+    rate_limited = httpx.HTTPStatusError(
+        "429 Rate Limited", request=Mock(), response=Mock(status_code=429, headers={})
+    )
+    throttles = []
+    original_on_throttle = AIMDLimiter.on_throttle
+
+    def record_throttle(limiter):
+        original_on_throttle(limiter)
+        throttles.append(limiter.limit)
+
+    with patch("httpx.AsyncClient.get", side_effect=rate_limited), \
+            patch.object(AIMDLimiter, "on_throttle", record_throttle):
+        results = await collector.collect_many(["keyword a", "keyword b"], concurrency=8, initial_concurrency=4)
+
+    assert all("Rate limited" in r["errors"] for r in results)
+    # Each keyword halves the limit once (4 -> 2 -> 1), not once per 429 response
+    assert throttles == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_overlapping_collect_many_use_separate_limiters(no_retry_sleep):
+    """Test that concurrent batches on one collector only throttle their own limiter"""
+    import asyncio
+    from app.utils.rate_limit import AIMDLimiter
+
+    collector = PapersCollector()
+    rate_limited = httpx.HTTPStatusError(
+        "429 Rate Limited", request=Mock(), response=Mock(status_code=429, headers={})
+    )
+    ok = Mock(content=orjson.dumps({"total": 1, "data": []}), raise_for_status=Mock())
+
+    async def fake_get(url, params=None, headers=None):
+        await asyncio.sleep(0)
+        if "throttled" in params["query"]:
+            raise rate_limited
+        return ok
+
+    throttled, succeeded = [], []
+    original_on_throttle = AIMDLimiter.on_throttle
+    original_on_success = AIMDLimiter.on_success
+
+    def record_throttle(limiter):
+        original_on_throttle(limiter)
+        throttled.append(limiter)
+
+    def record_success(limiter):
+        original_on_success(limiter)
+        succeeded.append(limiter)
+
+    with patch("httpx.AsyncClient.get", side_effect=fake_get), \
+            patch.object(AIMDLimiter, "on_throttle", record_throttle), \
+            patch.object(AIMDLimiter, "on_success", record_success):
+        await asyncio.gather(
+            collector.collect_many(["throttled keyword"]),
+            collector.collect_many(["clean keyword a", "clean keyword b"])
+        )
+
+    # One throttle for the throttled keyword, despite 3 periods x MAX_RETRIES 429s
+    assert len(throttled) == 1
+    assert len(succeeded) == 2
+    assert succeeded[0] is succeeded[1]
+    assert throttled[0] is not succeeded[0]
+
+
+def test_papers_collector_error_response_does_not_share_template_state():
+    """Test that error responses are independent copies of the class-level template"""
+    collector = PapersCollector()
+
+    first = collector._error_response("a", "2025-01-01T00:00:00", "boom", [])
+    first["top_papers"].append({"title": "leak"})
+    first["paper_type_distribution"]["type_counts"]["Review"] = 99
+
+    second = collector._error_response("b", "2025-01-01T00:00:00", "boom", ["earlier"])
+
+    assert second["top_papers"] == []
+    assert second["paper_type_distribution"]["type_counts"]["Review"] == 0
+    assert second["errors"] == ["earlier", "boom"]
+    assert list(second)[:3] == ["source", "collected_at", "keyword"]
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_fetches_periods_concurrently():
+    """Test that the three period requests are in flight at the same time"""
+    import asyncio
+
+    collector = PapersCollector()
+    active = 0
+    peak = 0
+
+    async def slow_get(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Mock(content=orjson.dumps({"total": 1, "data": []}), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get", side_effect=slow_get):
+        result = await collector.collect("test keyword")
+
+    assert peak == 3
+    assert result["publications_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_paces_requests_by_api_key_tier(mock_settings, no_retry_sleep):
+    """Test that keyed requests are paced to 1/s while unkeyed requests use the burst budget"""
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps({"total": 0, "data": []}), raise_for_status=Mock())
+
+        await PapersCollector().collect("unkeyed keyword")
+        assert no_retry_sleep.await_count == 0
+
+        mock_settings.semantic_scholar_api_key = "s2-test-key"
+        await PapersCollector().collect("keyed keyword")
+
+    # One token is available immediately; the next two wait for the 1/s refill
+    delays = [call.args[0] for call in no_retry_sleep.await_args_list]
+    assert len(delays) == 2
+    assert delays[0] == pytest.approx(1.0, abs=0.1)
+    assert delays[1] == pytest.approx(2.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_papers_unkeyed_bucket_admits_at_most_100_requests_in_first_window():
+    """Test that a full unkeyed bucket plus refills stays within 100 requests in the first 5 minutes"""
+    clock = [0.0]
+
+    async def advance(seconds):
+        clock[0] += seconds
+
+    bucket = PapersCollector._rate_buckets["unkeyed"]
+    with patch("app.utils.rate_limit.time.monotonic", side_effect=lambda: clock[0]), \
+         patch("app.utils.rate_limit.asyncio.sleep", side_effect=advance):
+        bucket.reset()
+        admitted = 0
+        while True:
+            await bucket.acquire()
+            if clock[0] > 300:
+                break
+            admitted += 1
+
+    assert 90 <= admitted <= 100
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_collect_many_isolates_failures():
+    """Test that one keyword raising does not cancel the rest of the batch"""
+    collector = PapersCollector()
+
+    async def flaky_collect(keyword, expanded_terms=None, **kwargs):
+        if keyword == "bad":
+            raise RuntimeError("boom")
+        return {"keyword": keyword, "errors": []}
+
+    with patch.object(collector, "collect", side_effect=flaky_collect):
+        results = await collector.collect_many(["good", "bad", "also good"])
+
+    assert [r["keyword"] for r in results] == ["good", "bad", "also good"]
+    assert results[1]["research_maturity"] == "unknown"
+    assert results[1]["errors"] == ["Unexpected error: boom"]
+
+
+def test_papers_collector_classify_growth():
+    """Test momentum and trend labels derived from a single rate comparison"""
+    collector = PapersCollector()
+
+    assert collector._classify_growth(0, 0) == ("steady", "stable")
+    assert collector._classify_growth(4, 0) == ("accelerating", "increasing")
+    assert collector._classify_growth(100, 50) == ("accelerating", "increasing")   # 50/yr vs 10/yr
+    assert collector._classify_growth(26, 100) == ("steady", "decreasing")       # 13/yr vs 20/yr
+    assert collector._classify_growth(10, 200) == ("decelerating", "decreasing")  # 5/yr vs 40/yr
+    assert collector._classify_growth(26, 50) == ("steady", "stable")            # 13/yr vs 10/yr (boundary)
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_normalizes_null_counts_at_ingress():
+    """Test that null or missing citation counts are stored as 0 in the cached response"""
+    collector = PapersCollector()
+    mock_response = {
+        "total": 2,
+        "data": [
+            {"title": "Null counts", "citationCount": None, "influentialCitationCount": None},
+            {"title": "Missing counts"}
+        ]
+    }
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps(mock_response), raise_for_status=Mock())
+        result = await collector.collect("test keyword")
+
+    assert result["avg_citations_2y"] == 0.0
+    assert [p["citations"] for p in result["top_papers"]] == [0, 0]
+
+    cached = next(iter(PapersCollector._response_cache.values()))
+    assert all(p["citationCount"] == 0 and p["influentialCitationCount"] == 0 for p in cached["data"])
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_empty_response_matches_full_derivation():
+    """Test that the zero-data short circuit returns what the classifiers would produce"""
+    collector = PapersCollector()
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps({"total": 0, "data": []}), raise_for_status=Mock())
+        result = await collector.collect("obscure_tech_xyz")
+
+    distribution = collector._calculate_paper_type_distribution(Counter(), 0)
+    maturity, reasoning = collector._calculate_research_maturity(0, 0, 0, 0.0, distribution)
+
+    assert result["paper_type_distribution"] == distribution
+    assert (result["research_maturity"], result["research_maturity_reasoning"]) == (maturity, reasoning)
+    assert (result["research_momentum"], result["research_trend"]) == collector._classify_growth(0, 0)
+    assert result["research_breadth"] == collector._calculate_research_breadth(0, 0, 0)
+    assert result["citation_velocity"] == collector._calculate_citation_velocity(0.0, 0.0)
+    assert result["top_authors"] == [] and result["top_papers"] == []
+    assert result["errors"] == []
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_collect_many_shares_timestamp_and_year_ranges():
+    """Test that collect_many computes the timestamp and period boundaries once per batch"""
+    collector = PapersCollector()
+    seen = []
+
+    async def fake_collect(keyword, expanded_terms=None, **kwargs):
+        seen.append(kwargs)
+        return {"keyword": keyword, "errors": []}
+
+    with patch.object(collector, "collect", side_effect=fake_collect):
+        await collector.collect_many(["a", "b", "c"])
+
+    current_year = datetime.now().year
+    # Only the per-keyword throttle callback differs between calls
+    assert all(
+        (kwargs["collected_at"], kwargs["year_ranges"]) == (seen[0]["collected_at"], seen[0]["year_ranges"])
+        for kwargs in seen
+    )
+    assert seen[0]["year_ranges"] == collector._year_ranges(current_year)
+    assert seen[0]["year_ranges"][0] == (current_year - 2, current_year - 1)
+
+
+@pytest.mark.asyncio
+async def test_papers_collector_collect_uses_given_year_ranges():
+    """Test that collect honours precomputed year ranges and timestamp"""
+    collector = PapersCollector()
+
+    with patch("httpx.AsyncClient.get") as mock_get:
+        mock_get.return_value = Mock(content=orjson.dumps({"total": 1, "data": []}), raise_for_status=Mock())
+        result = await collector.collect(
+            "test keyword",
+            year_ranges=((2020, 2022), (2015, 2019), (2010, 2014)),
+            collected_at="2024-06-01T00:00:00"
+        )
+
+    assert result["collected_at"] == "2024-06-01T00:00:00"
+    years = [call.kwargs["params"]["year"] for call in mock_get.call_args_list]
+    assert years == ["2020-2021", "2015-2018", "2010-2013"]
@@ -3,10 +3,13 @@ Tests for PatentsCollector.
 """
 import pytest
 import json
+import orjson
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
-from app.collectors.patents import PatentsCollector
+from app.collectors.patents import (
+    PatentsCollector, _commercialization_index, _filing_stats, _innovation_stage, _patent_maturity
+)
 
 
 @pytest.fixture(autouse=True)
@@ -23,6 +26,30 @@ def mock_settings(request):
         yield mock_settings_obj
 
 
+@pytest.fixture
+def no_retry_sleep():
+    """Skip retry backoff delays"""
+    with patch("app.collectors.patents.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with empty PatentsView response caches"""
+    PatentsCollector._response_cache.clear()
+    PatentsCollector._stale_responses.clear()
+    yield
+    PatentsCollector._response_cache.clear()
+    PatentsCollector._stale_responses.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_bucket():
+    """Start every test with a full rate-limit bucket so earlier tests do not cause pacing delays"""
+    PatentsCollector._rate_bucket.reset()
+    yield
+
+
 @pytest.mark.asyncio
 async def test_patents_collector_success():
     """Test successful patent data collection"""
@@ -159,11 +186,11 @@ async def test_patents_collector_success():
         ]
     }
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_5y), raise_for_status=Mock()),
-            Mock(json=Mock(return_value=mock_response_10y), raise_for_status=Mock())
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_5y), raise_for_status=Mock()),
+            Mock(content=orjson.dumps(mock_response_10y), raise_for_status=Mock())
         ]
 
         result = await collector.collect("quantum computing")
@@ -207,15 +234,15 @@ async def test_patents_collector_success():
         assert result["errors"] == []
 
         # Verify API was called with correct parameters
-        assert mock_get.call_count == 3
-        for call in mock_get.call_args_list:
+        assert mock_post.call_count == 3
+        for call in mock_post.call_args_list:
             args, kwargs = call
             assert "headers" in kwargs
             assert kwargs["headers"]["X-Api-Key"] == "test_api_key_12345"
 
 
 @pytest.mark.asyncio
-async def test_patents_collector_rate_limit():
+async def test_patents_collector_rate_limit(no_retry_sleep):
     """Test handling of rate limit (429) errors"""
     collector = PatentsCollector()
 
@@ -223,18 +250,12 @@ async def test_patents_collector_rate_limit():
     mock_response.status_code = 429
     mock_response.headers = {"Retry-After": "60"}
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = [
-            Mock(raise_for_status=Mock(side_effect=__import__('httpx').HTTPStatusError(
-                "Rate limited", request=Mock(), response=mock_response
-            ))),
-            Mock(raise_for_status=Mock(side_effect=__import__('httpx').HTTPStatusError(
-                "Rate limited", request=Mock(), response=mock_response
-            ))),
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [
             Mock(raise_for_status=Mock(side_effect=__import__('httpx').HTTPStatusError(
                 "Rate limited", request=Mock(), response=mock_response
             )))
-        ]
+        ] * (3 * PatentsCollector.MAX_RETRIES)
 
         result = await collector.collect("quantum computing")
 
@@ -247,12 +268,12 @@ async def test_patents_collector_rate_limit():
 
 
 @pytest.mark.asyncio
-async def test_patents_collector_timeout():
+async def test_patents_collector_timeout(no_retry_sleep):
     """Test handling of timeout errors"""
     collector = PatentsCollector()
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = __import__('httpx').TimeoutException("Request timeout")
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = __import__('httpx').TimeoutException("Request timeout")
 
         result = await collector.collect("quantum computing")
 
@@ -263,12 +284,12 @@ async def test_patents_collector_timeout():
 
 
 @pytest.mark.asyncio
-async def test_patents_collector_network_error():
+async def test_patents_collector_network_error(no_retry_sleep):
     """Test handling of network errors"""
     collector = PatentsCollector()
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = __import__('httpx').ConnectError("Network error")
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = __import__('httpx').ConnectError("Network error")
 
         result = await collector.collect("quantum computing")
 
@@ -290,9 +311,9 @@ async def test_patents_collector_zero_results():
         "patents": []
     }
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.return_value = Mock(
-            json=Mock(return_value=mock_response),
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = Mock(
+            content=orjson.dumps(mock_response),
             raise_for_status=Mock()
         )
 
@@ -307,7 +328,7 @@ async def test_patents_collector_zero_results():
 
 
 @pytest.mark.asyncio
-async def test_patents_collector_partial_failure():
+async def test_patents_collector_partial_failure(no_retry_sleep):
     """Test handling when some API calls succeed and others fail"""
     collector = PatentsCollector()
 
@@ -327,12 +348,13 @@ async def test_patents_collector_partial_failure():
         ]
     }
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = [
-            Mock(json=Mock(return_value=mock_response_2y), raise_for_status=Mock()),
-            Mock(raise_for_status=Mock(side_effect=__import__('httpx').TimeoutException("Timeout"))),
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [
+            Mock(content=orjson.dumps(mock_response_2y), raise_for_status=Mock()),
             Mock(raise_for_status=Mock(side_effect=__import__('httpx').TimeoutException("Timeout")))
-        ]
+        ] + [
+            Mock(raise_for_status=Mock(side_effect=__import__('httpx').TimeoutException("Timeout")))
+        ] * (2 * PatentsCollector.MAX_RETRIES)
 
         result = await collector.collect("quantum computing")
 
@@ -371,9 +393,9 @@ async def test_patents_collector_missing_fields():
         ]
     }
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.return_value = Mock(
-            json=Mock(return_value=mock_response),
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = Mock(
+            content=orjson.dumps(mock_response),
             raise_for_status=Mock()
         )
 
@@ -388,10 +410,8 @@ async def test_patents_collector_missing_fields():
 @pytest.mark.asyncio
 async def test_filing_velocity_positive():
     """Test filing velocity calculation with accelerating patent rate"""
-    collector = PatentsCollector()
-
     # Recent rate higher than historical
-    velocity = collector._calculate_filing_velocity(patents_2y=100, patents_5y=150)
+    velocity, _, _ = _filing_stats(patents_2y=100, patents_5y=150)
 
     # Recent: 100/2 = 50 per year
     # Historical: 150/5 = 30 per year
@@ -403,10 +423,8 @@ async def test_filing_velocity_positive():
 @pytest.mark.asyncio
 async def test_filing_velocity_negative():
     """Test filing velocity calculation with decelerating patent rate"""
-    collector = PatentsCollector()
-
     # Recent rate lower than historical
-    velocity = collector._calculate_filing_velocity(patents_2y=40, patents_5y=150)
+    velocity, _, _ = _filing_stats(patents_2y=40, patents_5y=150)
 
     # Recent: 40/2 = 20 per year
     # Historical: 150/5 = 30 per year
@@ -485,9 +503,7 @@ async def test_geographic_reach_global():
 @pytest.mark.asyncio
 async def test_patent_maturity_emerging():
     """Test patent maturity with emerging technology"""
-    collector = PatentsCollector()
-
-    maturity = collector._calculate_patent_maturity(total_patents=30, avg_citations_2y=3.0)
+    maturity = _patent_maturity(total_patents=30, avg_citations_2y=3.0)
 
     assert maturity == "emerging"
 
@@ -495,9 +511,7 @@ async def test_patent_maturity_emerging():
 @pytest.mark.asyncio
 async def test_patent_maturity_mature():
     """Test patent maturity with mature technology"""
-    collector = PatentsCollector()
-
-    maturity = collector._calculate_patent_maturity(total_patents=600, avg_citations_2y=10.0)
+    maturity = _patent_maturity(total_patents=600, avg_citations_2y=10.0)
 
     assert maturity == "mature"
 
@@ -505,10 +519,8 @@ async def test_patent_maturity_mature():
 @pytest.mark.asyncio
 async def test_patent_momentum_accelerating():
     """Test patent momentum with accelerating filing rate"""
-    collector = PatentsCollector()
-
     # Recent rate significantly higher than historical
-    momentum = collector._calculate_patent_momentum(patents_2y=100, patents_5y=100)
+    _, momentum, _ = _filing_stats(patents_2y=100, patents_5y=100)
 
     # Recent: 100/2 = 50 per year
     # Historical: 100/5 = 20 per year
@@ -519,10 +531,8 @@ async def test_patent_momentum_accelerating():
 @pytest.mark.asyncio
 async def test_patent_trend_increasing():
     """Test patent trend with increasing filing rate"""
-    collector = PatentsCollector()
-
     # Recent rate moderately higher than historical
-    trend = collector._calculate_patent_trend(patents_2y=80, patents_5y=100)
+    _, _, trend = _filing_stats(patents_2y=80, patents_5y=100)
 
     # Recent: 80/2 = 40 per year
     # Historical: 100/5 = 20 per year
@@ -551,9 +561,9 @@ async def test_json_serialization():
         ]
     }
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.return_value = Mock(
-            json=Mock(return_value=mock_response),
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = Mock(
+            content=orjson.dumps(mock_response),
             raise_for_status=Mock()
         )
 
@@ -576,8 +586,8 @@ async def test_patents_collector_authentication_failure():
     mock_response = Mock()
     mock_response.status_code = 401
 
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = __import__('httpx').HTTPStatusError(
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = __import__('httpx').HTTPStatusError(
             "Authentication failed", request=Mock(), response=mock_response
         )
 
@@ -592,10 +602,9 @@ async def test_patents_collector_authentication_failure():
 @pytest.mark.asyncio
 async def test_patents_collector_missing_api_key(mock_settings):
     """Test handling when API key is missing from settings"""
-    collector = PatentsCollector()
-
-    # Override mock to return None for API key
+    # Override mock to return None for API key (headers are resolved at construction)
     mock_settings.patentsview_api_key = None
+    collector = PatentsCollector()
 
     result = await collector.collect("quantum computing")
 
@@ -647,10 +656,10 @@ async def test_assignee_classification_university():
         ]
     }
 
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response_obj = Mock()
-        mock_response_obj.json.return_value = mock_response
-        mock_get.return_value = mock_response_obj
+        mock_response_obj.content = orjson.dumps(mock_response)
+        mock_post.return_value = mock_response_obj
 
         result = await collector.collect("quantum computing")
 
@@ -705,10 +714,10 @@ async def test_assignee_classification_research_institute():
         ]
     }
 
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response_obj = Mock()
-        mock_response_obj.json.return_value = mock_response
-        mock_get.return_value = mock_response_obj
+        mock_response_obj.content = orjson.dumps(mock_response)
+        mock_post.return_value = mock_response_obj
 
         result = await collector.collect("quantum computing")
 
@@ -771,10 +780,10 @@ async def test_assignee_classification_mixed():
         ]
     }
 
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
         mock_response_obj = Mock()
-        mock_response_obj.json.return_value = mock_response
-        mock_get.return_value = mock_response_obj
+        mock_response_obj.content = orjson.dumps(mock_response)
+        mock_post.return_value = mock_response_obj
 
         result = await collector.collect("quantum computing")
 
@@ -831,7 +840,7 @@ async def test_university_ratio_calculation():
         }
     }
 
-    ratio = collector._calculate_university_ratio(type_distribution)
+    _, ratio, _, _ = collector._extract_type_pcts(type_distribution)
     assert ratio == 45.5
 
 
@@ -850,7 +859,8 @@ async def test_commercialization_index_high():
         }
     }
 
-    index = collector._calculate_commercialization_index(type_distribution)
+    corporate, _, _, academic = collector._extract_type_pcts(type_distribution)
+    index = _commercialization_index(corporate, academic)
     # Corporate 85% / Academic 10% = 8.5
     assert index == 8.5
     assert index > 2.0  # Strong commercial adoption threshold
@@ -871,7 +881,8 @@ async def test_innovation_stage_early():
         }
     }
 
-    stage, reasoning = collector._calculate_innovation_stage(type_distribution, 60.0, 50)
+    corporate, _, _, academic = collector._extract_type_pcts(type_distribution)
+    stage, reasoning = _innovation_stage(corporate, 60.0, academic, 50)
 
     assert stage == "early_research"
     assert "60.0%" in reasoning
@@ -893,7 +904,8 @@ async def test_innovation_stage_commercialized():
         }
     }
 
-    stage, reasoning = collector._calculate_innovation_stage(type_distribution, 5.0, 500)
+    corporate, _, _, academic = collector._extract_type_pcts(type_distribution)
+    stage, reasoning = _innovation_stage(corporate, 5.0, academic, 500)
 
     assert stage == "commercialized"
     assert "85.0%" in reasoning
@@ -988,3 +1000,608 @@ async def test_assignee_classification_real_api_validation():
     print(f"CRISPR commercialization index: {result_early['commercialization_index']:.2f}")
     print(f"Quantum commercialization index: {result_mature['commercialization_index']:.2f}")
     assert result_mature["commercialization_index"] > result_early["commercialization_index"]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_fetches_periods_concurrently():
+    """Test that the three period requests are in flight at the same time"""
+    import asyncio
+
+    collector = PatentsCollector()
+    active = 0
+    peak = 0
+
+    async def slow_post(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Mock(
+            content=orjson.dumps({"error": False, "total_hits": 1, "patents": []}),
+            raise_for_status=Mock()
+        )
+
+    with patch("httpx.AsyncClient.post", side_effect=slow_post):
+        result = await collector.collect("quantum computing")
+
+    assert peak == 3
+    assert result["patents_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_reuses_shared_client():
+    """Test that the shared HTTP client is reused across calls and recreated after close"""
+    from app.utils.http import close_clients
+
+    client_a = await PatentsCollector._http.get()
+    client_b = await PatentsCollector._http.get()
+    assert client_a is client_b
+    assert client_a._transport._pool._max_connections == 32
+    assert client_a._transport._pool._max_keepalive_connections == 16
+
+    await PatentsCollector._http.aclose()
+    assert client_a.is_closed
+
+    client_c = await PatentsCollector._http.get()
+    assert client_c is not client_a
+    await close_clients()
+    assert client_c.is_closed
+
+
+def _period_response(total_hits):
+    """Build a minimal successful PatentsView response mock"""
+    return Mock(
+        content=orjson.dumps({"error": False, "total_hits": total_hits, "patents": []}),
+        raise_for_status=Mock()
+    )
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_caches_period_responses():
+    """Test that repeated collects reuse cached period responses regardless of keyword case"""
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [_period_response(5), _period_response(10), _period_response(20)]
+
+        first = await collector.collect("Quantum Computing")
+        second = await PatentsCollector().collect("quantum computing")
+
+        assert mock_post.call_count == 3
+        assert second["patents_total"] == first["patents_total"] == 35
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_force_refresh_bypasses_cache(no_retry_sleep):
+    """Test that force_refresh refetches and replaces cached responses"""
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [_period_response(1)] * 3 + [_period_response(2)] * 3
+
+        await collector.collect("quantum computing")
+        refreshed = await collector.collect("quantum computing", force_refresh=True)
+        cached = await collector.collect("quantum computing")
+
+        assert mock_post.call_count == 6
+        assert refreshed["patents_total"] == 6
+        assert cached["patents_total"] == 6
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_does_not_cache_failures(no_retry_sleep):
+    """Test that failed period requests are retried on the next collect"""
+    import httpx
+
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = (
+            [httpx.ConnectError("down")] * (3 * PatentsCollector.MAX_RETRIES) + [_period_response(4)] * 3
+        )
+
+        failed = await collector.collect("quantum computing")
+        recovered = await collector.collect("quantum computing")
+
+        assert failed["patents_total"] == 0
+        assert recovered["patents_total"] == 12
+        assert mock_post.call_count == 3 * PatentsCollector.MAX_RETRIES + 3
+
+
+def test_patents_response_ttl_grows_with_window_age():
+    """Test that older period windows are cached longer"""
+    from app.collectors.patents import _response_ttu, _TTL_2Y, _TTL_5Y, _TTL_10Y
+
+    year = datetime.now().year
+    assert _TTL_2Y < _TTL_5Y < _TTL_10Y
+    assert _response_ttu(("ai", (), year - 2, year - 1), {}, 0) == _TTL_2Y
+    assert _response_ttu(("ai", (), year - 7, year - 3), {}, 0) == _TTL_5Y
+    assert _response_ttu(("ai", (), year - 12, year - 8), {}, 0) == _TTL_10Y
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_posts_json_query():
+    """Test that each period is requested as a JSON body POST to the search endpoint"""
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = _period_response(0)
+
+        await collector.collect("quantum computing")
+
+        assert mock_post.call_count == 3
+        for call in mock_post.call_args_list:
+            args, kwargs = call
+            body = orjson.loads(kwargs["content"])
+            assert args[0] == PatentsCollector.API_URL
+            assert kwargs["headers"]["Content-Type"] == "application/json"
+            assert set(body) == {"q", "f", "o"}
+            assert body["o"] == {"size": 1000}
+            assert "patent_id" in body["f"]
+            # Abstracts are searched but never returned
+            assert "patent_abstract" not in body["f"]
+            assert "patent_abstract" in json.dumps(body["q"])
+
+
+def _status_error(status_code, headers=None):
+    """Build a mock response whose raise_for_status raises the given HTTP status"""
+    import httpx
+
+    response = Mock(status_code=status_code, headers=headers or {})
+    return Mock(raise_for_status=Mock(side_effect=httpx.HTTPStatusError(
+        f"HTTP {status_code}", request=Mock(), response=response
+    )))
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_retries_transient_errors(no_retry_sleep):
+    """Test that 429 and 5xx responses are retried and honor Retry-After"""
+    collector = PatentsCollector()
+    errors = []
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [
+            _status_error(429, {"Retry-After": "7"}),
+            _status_error(503),
+            _period_response(42)
+        ]
+
+        data = await collector._fetch_period(await PatentsCollector._http.get(), "quantum computing", 2020, 2021, errors)
+
+    assert data["total_hits"] == 42
+    assert errors == []
+    assert mock_post.call_count == 3
+    delays = [call.args[0] for call in no_retry_sleep.await_args_list]
+    assert delays[0] >= 7
+    assert 2.0 <= delays[1] < 3.0
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_does_not_retry_client_errors(no_retry_sleep):
+    """Test that authentication and query errors fail immediately"""
+    collector = PatentsCollector()
+    errors = []
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [_status_error(401)]
+
+        data = await collector._fetch_period(await PatentsCollector._http.get(), "quantum computing", 2020, 2021, errors)
+
+    assert data is None
+    assert mock_post.call_count == 1
+    assert no_retry_sleep.await_count == 0
+    assert errors == ["Authentication failed - invalid API key"]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_aggregates_periods_in_one_pass():
+    """Test assignee, country, citation and top-patent aggregation across periods"""
+    collector = PatentsCollector()
+
+    def period(patents):
+        return Mock(
+            content=orjson.dumps({"error": False, "total_hits": len(patents), "patents": patents}),
+            raise_for_status=Mock()
+        )
+
+    patents_2y = [
+        {"patent_id": "a", "patent_num_times_cited_by_us_patents": "10",
+         "assignees": [{"assignee_organization": "IBM", "assignee_country": "US"},
+                       {"assignee_organization": "MIT", "assignee_country": "US"}]},
+        {"patent_id": "b", "patent_num_times_cited_by_us_patents": "n/a",
+         "assignees": [{"assignee_organization": "IBM", "assignee_country": "Unknown"}]},
+        {"patent_id": "c", "patent_num_times_cited_by_us_patents": None, "assignees": None},
+    ]
+    patents_5y = [
+        {"patent_id": "d", "patent_num_times_cited_by_us_patents": "30",
+         "assignees": [{"assignee_organization": "Siemens", "assignee_country": "DE"}]},
+    ]
+    patents_10y = [
+        {"patent_id": "e", "patent_num_times_cited_by_us_patents": "50", "assignees": []},
+    ]
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [period(patents_2y), period(patents_5y), period(patents_10y)]
+        result = await collector.collect("quantum computing")
+
+    assert result["errors"] == []
+    assert result["unique_assignees"] == 3
+    assert result["top_assignees"][0] == {"name": "IBM", "patent_count": 2, "type": "Corporate"}
+    assert result["countries"] == {"US": 2, "DE": 1}
+    assert result["avg_citations_2y"] == 5.0  # "n/a" is excluded, None counts as 0
+    assert result["avg_citations_5y"] == 30.0
+    assert [p["patent_number"] for p in result["top_patents"]] == ["e", "d", "a", "b", "c"]
+    assert result["top_patents"][0]["assignee"] == "Individual"
+    assert result["top_patents"][2]["country"] == "US"
+
+
+def test_assignee_concentration_counts_top_three_only():
+    """Test that concentration uses the three largest assignees regardless of input order"""
+    collector = PatentsCollector()
+
+    counts = {"a": 1, "b": 20, "c": 1, "d": 15, "e": 16}
+    # Top 3 = 20 + 16 + 15 = 51 of 100 patents
+    assert collector._calculate_assignee_concentration(counts, 100) == "concentrated"
+    assert collector._calculate_assignee_concentration(counts, 200) == "moderate"
+
+
+def test_normalize_citations_parses_counts_once():
+    """Test that citation counts are converted to int in place, keeping bad values out of averages"""
+    collector = PatentsCollector()
+    patents = [
+        {"patent_num_times_cited_by_us_patents": "12"},
+        {"patent_num_times_cited_by_us_patents": None},
+        {},
+        {"patent_num_times_cited_by_us_patents": "n/a"},
+    ]
+
+    collector._normalize_citations(patents)
+
+    assert [p["patent_num_times_cited_by_us_patents"] for p in patents] == [12, 0, 0, None]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_collect_many_bounded_concurrency():
+    """Test that collect_many preserves order and respects the concurrency limit"""
+    import asyncio
+
+    collector = PatentsCollector()
+    active = 0
+    peak = 0
+
+    async def fake_collect(keyword, expanded_terms=None, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"keyword": keyword}
+
+    with patch.object(collector, "collect", side_effect=fake_collect):
+        keywords = [f"keyword {i}" for i in range(7)]
+        results = await collector.collect_many(keywords, concurrency=3)
+
+    assert [r["keyword"] for r in results] == keywords
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_collect_many_isolates_failures():
+    """Test that one keyword raising does not cancel the rest of the batch"""
+    collector = PatentsCollector()
+
+    async def flaky_collect(keyword, expanded_terms=None, **kwargs):
+        if keyword == "bad":
+            raise RuntimeError("boom")
+        return {"keyword": keyword, "errors": []}
+
+    with patch.object(collector, "collect", side_effect=flaky_collect):
+        results = await collector.collect_many(["good", "bad", "also good"])
+
+    assert [r["keyword"] for r in results] == ["good", "bad", "also good"]
+    assert results[1]["patent_maturity"] == "unknown"
+    assert results[1]["errors"] == ["Unexpected error: boom"]
+
+
+def test_assignee_concentration_reuses_ranked_top_assignees():
+    """Test that a pre-ranked top assignee list gives the same result as ranking the counts"""
+    collector = PatentsCollector()
+
+    counts = {"a": 1, "b": 20, "c": 1, "d": 15, "e": 16}
+    top_assignees = [
+        {"name": "b", "patent_count": 20},
+        {"name": "e", "patent_count": 16},
+        {"name": "d", "patent_count": 15},
+        {"name": "a", "patent_count": 1},
+    ]
+
+    for total in (60, 100, 200, 400):
+        assert collector._calculate_assignee_concentration(counts, total, top_assignees) == \
+            collector._calculate_assignee_concentration(counts, total)
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_empty_response_matches_full_derivation():
+    """Test that the zero-patent short-circuit returns what the classifiers yield on zero data"""
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = _period_response(0)
+        with patch("app.collectors.patents._innovation_stage") as mock_stage:
+            result = await collector.collect("nonexistent technology xyz")
+            mock_stage.assert_not_called()
+
+    distribution = collector._calculate_assignee_type_distribution([])
+    corporate, university_ratio, _, academic = collector._extract_type_pcts(distribution)
+    stage, reasoning = _innovation_stage(corporate, university_ratio, academic, 0)
+
+    assert result["errors"] == []
+    assert result["assignee_type_distribution"] == distribution["type_percentages"]
+    assert result["university_ratio"] == university_ratio
+    assert result["academic_ratio"] == round(academic, 1)
+    assert result["commercialization_index"] == _commercialization_index(corporate, academic)
+    assert (result["innovation_stage"], result["innovation_stage_reasoning"]) == (stage, reasoning)
+    assert (result["filing_velocity"], result["patent_momentum"], result["patent_trend"]) == _filing_stats(0, 0)
+    assert result["assignee_concentration"] == collector._calculate_assignee_concentration({}, 0)
+    assert result["geographic_reach"] == collector._calculate_geographic_reach({})
+    assert result["patent_maturity"] == _patent_maturity(0, 0.0)
+
+
+def test_text_clause_matches_title_or_abstract_for_each_term():
+    """Test the keyword clause with and without expanded terms"""
+    collector = PatentsCollector()
+
+    single = collector._text_clause("qubit")
+    assert single == {"_or": [
+        {"_text_all": {"patent_title": "qubit"}},
+        {"_text_all": {"patent_abstract": "qubit"}}
+    ]}
+
+    # Expanded terms extend the same flat _or instead of nesting one _or per term
+    expanded = collector._text_clause("qubit", ["quantum gate", "ion trap"])
+    assert expanded["_or"][:2] == single["_or"]
+    assert expanded["_or"] == [
+        {"_text_all": {field: term}}
+        for term in ("qubit", "quantum gate", "ion trap")
+        for field in ("patent_title", "patent_abstract")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_skips_duplicate_patents():
+    """Test that a patent returned more than once is only aggregated once"""
+    collector = PatentsCollector()
+
+    patent = {
+        "patent_id": "11123456",
+        "patent_num_times_cited_by_us_patents": "10",
+        "assignees": [{"assignee_organization": "IBM", "assignee_country": "US"}]
+    }
+
+    def period(patents):
+        return Mock(
+            content=orjson.dumps({"error": False, "total_hits": len(patents), "patents": patents}),
+            raise_for_status=Mock()
+        )
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [period([patent, patent]), period([patent]), period([])]
+        result = await collector.collect("quantum computing")
+
+    assert result["top_assignees"] == [{"name": "IBM", "patent_count": 1, "type": "Corporate"}]
+    assert result["countries"] == {"US": 1}
+    assert len(result["top_patents"]) == 1
+    assert result["avg_citations_2y"] == 10.0
+    assert result["avg_citations_5y"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_reports_errors_in_period_order():
+    """Test that period errors are reported 2y/5y/10y even when later periods fail first"""
+    import asyncio
+
+    collector = PatentsCollector()
+
+    async def fetch_period(client, keyword, year_start, year_end, errors, *args):
+        # The 2y period (latest end year) fails last
+        await asyncio.sleep(0.01 if year_end == datetime.now().year - 1 else 0)
+        errors.append(f"failed {year_end}")
+        return None
+
+    with patch.object(collector, "_fetch_period", side_effect=fetch_period):
+        result = await collector.collect("quantum computing")
+
+    year = datetime.now().year
+    assert result["errors"] == [
+        f"failed {year - 1}", f"failed {year - 3}", f"failed {year - 8}", "All API requests failed"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_isolates_period_exceptions():
+    """Test that one period raising does not discard the other periods"""
+    collector = PatentsCollector()
+
+    async def fetch_period(client, keyword, year_start, year_end, errors, *args):
+        if year_end == datetime.now().year - 3:
+            raise RuntimeError("boom")
+        return {"error": False, "total_hits": 2, "patents": []}
+
+    with patch.object(collector, "_fetch_period", side_effect=fetch_period):
+        result = await collector.collect("quantum computing")
+
+    assert result["patents_2y"] == 2
+    assert result["patents_5y"] == 0
+    assert result["patents_10y"] == 2
+    assert result["errors"] == ["Unexpected error in fetch: boom"]
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_serves_stale_data_when_refetch_fails(no_retry_sleep):
+    """Test that an expired cached response is used when the API fails"""
+    import httpx
+
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [_period_response(3)] * 3 + [httpx.ConnectError("down")] * (3 * PatentsCollector.MAX_RETRIES)
+
+        await collector.collect("quantum computing")
+        PatentsCollector._response_cache.clear()  # Simulate TTL expiry
+        result = await collector.collect("quantum computing")
+
+    assert result["patents_total"] == 9
+    assert result["errors"].count("Using stale cached data") == 3
+    assert result["errors"].count("Network error: ConnectError") == 3
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_bounds_fresh_cache_by_keyword_count(no_retry_sleep):
+    """Test that the fresh response cache keeps full pages for at most _CACHED_KEYWORDS keywords"""
+    from app.collectors.patents import _CACHED_KEYWORDS
+
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post", return_value=_period_response(3)) as mock_post:
+        for i in range(_CACHED_KEYWORDS + 1):
+            await collector.collect(f"keyword {i}")
+        assert len(PatentsCollector._response_cache) == 3 * _CACHED_KEYWORDS
+
+        # The oldest keyword was evicted and is fetched again; the newest is served from cache
+        mock_post.reset_mock()
+        await collector.collect(f"keyword {_CACHED_KEYWORDS}")
+        assert mock_post.call_count == 0
+        await collector.collect("keyword 0")
+        assert mock_post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_evicts_stale_data_for_old_keywords(no_retry_sleep):
+    """Test that stale fallbacks are bounded to the most recent keywords and expire after a grace period"""
+    import httpx
+    from app.collectors.patents import _STALE_GRACE, _STALE_KEYWORDS, _response_ttu, _stale_ttu
+
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post", return_value=_period_response(3)):
+        for i in range(_STALE_KEYWORDS + 1):
+            await collector.collect(f"keyword {i}")
+
+    assert len(PatentsCollector._stale_responses) == 3 * _STALE_KEYWORDS
+    PatentsCollector._response_cache.clear()  # Simulate TTL expiry
+
+    with patch("httpx.AsyncClient.post", side_effect=httpx.ConnectError("down")):
+        evicted = await collector.collect("keyword 0")
+        kept = await collector.collect(f"keyword {_STALE_KEYWORDS}")
+
+    assert evicted["patents_total"] == 0
+    assert "Using stale cached data" not in evicted["errors"]
+    assert kept["patents_total"] == 9
+    assert kept["errors"].count("Using stale cached data") == 3
+
+    key = ("keyword 0", (), 2015, 2019)
+    assert _stale_ttu(key, {}, 100.0) == _response_ttu(key, {}, 100.0) + _STALE_GRACE
+
+
+def test_classify_assignee_is_memoized():
+    """Test that repeated organizations are served from the classification cache"""
+    PatentsCollector._classify_assignee.cache_clear()
+    collector = PatentsCollector()
+
+    assert collector._classify_assignee("Stanford University", None) == "University"
+    assert collector._classify_assignee("Stanford University", None) == "University"
+    assert PatentsCollector._classify_assignee("Stanford University", None) == "University"
+
+    info = PatentsCollector._classify_assignee.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_to_int_matches_int_conversion():
+    """Test that the fast citation parser agrees with int() and maps failures to None"""
+    from app.collectors.patents import _to_int
+
+    assert _to_int(5) == 5
+    assert _to_int("12") == 12
+    assert _to_int(None) == 0
+    assert _to_int(" 7") == 7
+    assert _to_int("-3") == -3
+    assert _to_int(2.9) == 2
+    assert _to_int("²") is None
+    assert _to_int("n/a") is None
+    assert _to_int("") is None
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_paces_requests_with_shared_bucket(no_retry_sleep):
+    """Test that requests beyond the shared 45/minute budget wait for a refill"""
+    collector = PatentsCollector()
+    PatentsCollector._rate_bucket.tokens = 1
+
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock,
+               side_effect=[_period_response(1), _period_response(2), _period_response(3)]):
+        await collector.collect("quantum computing")
+
+    # The first request uses the last token; the next two are spaced at the sustained rate
+    delays = [call.args[0] for call in no_retry_sleep.call_args_list]
+    assert len(delays) == 2
+    assert delays[0] == pytest.approx(60 / 42, rel=0.01)
+    assert delays[1] == pytest.approx(2 * 60 / 42, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_patents_rate_bucket_admits_at_most_45_requests_in_first_minute():
+    """Test that a full bucket plus refills stays within 45 requests in the first 60 seconds"""
+    clock = [0.0]
+
+    async def advance(seconds):
+        clock[0] += seconds
+
+    bucket = PatentsCollector._rate_bucket
+    with patch("app.utils.rate_limit.time.monotonic", side_effect=lambda: clock[0]), \
+         patch("app.utils.rate_limit.asyncio.sleep", side_effect=advance):
+        bucket.reset()
+        admitted = 0
+        while True:
+            await bucket.acquire()
+            if clock[0] > 60:
+                break
+            admitted += 1
+
+    assert 40 <= admitted <= 45
+
+
+def test_filing_stats_compute_velocity_momentum_and_trend_together():
+    """Test the fused filing velocity, momentum and trend calculation"""
+    assert _filing_stats(0, 0) == (0.0, "steady", "stable")
+    assert _filing_stats(10, 0) == (1.0, "accelerating", "increasing")
+    assert _filing_stats(100, 100) == (1.5, "accelerating", "increasing")
+    assert _filing_stats(20, 100) == (-0.5, "steady", "decreasing")
+    assert _filing_stats(2, 50) == (pytest.approx(-0.9), "decelerating", "decreasing")
+
+
+def test_extract_type_pcts_returns_shared_percentages():
+    """Test the single lookup of assignee type percentages used by the derived metrics"""
+    collector = PatentsCollector()
+
+    distribution = {"type_percentages": {"Corporate": 55.0, "University": 20.5, "Research Institute": 14.7}}
+    corporate, university, research, academic = collector._extract_type_pcts(distribution)
+
+    assert (corporate, university, research) == (55.0, 20.5, 14.7)
+    assert academic == pytest.approx(35.2)
+    assert collector._extract_type_pcts({}) == (0.0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_patents_collector_caps_huge_retry_after(no_retry_sleep):
+    """Test that a very long Retry-After is capped at MAX_RETRY_DELAY"""
+    collector = PatentsCollector()
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.side_effect = [_status_error(429, {"Retry-After": "3600"}), _period_response(1)]
+
+        data = await collector._fetch_period(await PatentsCollector._http.get(), "quantum computing", 2020, 2021, [])
+
+    assert data["total_hits"] == 1
+    assert no_retry_sleep.await_args.args[0] == PatentsCollector.MAX_RETRY_DELAY
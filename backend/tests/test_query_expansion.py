@@ -6,6 +6,7 @@ and end-to-end expansion workflow.
 """
 import pytest
 import json
+import orjson
 from unittest.mock import AsyncMock, Mock, patch
 from app.analyzers.hype_classifier import HypeCycleClassifier
 from app.analyzers.deepseek import DeepSeekAnalyzer
@@ -184,17 +185,16 @@ class TestCollectorExpansion:
             }
         ]
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_get = AsyncMock(side_effect=[
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1])),
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1])),
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
-                Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1]))
-            ])
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-
+        mock_get = AsyncMock(side_effect=[
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1])),
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1])),
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[0])),
+            Mock(raise_for_status=Mock(), json=Mock(return_value=mock_responses[1]))
+        ])
+        # The collector uses a shared client, so patch its request method
+        with patch('httpx.AsyncClient.get', mock_get):
             result = await collector.collect("keyword", expanded_terms=["term1"])
 
             # Should have aggregated nbHits from both keyword and term1
@@ -214,13 +214,11 @@ class TestCollectorExpansion:
             ]
         }
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_get = AsyncMock(return_value=Mock(
-                raise_for_status=Mock(),
-                json=Mock(return_value=mock_response)
-            ))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-
+        mock_get = AsyncMock(return_value=Mock(
+            raise_for_status=Mock(),
+            content=orjson.dumps(mock_response)
+        ))
+        with patch('httpx.AsyncClient.get', mock_get):
             result = await collector.collect("keyword", expanded_terms=["term1", "term2"])
 
             # Verify OR query was constructed
@@ -0,0 +1,139 @@
+"""
+Unit tests for the rate and concurrency limiters used by collectors.
+Tests cover AIMD limit adjustment, slot accounting, token bucket pacing, and retry backoff.
+"""
+import asyncio
+import pytest
+
+from unittest.mock import AsyncMock, patch
+
+from app.utils.rate_limit import AIMDLimiter, TokenBucket, retry_delay
+
+
+def test_aimd_limiter_additive_increase_capped_at_maximum():
+    """Test that successes raise the limit by one up to the maximum"""
+    limiter = AIMDLimiter(initial=4, maximum=6)
+
+    limiter.on_success()
+    assert limiter.limit == 5
+
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.limit == 6
+
+
+def test_aimd_limiter_multiplicative_decrease_floored_at_minimum():
+    """Test that throttling halves the limit without dropping below the minimum"""
+    limiter = AIMDLimiter(initial=8, maximum=16)
+
+    limiter.on_throttle()
+    assert limiter.limit == 4
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_aimd_limiter_bounds_concurrency():
+    """Test that no more than the current limit of tasks run at once"""
+    limiter = AIMDLimiter(initial=2, maximum=2)
+    active = 0
+    peak = 0
+
+    async def worker():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*[worker() for _ in range(6)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_aimd_limiter_throttle_delays_new_work():
+    """Test that a throttled limiter admits new work only once in-flight work drops below the new limit"""
+    limiter = AIMDLimiter(initial=4, maximum=4)
+
+    for _ in range(4):
+        await limiter.acquire()
+    limiter.on_throttle()  # limit 2 with 4 in flight
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    limiter.release()
+    limiter.release()  # 2 in flight, still at the limit
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces():
+    """Test that a full bucket serves its capacity immediately and then queues callers"""
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    with patch("app.utils.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(5):
+            await bucket.acquire()
+
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(delays) == 2
+    assert delays[0] == pytest.approx(0.5, abs=0.05)
+    assert delays[1] == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_reset_refills():
+    """Test that reset() makes the full burst available again"""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+
+    with patch("app.utils.rate_limit.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await bucket.acquire()
+        await bucket.acquire()
+        bucket.reset()
+        await bucket.acquire()
+
+    assert mock_sleep.await_count == 0
+
+
+def test_retry_delay_backs_off_exponentially_with_jitter():
+    """Test that the backoff doubles per attempt with up to 1s of jitter"""
+    for attempt, base in enumerate([1, 2, 4, 8]):
+        assert base <= retry_delay(attempt, 60.0) < base + 1
+
+
+def test_retry_delay_honors_retry_after_up_to_maximum():
+    """Test that Retry-After extends the delay but never past the maximum"""
+    assert retry_delay(0, 60.0, "5") == 5.0
+    assert retry_delay(0, 60.0, "3600") == 60.0
+    assert retry_delay(10, 10.0) == 10.0
+
+    # HTTP-date values are ignored in favor of the computed backoff
+    assert 1.0 <= retry_delay(0, 60.0, "Wed, 21 Oct 2015 07:28:00 GMT") < 2.0
+
+
+@pytest.mark.asyncio
+async def test_aimd_limiter_cancelled_wakeup_passes_slot_on():
+    """Test that a waiter cancelled after being woken hands its slot to the next waiter"""
+    limiter = AIMDLimiter(initial=1, maximum=1)
+    await limiter.acquire()
+
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Wake the first waiter, then cancel it before it can take the slot
+    limiter.release()
+    first.cancel()
+
+    await asyncio.wait_for(second, timeout=1)
+    assert first.cancelled()
+    assert limiter._in_flight == 1
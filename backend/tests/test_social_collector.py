@@ -11,6 +11,14 @@ import json
 from app.collectors.social import SocialCollector
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty Hacker News response cache"""
+    SocialCollector._response_cache.clear()
+    yield
+    SocialCollector._response_cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_social_collector_success():
     """Test successful data collection with typical API responses"""
@@ -413,3 +421,154 @@ async def test_social_collector_null_created_at_i():
         assert len(result["top_stories"]) == 1
         assert result["top_stories"][0]["title"] == "Story with null timestamp"
         assert result["top_stories"][0]["age_days"] == 0  # Should default to current time
+
+
+@pytest.mark.asyncio
+async def test_social_collector_fetches_periods_concurrently():
+    """Test that the three period requests are in flight at the same time"""
+    import asyncio
+
+    collector = SocialCollector()
+    active = 0
+    peak = 0
+
+    async def slow_get(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Mock(json=Mock(return_value={"hits": [], "nbHits": 1}), raise_for_status=Mock())
+
+    with patch("httpx.AsyncClient.get", side_effect=slow_get):
+        result = await collector.collect("quantum computing")
+
+    assert peak == 3
+    assert result["mentions_total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_social_collector_reports_period_errors_in_order():
+    """Test that concurrent period errors are reported in 30d/6m/1y order"""
+    import asyncio
+
+    collector = SocialCollector()
+
+    async def failing_get(url, params=None, **kwargs):
+        # The 30-day request (no upper bound) fails last
+        if "created_at_i<" not in params["numericFilters"]:
+            await asyncio.sleep(0.01)
+            raise httpx.TimeoutException("timeout")
+        raise httpx.HTTPStatusError("boom", request=Mock(), response=Mock(status_code=503))
+
+    with patch("httpx.AsyncClient.get", side_effect=failing_get):
+        result = await collector.collect("quantum computing")
+
+    assert result["errors"][:3] == ["Request timeout", "HTTP 503", "HTTP 503"]
+
+
+@pytest.mark.asyncio
+async def test_social_collector_reuses_shared_client():
+    """Test that the shared HTTP client is reused across calls and recreated after close"""
+    from app.utils.http import close_clients
+
+    client_a = await SocialCollector._http.get()
+    client_b = await SocialCollector._http.get()
+    assert client_a is client_b
+
+    await SocialCollector._http.aclose()
+    assert client_a.is_closed
+
+    client_c = await SocialCollector._http.get()
+    assert client_c is not client_a
+    await close_clients()
+    assert client_c.is_closed
+
+
+@pytest.mark.asyncio
+async def test_social_collector_caches_period_responses():
+    """Test that repeated collects within the hour reuse cached period responses"""
+    collector = SocialCollector()
+
+    mock_get = AsyncMock(side_effect=[
+        Mock(json=Mock(return_value={"hits": [], "nbHits": n}), raise_for_status=Mock())
+        for n in (5, 10, 20)
+    ])
+    with patch("httpx.AsyncClient.get", mock_get):
+        first = await collector.collect("Quantum Computing")
+        second = await collector.collect("quantum computing")
+
+    assert mock_get.call_count == 3
+    assert second["mentions_total"] == first["mentions_total"] == 35
+
+
+@pytest.mark.asyncio
+async def test_social_collector_does_not_cache_failed_periods():
+    """Test that a failed period is requested again on the next collect"""
+    collector = SocialCollector()
+
+    ok = Mock(json=Mock(return_value={"hits": [], "nbHits": 1}), raise_for_status=Mock())
+    mock_get = AsyncMock(side_effect=[
+        httpx.TimeoutException("timeout"), ok, ok,
+        ok
+    ])
+    with patch("httpx.AsyncClient.get", mock_get):
+        first = await collector.collect("quantum computing")
+        second = await collector.collect("quantum computing")
+
+    assert first["errors"] == ["Request timeout"]
+    assert second["errors"] == []
+    assert mock_get.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_social_collector_does_not_cache_periods_with_failed_terms():
+    """Test that an undercounted aggregate (one expanded term failed) is refetched next time"""
+    collector = SocialCollector()
+
+    async def fake_get(url, params=None):
+        if params["query"] == "t1" and fake_get.fail_t1:
+            raise httpx.TimeoutException("timeout")
+        return Mock(json=Mock(return_value={"hits": [], "nbHits": 10}), raise_for_status=Mock())
+
+    fake_get.fail_t1 = True
+    with patch("httpx.AsyncClient.get", side_effect=fake_get):
+        first = await collector.collect("k", expanded_terms=["t1"])
+        fake_get.fail_t1 = False
+        second = await collector.collect("k", expanded_terms=["t1"])
+        third = await collector.collect("k", expanded_terms=["t1"])
+
+    assert first["mentions_total"] == 30
+    assert first["errors"].count("Term 't1' failed: timeout") == 3
+    assert second["mentions_total"] == 60
+    assert second["errors"] == []
+    assert third == {**second, "collected_at": third["collected_at"]}
+
+
+@pytest.mark.asyncio
+async def test_social_collector_requests_only_counts_for_1y_window():
+    """Test that the 1-year window asks for nbHits only, not stories"""
+    collector = SocialCollector()
+
+    mock_get = AsyncMock(return_value=Mock(
+        json=Mock(return_value={"hits": [], "nbHits": 1}), raise_for_status=Mock()
+    ))
+    with patch("httpx.AsyncClient.get", mock_get):
+        await collector.collect("quantum computing")
+
+    pages = sorted(call.kwargs["params"]["hitsPerPage"] for call in mock_get.call_args_list)
+    assert pages == [0, SocialCollector.HITS_PER_PAGE, SocialCollector.HITS_PER_PAGE]
+
+
+def test_calculate_engagement_averages_points_and_comments():
+    """Test per-story engagement averages, treating missing or null values as 0"""
+    collector = SocialCollector()
+
+    hits = [
+        {"points": 100, "num_comments": 40},
+        {"points": None, "num_comments": 20},
+        {}
+    ]
+
+    assert collector._calculate_engagement(hits) == (100 / 3, 20.0)
+    assert collector._calculate_engagement([]) == (0.0, 0.0)